@@ -1,3 +1,4 @@
+import os
 
 # For compatibilty
 from ignite.utils import convert_tensor, apply_to_tensor, apply_to_type, to_onehot
@@ -8,3 +9,15 @@ def _to_hours_mins_secs(time_taken):
     mins, secs = divmod(time_taken, 60)
     hours, mins = divmod(mins, 60)
     return hours, mins, secs
+
+
+def _replace(src, dst):
+    # Renames `src` to `dst`, atomically replacing `dst` if it exists
+    if hasattr(os, "replace"):
+        os.replace(src, dst)
+    elif os.name == "nt" and os.path.exists(dst):
+        # Python 2 on Windows can not rename over an existing file
+        os.remove(dst)
+        os.rename(src, dst)
+    else:
+        os.rename(src, dst)
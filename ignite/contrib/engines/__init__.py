@@ -1,2 +1,8 @@
+import sys
+
 from ignite.contrib.engines.tbptt import create_supervised_tbptt_trainer
 from ignite.contrib.engines.tbptt import Tbptt_Events
+from ignite.contrib.engines.frozen_backbone import create_frozen_backbone_trainer
+
+if sys.version_info >= (3, 5):
+    from ignite.contrib.engines.async_engine import AsyncEngine
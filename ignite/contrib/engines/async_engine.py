@@ -0,0 +1,190 @@
+import asyncio
+import collections
+import inspect
+import time
+
+from ignite._utils import _to_hours_mins_secs
+from ignite.engine import Engine, Events
+
+
+class AsyncEngine(Engine):
+    """Engine which runs `async def` process functions concurrently on batches with `asyncio`.
+
+    Up to `max_in_flight` batches are processed at the same time, which is useful when the process function
+    awaits I/O, e.g. requests to a model server or to a feature store. Handlers can be regular functions or
+    `async def` functions, the latter are awaited.
+
+    Events are fired as follows: `Events.ITERATION_STARTED` is fired when a batch is submitted, with
+    `engine.state.iteration` and `engine.state.batch` of the submitted batch. `Events.ITERATION_COMPLETED` is
+    fired when the processing of a batch is completed, with `engine.state.iteration`, `engine.state.batch` and
+    `engine.state.output` of the completed batch, such that metrics can be attached as with
+    :class:`~ignite.engine.Engine`. By default, batches are completed in submission order. All the batches of an
+    epoch are completed before `Events.EPOCH_COMPLETED` is fired.
+
+    Args:
+        process_function (callable): A function or an `async def` function receiving a handle to the engine and
+            the current batch in each iteration, and returns data to be stored in the engine's state.
+        max_in_flight (int, optional): maximum number of batches processed concurrently. Default, 4.
+        ordered (bool, optional): if True, `Events.ITERATION_COMPLETED` is fired in submission order. Otherwise, it
+            is fired as soon as the processing of a batch is completed. Default, True.
+
+    Examples:
+
+    .. code-block:: python
+
+        async def infer(engine, batch):
+            x, y = batch
+            y_pred = await client.predict(x)
+            return y_pred, y
+
+        evaluator = AsyncEngine(infer, max_in_flight=8)
+        Accuracy().attach(evaluator, "accuracy")
+        state = evaluator.run(data)
+
+        # or, from a coroutine running in an event loop
+        state = await evaluator.arun(data)
+
+    Note:
+        As several batches are processed at the same time, `engine.state.iteration`, `engine.state.batch` and
+        `engine.state.output` should not be read inside the process function: the batch is passed as argument and
+        the output should be returned.
+
+    Note:
+        This engine requires Python 3.5 or higher.
+    """
+
+    def __init__(self, process_function, max_in_flight=4, ordered=True):
+        if not (isinstance(max_in_flight, int) and max_in_flight > 0):
+            raise ValueError("Argument max_in_flight should be a positive integer, but given {}"
+                             .format(max_in_flight))
+        super(AsyncEngine, self).__init__(process_function)
+        self.max_in_flight = max_in_flight
+        self.ordered = ordered
+        self._n_submitted = 0
+
+    async def _afire_event(self, event_name, *event_args, **event_kwargs):
+        if event_name in self._allowed_events:
+            self._logger.debug("firing handlers for event %s ", event_name)
+            for func, args, kwargs in self._event_handlers[event_name]:
+                kwargs.update(event_kwargs)
+                result = func(self, *(event_args + args), **kwargs)
+                if inspect.isawaitable(result):
+                    await result
+
+    async def _aprocess(self, batch):
+        output = self._process_function(self, batch)
+        if inspect.isawaitable(output):
+            output = await output
+        return output
+
+    async def _complete_one(self, pending):
+        if self.ordered:
+            iteration, batch, task = pending.popleft()
+            await asyncio.wait([task])
+        else:
+            await asyncio.wait([task for _, _, task in pending], return_when=asyncio.FIRST_COMPLETED)
+            index = next(i for i, (_, _, task) in enumerate(pending) if task.done())
+            iteration, batch, task = pending[index]
+            del pending[index]
+
+        self.state.iteration = iteration
+        self.state.batch = batch
+        self.state.output = task.result()
+        await self._afire_event(Events.ITERATION_COMPLETED)
+
+    async def _arun_once_on_dataset(self):
+        start_time = time.time()
+        pending = collections.deque()
+
+        try:
+            for batch in self._epoch_batches():
+                self._n_submitted += 1
+                self.state.iteration = self._n_submitted
+                self.state.batch = batch
+                await self._afire_event(Events.ITERATION_STARTED)
+                pending.append((self._n_submitted, batch, asyncio.ensure_future(self._aprocess(batch))))
+
+                if len(pending) >= self.max_in_flight:
+                    await self._complete_one(pending)
+                if self.should_terminate or self.should_terminate_single_epoch:
+                    break
+
+            while len(pending) > 0:
+                await self._complete_one(pending)
+            self.should_terminate_single_epoch = False
+            self.state.iteration = self._n_submitted
+
+        except BaseException as e:
+            for _, _, task in pending:
+                task.cancel()
+            self._logger.error("Current run is terminating due to exception: %s.", str(e))
+            await self._ahandle_exception(e)
+
+        time_taken = time.time() - start_time
+        hours, mins, secs = _to_hours_mins_secs(time_taken)
+
+        return hours, mins, secs
+
+    async def _ahandle_exception(self, e):
+        if Events.EXCEPTION_RAISED in self._event_handlers:
+            await self._afire_event(Events.EXCEPTION_RAISED, e)
+        else:
+            raise e
+
+    async def arun(self, data, max_epochs=1, epoch_length=None, persistent_iterator=False):
+        """Coroutine which runs the process_function over the passed data. Arguments are the same as for
+        :meth:`~ignite.contrib.engines.AsyncEngine.run`.
+
+        Returns:
+            State: output state.
+        """
+        self._setup_run(data, max_epochs, epoch_length, persistent_iterator)
+        self._n_submitted = 0
+
+        try:
+            self._logger.info("Engine run starting with max_epochs={}.".format(max_epochs))
+            start_time = time.time()
+            await self._afire_event(Events.STARTED)
+            while self.state.epoch < max_epochs and not self.should_terminate:
+                self.state.epoch += 1
+                await self._afire_event(Events.EPOCH_STARTED)
+                hours, mins, secs = await self._arun_once_on_dataset()
+                self._logger.info("Epoch[%s] Complete. Time taken: %02d:%02d:%02d", self.state.epoch, hours, mins, secs)
+                if self.should_terminate:
+                    break
+                await self._afire_event(Events.EPOCH_COMPLETED)
+
+            await self._afire_event(Events.COMPLETED)
+            time_taken = time.time() - start_time
+            hours, mins, secs = _to_hours_mins_secs(time_taken)
+            self._logger.info("Engine run complete. Time taken %02d:%02d:%02d" % (hours, mins, secs))
+
+        except BaseException as e:
+            self._logger.error("Engine run is terminating due to exception: %s.", str(e))
+            await self._ahandle_exception(e)
+        finally:
+            self._dataloader_iter = None
+
+        return self.state
+
+    def run(self, data, max_epochs=1, epoch_length=None, persistent_iterator=False):
+        """Runs the process_function over the passed data in a new event loop.
+
+        Use :meth:`~ignite.contrib.engines.AsyncEngine.arun` to run the engine from a coroutine.
+
+        Args:
+            data (Iterable): Collection of batches allowing repeated iteration (e.g., list or `DataLoader`).
+            max_epochs (int, optional): max epochs to run for (default: 1).
+            epoch_length (int, optional): number of iterations to count as one epoch
+                (see :meth:`~ignite.engine.Engine.run`).
+            persistent_iterator (bool, optional): if True, a single iterator over `data` is kept for the whole run
+                (see :meth:`~ignite.engine.Engine.run`).
+
+        Returns:
+            State: output state.
+        """
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(self.arun(data, max_epochs, epoch_length, persistent_iterator))
+        finally:
+            loop.close()
@@ -0,0 +1,274 @@
+import collections
+import os
+import shutil
+import tempfile
+
+import torch
+from torch.utils.data import BatchSampler, DataLoader
+
+from ignite.engine import Engine, Events, _prepare_batch, _get_prepare_batch_fn
+from ignite.engine.engine import _with_batch_sampler
+
+
+class _RecordingSampler(object):
+    # Records the indices yielded by a sampler as sampled in the feature store
+
+    def __init__(self, sampler, store):
+        self.sampler = sampler
+        self.store = store
+
+    def __iter__(self):
+        for index in self.sampler:
+            self.store.sampled[index] = True
+            yield index
+        self.store.all_sampled = True
+
+    def __len__(self):
+        return len(self.sampler)
+
+
+class _RecordingBatchSampler(object):
+    # Records the indices of the batches in the order they are sampled and, if `store` is provided, as sampled in
+    # the feature store
+
+    def __init__(self, batch_sampler, indices, store=None):
+        self.batch_sampler = batch_sampler
+        self.indices = indices
+        self.store = store
+
+    def __iter__(self):
+        for batch_indices in self.batch_sampler:
+            self.indices.append(list(batch_indices))
+            if self.store is not None:
+                self.store.sampled[list(batch_indices)] = True
+            yield batch_indices
+        if self.store is not None:
+            self.store.all_sampled = True
+
+    def __len__(self):
+        return len(self.batch_sampler)
+
+
+class _BatchIndexSampler(object):
+    # Yields the indices of each batch as a single sample
+
+    def __init__(self, batch_sampler):
+        self.batch_sampler = batch_sampler
+
+    def __iter__(self):
+        for batch_indices in self.batch_sampler:
+            yield list(batch_indices)
+
+    def __len__(self):
+        return len(self.batch_sampler)
+
+
+class _FeatureStore(object):
+    # Memory-mapped features and targets of the samples of a dataset, indexed by sample index. The store is complete
+    # when the sampler was iterated to its end and the features of all the sampled samples are stored.
+
+    def __init__(self, dirname, num_samples):
+        self.dirname = dirname
+        self.num_samples = num_samples
+        self.features = None
+        self.targets = None
+        self.filled = torch.zeros(num_samples, dtype=torch.bool)
+        self.sampled = torch.zeros(num_samples, dtype=torch.bool)
+        self.all_sampled = False
+
+    def _create(self, name, value):
+        import numpy as np
+
+        value = value.numpy()
+        return np.lib.format.open_memmap(os.path.join(self.dirname, "{}.npy".format(name)), mode="w+",
+                                         dtype=value.dtype, shape=(self.num_samples, ) + value.shape[1:])
+
+    def put(self, indices, features, targets):
+        features = features.detach().to("cpu")
+        targets = targets.detach().to("cpu")
+        if self.features is None:
+            self.features = self._create("features", features)
+            self.targets = self._create("targets", targets)
+        self.features[indices] = features.numpy()
+        self.targets[indices] = targets.numpy()
+        self.filled[indices] = True
+
+    @property
+    def missing_indices(self):
+        return torch.nonzero(self.sampled & ~self.filled).view(-1).tolist()
+
+    @property
+    def complete(self):
+        return self.all_sampled and len(self.missing_indices) == 0
+
+    def __getitem__(self, indices):
+        if not bool(self.filled[indices].all()):
+            raise RuntimeError("Features of samples {} are not stored: the sampler should yield the same samples in "
+                               "each epoch".format(indices))
+        return torch.from_numpy(self.features[indices]), torch.from_numpy(self.targets[indices])
+
+    def __len__(self):
+        return self.num_samples
+
+
+class _FrozenBackboneEngine(Engine):
+    # Engine calling `cleanup(engine)` when the run completes or raises an exception
+
+    def __init__(self, process_function, cleanup):
+        super(_FrozenBackboneEngine, self).__init__(process_function)
+        self._cleanup = cleanup
+
+    def run(self, data, max_epochs=1, epoch_length=None, persistent_iterator=False):
+        try:
+            return super(_FrozenBackboneEngine, self).run(data, max_epochs, epoch_length, persistent_iterator)
+        finally:
+            self._cleanup(self)
+
+
+def create_frozen_backbone_trainer(backbone, head, optimizer, loss_fn, dirname=None,
+                                   device=None, non_blocking=False,
+                                   prepare_batch=_prepare_batch,
+                                   output_transform=lambda x, y, y_pred, loss: loss.item()):
+    """Factory function for creating a trainer of a head on top of a frozen backbone, e.g. for fine-tuning.
+
+    The model is `head(backbone(x))` and only `head` is trained. During the first epoch, the features computed by
+    `backbone` and the targets of the samples are stored in memory-mapped files, indexed by the samples' indices in
+    the dataset. Once the features of all the samples yielded by the sampler during the first epoch are stored, the
+    following epochs iterate over the stored features instead of the data, with the same batch sampler: neither the
+    data is loaded nor the backbone is run. The sampler should then yield the same samples in each epoch, e.g. a
+    random permutation of the dataset or of a subset of it. If the `DataLoader` drops the last incomplete batch
+    (`drop_last=True`), the features of the samples dropped during the first epoch are computed at the end of this
+    epoch.
+
+    The trainer should be run on a `torch.utils.data.DataLoader` over a map-style dataset. As features are
+    computed once per sample, the samples and the backbone should be deterministic, e.g. without random data
+    augmentation. The backbone is put in evaluation mode and is run without gradients.
+
+    Args:
+        backbone (`torch.nn.Module`): the frozen module which computes the features of the samples.
+        head (`torch.nn.Module`): the module to train on the features.
+        optimizer (`torch.optim.Optimizer`): the optimizer of the parameters of `head`.
+        loss_fn (torch.nn loss function): the loss function to use.
+        dirname (str, optional): directory of the memory-mapped feature files. By default, a temporary directory is
+            created and is removed when the run completes or raises an exception.
+        device (str, optional): device type specification (default: None).
+            Applies to both modules and batches.
+        non_blocking (bool, optional): if True and this copy is between CPU and GPU, the copy may occur asynchronously
+            with respect to the host. For other cases, this argument has no effect.
+        prepare_batch (callable, optional): function that receives `batch`, `device`, `non_blocking` and outputs
+            tuple of tensors `(batch_x, batch_y)`. It is applied to the batches of the data, whereas stored features
+            and targets are moved to `device` with the default preparation.
+        output_transform (callable, optional): function that receives 'x', 'y', 'y_pred', 'loss' and returns value
+            to be assigned to engine's state.output after each iteration, where 'x' are the features. Default is
+            returning `loss.item()`.
+
+    Returns:
+        Engine: a trainer engine. `engine.state.feature_store_complete` is True when the features of all sampled
+        samples are stored.
+
+    Examples:
+
+    .. code-block:: python
+
+        backbone = torchvision.models.resnet18(pretrained=True)
+        backbone.fc = nn.Identity()
+        head = nn.Linear(512, num_classes)
+        optimizer = SGD(head.parameters(), lr=0.01)
+
+        trainer = create_frozen_backbone_trainer(backbone, head, optimizer, nn.CrossEntropyLoss())
+        trainer.run(train_loader, max_epochs=20)
+    """
+    if device:
+        backbone.to(device)
+        head.to(device)
+
+    pending_indices = collections.deque()
+    store_dir = {}
+    prepare_data = _get_prepare_batch_fn(prepare_batch, device, non_blocking)
+    prepare_features = _get_prepare_batch_fn(_prepare_batch, device, non_blocking)
+
+    def _store_features(store, indices, batch):
+        x, y = prepare_data(batch)
+        with torch.no_grad():
+            x = backbone(x)
+        store.put(indices, x, y)
+        return x, y
+
+    def _update(engine, batch):
+        if engine.state.feature_store_complete:
+            x, y = prepare_features(batch)
+        else:
+            x, y = _store_features(engine.state.feature_store, pending_indices.popleft(), batch)
+
+        head.train()
+        optimizer.zero_grad()
+        y_pred = head(x)
+        loss = loss_fn(y_pred, y)
+        loss.backward()
+        optimizer.step()
+        return output_transform(x, y, y_pred, loss)
+
+    def _cleanup(engine):
+        if engine.state is None:
+            return
+        engine.state.feature_store = engine.state.data_loader = engine.state.feature_loader = None
+        if dirname is None and "path" in store_dir:
+            shutil.rmtree(store_dir.pop("path"), ignore_errors=True)
+
+    engine = _FrozenBackboneEngine(_update, _cleanup)
+
+    @engine.on(Events.STARTED)
+    def _setup(engine):
+        data = engine.state.dataloader
+        if not isinstance(data, DataLoader) or data.batch_sampler is None or not hasattr(data.sampler, "__len__"):
+            raise TypeError("Trainer with a frozen backbone should be run on a DataLoader over a map-style dataset, "
+                            "but given {}".format(type(data)))
+        if engine._dataloader_iter is not None:
+            raise ValueError("Trainer with a frozen backbone can not be run with epoch_length or persistent_iterator")
+
+        backbone.eval()
+        store_dir["path"] = dirname if dirname is not None else tempfile.mkdtemp()
+        if not os.path.exists(store_dir["path"]):
+            os.makedirs(store_dir["path"])
+
+        pending_indices.clear()
+        store = _FeatureStore(store_dir["path"], len(data.dataset))
+        engine.state.feature_store = store
+        engine.state.feature_store_complete = False
+        if type(data.batch_sampler) is BatchSampler:
+            # Indices of the samples of an incomplete last batch dropped with `drop_last` are also recorded
+            batch_sampler = BatchSampler(_RecordingSampler(data.batch_sampler.sampler, store),
+                                         data.batch_sampler.batch_size, data.batch_sampler.drop_last)
+            batch_sampler = _RecordingBatchSampler(batch_sampler, pending_indices)
+        else:
+            batch_sampler = _RecordingBatchSampler(data.batch_sampler, pending_indices, store)
+        engine.state.data_loader = _with_batch_sampler(data, batch_sampler)
+        engine.state.feature_loader = DataLoader(engine.state.feature_store,
+                                                 sampler=_BatchIndexSampler(data.batch_sampler),
+                                                 batch_size=None, pin_memory=data.pin_memory)
+
+    @engine.on(Events.EPOCH_STARTED)
+    def _select_data(engine):
+        # Worker processes may have sampled indices of batches which were not processed
+        pending_indices.clear()
+        engine.state.feature_store_complete = engine.state.feature_store.complete
+        if engine.state.feature_store_complete:
+            engine.state.dataloader = engine.state.feature_loader
+        else:
+            engine.state.dataloader = engine.state.data_loader
+
+    @engine.on(Events.EPOCH_COMPLETED)
+    def _store_missing_samples(engine):
+        store = engine.state.feature_store
+        if store.all_sampled and not store.complete:
+            # Samples of the last incomplete batch dropped with `drop_last` are never iterated, their features are
+            # computed from the dataset without the DataLoader, such that the random state is unchanged
+            data = engine.state.data_loader
+            batch_size = getattr(data.batch_sampler.batch_sampler, "batch_size", None) or 1
+            missing_indices = store.missing_indices
+            for i in range(0, len(missing_indices), batch_size):
+                indices = missing_indices[i:i + batch_size]
+                _store_features(store, indices, data.collate_fn([data.dataset[j] for j in indices]))
+        engine.state.feature_store_complete = store.complete
+
+    return engine
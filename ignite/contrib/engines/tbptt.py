@@ -5,7 +5,7 @@ from enum import Enum
 import torch
 
 from ignite.utils import apply_to_tensor
-from ignite.engine import Engine, _prepare_batch
+from ignite.engine import Engine, _prepare_batch, _get_prepare_batch_fn
 
 
 class Tbptt_Events(Enum):
@@ -64,22 +64,31 @@ def create_supervised_tbptt_trainer(
             the copy may occur asynchronously with respect to the host. For other cases,
             this argument has no effect.
         prepare_batch (callable, optional): function that receives `batch`, `device`,
-            `non_blocking` and outputs tuple of tensors `(batch_x, batch_y)`.
+            `non_blocking` and outputs tuple of tensors `(batch_x, batch_y)`. It is applied once to the whole
+            sequences before they are split into time chunks.
 
     Returns:
         Engine: a trainer engine with supervised update function.
 
+    Note:
+        `engine.state.output` is the loss of the time chunk as a 0d tensor on `Tbptt_Events` and the average loss
+        over the time chunks as a float on `Events.ITERATION_COMPLETED`. Chunk losses are accumulated on the
+        device and are read back once per iteration.
+
     """
     if device:
         model.to(device)
 
+    prepare_batch_fn = _get_prepare_batch_fn(prepare_batch, device, non_blocking)
+
     def _update(engine, batch):
-        loss_list = []
+        loss_sum = None
+        n_chunks = 0
         hidden = None
 
-        x, y = batch
-        for batch_t in zip(x.split(tbtt_step, dim=dim), y.split(tbtt_step, dim=dim)):
-            x_t, y_t = prepare_batch(batch_t, device=device, non_blocking=non_blocking)
+        # Sequences are moved to the device once, time chunks are views of them
+        x, y = prepare_batch_fn(batch)
+        for x_t, y_t in zip(x.split(tbtt_step, dim=dim), y.split(tbtt_step, dim=dim)):
             # Fire event for start of iteration
             engine.fire_event(Tbptt_Events.TIME_ITERATION_STARTED)
             # Forward, backward and
@@ -95,14 +104,16 @@ def create_supervised_tbptt_trainer(
             optimizer.step()
 
             # Setting state of engine for consistent behaviour
-            engine.state.output = loss_t.item()
-            loss_list.append(loss_t.item())
+            loss_t = loss_t.detach()
+            engine.state.output = loss_t
+            loss_sum = loss_t if loss_sum is None else loss_sum + loss_t
+            n_chunks += 1
 
             # Fire event for end of iteration
             engine.fire_event(Tbptt_Events.TIME_ITERATION_COMPLETED)
 
         # return average loss over the time splits
-        return sum(loss_list) / len(loss_list)
+        return loss_sum.item() / n_chunks
 
     engine = Engine(_update)
     engine.register_events(*Tbptt_Events)
@@ -1,5 +1,6 @@
 from abc import ABCMeta, abstractmethod
 import numbers
+import threading
 import warnings
 
 import torch
@@ -38,6 +39,84 @@ class BaseLogger(object):
         pass
 
 
+class _BackgroundFlusher(object):
+    """Helper to accumulate records in memory and hand them over in batches to `flush_fn` from a background thread.
+
+    A batch is flushed when `buffer_size` records are pending or every `flush_secs` seconds, whichever comes first.
+    Batches are flushed in the order records were put. An exception raised by `flush_fn` in the background thread is
+    re-raised on the next call to :meth:`flush` or :meth:`close`.
+
+    Args:
+        flush_fn (callable): function taking a list of records.
+        buffer_size (int, optional): number of pending records that triggers a flush.
+        flush_secs (float, optional): maximum time in seconds between two flushes.
+    """
+
+    def __init__(self, flush_fn, buffer_size=1000, flush_secs=1.0):
+        if buffer_size < 1:
+            raise ValueError("Argument buffer_size should be positive, but given {}".format(buffer_size))
+
+        self._flush_fn = flush_fn
+        self._buffer_size = buffer_size
+        self._flush_secs = flush_secs
+        self._buffer = []
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._error = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def put(self, record):
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Can not put a record into a closed buffer")
+            self._buffer.append(record)
+            if len(self._buffer) >= self._buffer_size:
+                self._cond.notify()
+
+    def _flush_pending(self):
+        with self._flush_lock:
+            with self._cond:
+                records, self._buffer = self._buffer, []
+            if len(records) > 0:
+                try:
+                    self._flush_fn(records)
+                except Exception as e:
+                    self._error = e
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._closed and len(self._buffer) < self._buffer_size:
+                    self._cond.wait(self._flush_secs)
+                closed = self._closed
+            self._flush_pending()
+            if closed:
+                break
+
+    def _raise_error(self):
+        if self._error is not None:
+            e, self._error = self._error, None
+            raise e
+
+    def flush(self):
+        """Synchronously flush all pending records."""
+        self._flush_pending()
+        self._raise_error()
+
+    def close(self):
+        """Flush all pending records and stop the background thread."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        self._raise_error()
+
+
 class BaseHandler(with_metaclass(ABCMeta, object)):
 
     @abstractmethod
@@ -168,6 +247,34 @@ class BaseWeightsScalarHandler(BaseHandler):
         self.reduction = reduction
         self.tag = tag
 
+    def _reduce(self, tensors):
+        """Helper method to reduce each tensor of the list into a scalar.
+
+        With the default `torch.norm` reduction, norms of all dense tensors of the same device and dtype are
+        computed together and moved to CPU with a single transfer. Other reductions and tensors of other layouts,
+        e.g. sparse gradients, are reduced tensor by tensor.
+        """
+        if self.reduction is not torch.norm:
+            return [self.reduction(t) for t in tensors]
+
+        output = [None] * len(tensors)
+        groups = {}
+        for i, t in enumerate(tensors):
+            if t.layout == torch.strided:
+                groups.setdefault((t.device, t.dtype), []).append(i)
+            else:
+                output[i] = torch.norm(t).cpu()
+
+        for indices in groups.values():
+            group = [tensors[i] for i in indices]
+            if hasattr(torch, "_foreach_norm"):
+                norms = torch._foreach_norm(group)
+            else:
+                norms = [torch.norm(t) for t in group]
+            for i, v in zip(indices, torch.stack(norms).cpu().unbind(0)):
+                output[i] = v
+        return output
+
 
 class BaseWeightsHistHandler(BaseHandler):
     """
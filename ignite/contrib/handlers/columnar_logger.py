@@ -0,0 +1,344 @@
+import array
+import json
+import numbers
+import os
+import tempfile
+import time
+
+import warnings
+import torch
+
+from ignite._utils import _replace
+from ignite.contrib.handlers.base_logger import BaseLogger, BaseOptimizerParamsHandler, BaseOutputHandler, \
+    global_step_from_engine
+
+
+__all__ = ['ColumnarLogger', 'OutputHandler', 'OptimizerParamsHandler', 'load_run', 'global_step_from_engine']
+
+
+class OutputHandler(BaseOutputHandler):
+    """Helper handler to log engine's output and/or metrics
+
+    Examples:
+
+        .. code-block:: python
+
+            from ignite.contrib.handlers.columnar_logger import *
+
+            # Create a logger
+            col_logger = ColumnarLogger(dirname="experiments/run_0")
+
+            # Attach the logger to the evaluator on the validation dataset and log NLL, Accuracy metrics after
+            # each epoch. We setup `global_step_transform=global_step_from_engine(trainer)` to take the epoch
+            # of the `trainer`:
+            col_logger.attach(evaluator,
+                              log_handler=OutputHandler(tag="validation",
+                                                        metric_names=["nll", "accuracy"],
+                                                        global_step_transform=global_step_from_engine(trainer)),
+                              event_name=Events.EPOCH_COMPLETED)
+
+    Args:
+        tag (str): common title for all produced columns. For example, 'training'
+        metric_names (list of str, optional): list of metric names to log or a string "all" to log all available
+            metrics.
+        output_transform (callable, optional): output transform function to prepare `engine.state.output` as a number.
+            For example, `output_transform = lambda output: output`
+            This function can also return a dictionary, e.g `{'loss': loss1, `another_loss`: loss2}` to label the
+            columns with corresponding keys.
+        another_engine (Engine): Deprecated (see :attr:`global_step_transform`). Another engine to use to provide the
+            value of event. Typically, user can provide
+            the trainer if this handler is attached to an evaluator and thus it logs proper trainer's
+            epoch/iteration value.
+        global_step_transform (callable, optional): global step transform function to output a desired global step.
+            Input of the function is `(engine, event_name)`. Output of function should be an integer.
+            Default is None, global_step based on attached engine. If provided,
+            uses function output as global_step. To setup global step from another engine, please use
+            :meth:`~ignite.contrib.handlers.columnar_logger.global_step_from_engine`.
+
+    """
+    def __init__(self, tag, metric_names=None, output_transform=None, another_engine=None, global_step_transform=None):
+        super(OutputHandler, self).__init__(tag, metric_names, output_transform, another_engine, global_step_transform)
+
+    def __call__(self, engine, logger, event_name):
+
+        if not isinstance(logger, ColumnarLogger):
+            raise RuntimeError("Handler 'OutputHandler' works only with ColumnarLogger")
+
+        metrics = self._setup_output_metrics(engine)
+
+        global_step = self.global_step_transform(engine, event_name)
+
+        if not isinstance(global_step, int):
+            raise TypeError("global_step must be int, got {}."
+                            " Please check the output of global_step_transform.".format(type(global_step)))
+
+        for key, value in metrics.items():
+            if isinstance(value, numbers.Number) or \
+                    isinstance(value, torch.Tensor) and value.ndimension() == 0:
+                logger.add_scalar("{}/{}".format(self.tag, key), value, global_step)
+            elif isinstance(value, torch.Tensor) and value.ndimension() == 1:
+                for i, v in enumerate(value.tolist()):
+                    logger.add_scalar("{}/{}/{}".format(self.tag, key, i), v, global_step)
+            else:
+                warnings.warn("ColumnarLogger output_handler can not log "
+                              "metrics value type {}".format(type(value)))
+
+
+class OptimizerParamsHandler(BaseOptimizerParamsHandler):
+    """Helper handler to log optimizer parameters
+
+    Examples:
+
+        .. code-block:: python
+
+            from ignite.contrib.handlers.columnar_logger import *
+
+            # Create a logger
+            col_logger = ColumnarLogger(dirname="experiments/run_0")
+
+            # Attach the logger to the trainer to log optimizer's parameters, e.g. learning rate at each iteration
+            col_logger.attach(trainer,
+                              log_handler=OptimizerParamsHandler(optimizer),
+                              event_name=Events.ITERATION_STARTED)
+
+    Args:
+        optimizer (torch.optim.Optimizer): torch optimizer which parameters to log
+        param_name (str): parameter name
+        tag (str, optional): common title for all produced columns. For example, 'generator'
+    """
+
+    def __init__(self, optimizer, param_name="lr", tag=None):
+        super(OptimizerParamsHandler, self).__init__(optimizer, param_name, tag)
+
+    def __call__(self, engine, logger, event_name):
+        if not isinstance(logger, ColumnarLogger):
+            raise RuntimeError("Handler 'OptimizerParamsHandler' works only with ColumnarLogger")
+
+        global_step = engine.state.get_event_attrib_value(event_name)
+        tag_prefix = "{}/".format(self.tag) if self.tag else ""
+        for i, param_group in enumerate(self.optimizer.param_groups):
+            logger.add_scalar("{}{}/group_{}".format(tag_prefix, self.param_name, i),
+                              float(param_group[self.param_name]),
+                              global_step)
+
+
+def _int64_typecode():
+    # Typecode "q" is not available in Python 2
+    for typecode in ("q", "l"):
+        try:
+            if array.array(typecode).itemsize == 8:
+                return typecode
+        except ValueError:
+            continue
+    raise RuntimeError("No array typecode of 8-byte integers is available on this platform")
+
+
+# Column name, array typecode and numpy dtype of each column stored per tag
+_COLUMNS = (("step", _int64_typecode(), "int64"), ("value", "d", "float64"), ("walltime", "d", "float64"))
+_INDEX_FNAME = "tags.json"
+
+
+class ColumnarLogger(BaseLogger):
+    """
+    Local logger which appends metrics, optimizer parameters or timings to a columnar run log on disk.
+
+    Each tag is stored as three append-only binary files of native-endian arrays: the steps (int64), the values
+    (float64) and the wall times (float64) of the logged scalars. File `tags.json` in `dirname` maps the tags to
+    the column files. Scalars are buffered in memory and appended to the files when `buffer_size` scalars are
+    pending and on :meth:`~ignite.contrib.handlers.columnar_logger.ColumnarLogger.close`.
+
+    A run log is read back with :meth:`~ignite.contrib.handlers.columnar_logger.load_run`, which memory-maps the
+    column files as numpy arrays.
+
+    Args:
+        dirname (str): directory path where the run log is written. It is created if it does not exist. If it
+            already contains a run log, new scalars are appended to it.
+        buffer_size (int, optional): number of pending scalars that triggers writing to the files. Default, 10000.
+
+    Examples:
+
+        .. code-block:: python
+
+            from ignite.contrib.handlers.columnar_logger import *
+
+            # Create a logger
+            col_logger = ColumnarLogger(dirname="experiments/run_0")
+
+            # Attach the logger to the trainer to log training loss at each iteration
+            col_logger.attach(trainer,
+                              log_handler=OutputHandler(tag="training", output_transform=lambda loss: {'loss': loss}),
+                              event_name=Events.ITERATION_COMPLETED)
+
+            # Attach the logger to the trainer to log optimizer's parameters, e.g. learning rate at each iteration
+            col_logger.attach(trainer,
+                              log_handler=OptimizerParamsHandler(optimizer),
+                              event_name=Events.ITERATION_STARTED)
+
+            # Log epoch timings
+            timer = Timer()
+            timer.attach(trainer, start=Events.EPOCH_STARTED, pause=Events.EPOCH_COMPLETED)
+
+            @trainer.on(Events.EPOCH_COMPLETED)
+            def log_time(engine):
+                col_logger.add_scalar("training/epoch_time", timer.value(), engine.state.epoch)
+
+            # We need to close the logger with we are done
+            col_logger.close()
+
+            # Later, analyze the run
+            run = load_run("experiments/run_0")
+            steps, losses = run["training/loss"]["step"], run["training/loss"]["value"]
+
+        It is also possible to use the logger as context manager:
+
+        .. code-block:: python
+
+            from ignite.contrib.handlers.columnar_logger import *
+
+            with ColumnarLogger(dirname="experiments/run_0") as col_logger:
+
+                trainer = Engine(update_fn)
+                # Attach the logger to the trainer to log training loss at each iteration
+                col_logger.attach(trainer,
+                                  log_handler=OutputHandler(tag="training",
+                                                            output_transform=lambda loss: {'loss': loss}),
+                                  event_name=Events.ITERATION_COMPLETED)
+
+    """
+
+    def __init__(self, dirname, buffer_size=10000):
+        if buffer_size < 1:
+            raise ValueError("Argument buffer_size should be positive, but given {}".format(buffer_size))
+
+        self.dirname = os.path.expanduser(dirname)
+        if not os.path.exists(self.dirname):
+            os.makedirs(self.dirname)
+
+        self._buffer_size = buffer_size
+        self._n_pending = 0
+        self._buffers = {}
+        self._tags = _load_index(self.dirname)
+        _truncate_columns(self.dirname, self._tags)
+
+    def add_scalar(self, tag, value, global_step, walltime=None):
+        """Append a scalar to the column of `tag`.
+
+        Args:
+            tag (str): name of the scalar.
+            value (float or 0d torch.Tensor): value of the scalar.
+            global_step (int): global step of the scalar.
+            walltime (float, optional): wall time of the scalar. Default, `time.time()`.
+        """
+        if tag not in self._buffers:
+            self._buffers[tag] = tuple(array.array(typecode) for _, typecode, _ in _COLUMNS)
+
+        steps, values, walltimes = self._buffers[tag]
+        steps.append(global_step)
+        values.append(float(value))
+        walltimes.append(time.time() if walltime is None else walltime)
+
+        self._n_pending += 1
+        if self._n_pending >= self._buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Append all pending scalars to the column files."""
+        new_tags = [tag for tag in self._buffers if tag not in self._tags]
+        if len(new_tags) > 0:
+            for tag in new_tags:
+                self._tags[tag] = "col_{}".format(len(self._tags))
+            _write_index(self.dirname, self._tags)
+
+        for tag, buffers in self._buffers.items():
+            for (name, _, _), buf in zip(_COLUMNS, buffers):
+                with open(_column_path(self.dirname, self._tags[tag], name), "ab") as f:
+                    buf.tofile(f)
+
+        self._buffers = {}
+        self._n_pending = 0
+
+    def close(self):
+        self.flush()
+
+
+def _column_path(dirname, column_id, name):
+    return os.path.join(dirname, "{}.{}".format(column_id, name))
+
+
+def _num_rows(path, typecode):
+    if not os.path.exists(path):
+        return 0
+    return os.path.getsize(path) // array.array(typecode).itemsize
+
+
+def _truncate_columns(dirname, tags):
+    # If a run was interrupted while appending, columns can have different lengths: they are truncated to the
+    # shortest one such that appended rows stay aligned
+    for column_id in tags.values():
+        paths = [(_column_path(dirname, column_id, name), typecode) for name, typecode, _ in _COLUMNS]
+        length = min(_num_rows(path, typecode) for path, typecode in paths)
+        for path, typecode in paths:
+            size = length * array.array(typecode).itemsize
+            if os.path.exists(path) and os.path.getsize(path) != size:
+                with open(path, "r+b") as f:
+                    f.truncate(size)
+
+
+def _load_index(dirname):
+    path = os.path.join(dirname, _INDEX_FNAME)
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _write_index(dirname, tags):
+    tmp = tempfile.NamedTemporaryFile(mode="w", delete=False, dir=dirname)
+    try:
+        json.dump(tags, tmp)
+    except BaseException:
+        tmp.close()
+        os.remove(tmp.name)
+        raise
+    else:
+        tmp.close()
+        _replace(tmp.name, os.path.join(dirname, _INDEX_FNAME))
+
+
+def load_run(dirname, mmap=True):
+    """Read a run log written by :class:`~ignite.contrib.handlers.columnar_logger.ColumnarLogger`.
+
+    This method requires `numpy` to be installed.
+
+    Args:
+        dirname (str): directory path of the run log.
+        mmap (bool, optional): if True, column files are memory-mapped (read-only), otherwise they are loaded into
+            memory.
+
+    Returns:
+        dict mapping each tag to a dict with numpy arrays "step", "value" and "walltime" of the same length.
+    """
+    import numpy as np
+
+    dirname = os.path.expanduser(dirname)
+    if not os.path.exists(os.path.join(dirname, _INDEX_FNAME)):
+        raise ValueError("Directory path '{}' does not contain a run log.".format(dirname))
+
+    run = {}
+    for tag, column_id in _load_index(dirname).items():
+        columns = {}
+        for name, typecode, dtype in _COLUMNS:
+            path = _column_path(dirname, column_id, name)
+            # A partially written last row is ignored
+            num_rows = _num_rows(path, typecode)
+            if num_rows == 0:
+                columns[name] = np.empty(0, dtype=dtype)
+            elif mmap:
+                columns[name] = np.memmap(path, dtype=dtype, mode="r", shape=(num_rows, ))
+            else:
+                columns[name] = np.fromfile(path, dtype=dtype, count=num_rows)
+
+        # If the run was interrupted while appending, columns can have different lengths
+        length = min(len(c) for c in columns.values())
+        run[tag] = {name: c[:length] for name, c in columns.items()}
+    return run
@@ -0,0 +1,209 @@
+import copy
+import functools
+import traceback
+import weakref
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+import torch
+import torch.multiprocessing
+
+from ignite.engine import Engine, Events, State, create_supervised_evaluator, _prepare_batch
+
+
+class ConcurrentEvaluation(object):
+    """Handler to evaluate snapshots of a model in a worker process while the training continues.
+
+    When the handler is called, the model's `state_dict` is copied to shared memory and sent to a worker process
+    which loads it into its own copy of the model and runs an evaluator created with
+    :meth:`~ignite.engine.create_supervised_evaluator` over `data`. The trainer is only paused for the time of the
+    copy.
+
+    Metrics computed by the worker process are received by the trainer after each iteration and stored in
+    `trainer.state.eval_metrics`, a dictionary mapping the iteration of the snapshot to its metrics. Besides,
+    :attr:`~ignite.contrib.handlers.ConcurrentEvaluation.engine` fires `Events.COMPLETED` each time metrics
+    are received, with `metrics`, `iteration` and `epoch` of the snapshot in its state, such that loggers can be
+    attached to it as to an evaluator. Remaining evaluations are waited for when the trainer completes. If the run
+    raises an exception, the worker process is stopped by :meth:`~ignite.contrib.handlers.ConcurrentEvaluation.close`,
+    when the trainer runs again, when the handler is garbage collected or when the interpreter exits.
+
+    Args:
+        model (torch.nn.Module): the model to evaluate.
+        data (Iterable): evaluation data, e.g. a `DataLoader`.
+        metrics (dict of str - :class:`~ignite.metrics.Metric`): a map of metric names to Metrics.
+        device (str, optional): device type specification on which the worker process evaluates the model.
+        non_blocking (bool, optional): see :meth:`~ignite.engine.create_supervised_evaluator`.
+        prepare_batch (callable, optional): see :meth:`~ignite.engine.create_supervised_evaluator`.
+        output_transform (callable, optional): see :meth:`~ignite.engine.create_supervised_evaluator`.
+        start_method (str, optional): start method of the worker process, e.g. "fork" or "spawn". Default is the
+            platform's default start method. With "spawn", `data`, `metrics` and functions should be picklable.
+            CUDA devices in the worker process require "spawn" or "forkserver".
+
+    Examples:
+
+    .. code-block:: python
+
+        from ignite.contrib.handlers import ConcurrentEvaluation
+
+        evaluation = ConcurrentEvaluation(model, val_loader, metrics={"accuracy": Accuracy()})
+        evaluation.attach(trainer, event_name=Events.EPOCH_COMPLETED)
+
+        # Metrics are logged with the trainer's iteration of the evaluated snapshot
+        tb_logger.attach(evaluation.engine,
+                         log_handler=OutputHandler(tag="validation", metric_names=["accuracy"],
+                                                   global_step_transform=lambda engine, _: engine.state.iteration),
+                         event_name=Events.COMPLETED)
+
+    """
+
+    def __init__(self, model, data, metrics, device=None, non_blocking=False, prepare_batch=_prepare_batch,
+                 output_transform=lambda x, y, y_pred: (y_pred, y,), start_method=None):
+        if not isinstance(model, torch.nn.Module):
+            raise TypeError("Argument model should be a torch.nn.Module, but given {}".format(type(model)))
+        if not isinstance(metrics, dict) or len(metrics) == 0:
+            raise ValueError("Argument metrics should be a non-empty dictionary of metrics")
+
+        self.model = model
+        self._worker_args = (data, metrics, dict(device=device, non_blocking=non_blocking,
+                                                 prepare_batch=prepare_batch, output_transform=output_transform))
+        self._context = torch.multiprocessing.get_context(start_method)
+        self._process = None
+        self._tasks = None
+        self._results = None
+        self._stop_worker = None
+        self._n_pending = 0
+
+        self.engine = Engine(lambda engine, batch: None)
+        self.engine.state = State(metrics={})
+
+    def _start(self):
+        self._tasks = self._context.Queue()
+        self._results = self._context.Queue()
+        model = copy.deepcopy(self.model).to("cpu")
+        self._process = self._context.Process(target=_evaluation_worker,
+                                              args=(model, ) + self._worker_args + (self._tasks, self._results))
+        self._process.daemon = True
+        self._process.start()
+        self._stop_worker = _finalizer(self, _stop_worker, self._process, self._tasks, self._results)
+
+    def __call__(self, engine):
+        if self._process is None:
+            self._start()
+
+        snapshot = {k: v.detach().to("cpu", copy=True).share_memory_() if isinstance(v, torch.Tensor) else v
+                    for k, v in self.model.state_dict().items()}
+        self._tasks.put((engine.state.iteration, engine.state.epoch, snapshot))
+        self._n_pending += 1
+
+    def _post(self, engine, result):
+        self._n_pending -= 1
+        iteration, epoch, metrics, error = result
+        if error is not None:
+            raise RuntimeError("Evaluation of the snapshot at iteration {} failed:\n{}".format(iteration, error))
+
+        if not hasattr(engine.state, "eval_metrics"):
+            engine.state.eval_metrics = {}
+        engine.state.eval_metrics[iteration] = metrics
+
+        self.engine.state.iteration = iteration
+        self.engine.state.epoch = epoch
+        self.engine.state.metrics = metrics
+        self.engine.fire_event(Events.COMPLETED)
+
+    def poll(self, engine):
+        """Stores the metrics of completed evaluations into `engine.state`, without waiting.
+
+        Args:
+            engine (Engine): the trainer.
+        """
+        while self._n_pending > 0:
+            try:
+                result = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._post(engine, result)
+
+    def wait(self, engine):
+        """Waits for the pending evaluations and stores their metrics into `engine.state`.
+
+        Args:
+            engine (Engine): the trainer.
+        """
+        while self._n_pending > 0:
+            if not self._process.is_alive():
+                self._n_pending = 0
+                raise RuntimeError("Evaluation worker process exited unexpectedly with code {}"
+                                   .format(self._process.exitcode))
+            try:
+                result = self._results.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            self._post(engine, result)
+
+    def close(self):
+        """Stops the worker process. Pending evaluations, including a running one, are discarded."""
+        if self._process is None:
+            return
+        self._stop_worker()
+        self._stop_worker = None
+        self._process = None
+        self._tasks = self._results = None
+        self._n_pending = 0
+
+    def _completed(self, engine):
+        try:
+            self.wait(engine)
+        finally:
+            self.close()
+
+    def _started(self, engine):
+        # Worker process of a previous run which raised an exception
+        self.close()
+
+    def attach(self, engine, event_name=Events.EPOCH_COMPLETED):
+        """Attaches the handler to the trainer.
+
+        Args:
+            engine (Engine): the trainer.
+            event_name: event on which a snapshot of the model is evaluated. Default, `Events.EPOCH_COMPLETED`.
+        """
+        engine.add_event_handler(Events.STARTED, self._started)
+        engine.add_event_handler(event_name, self)
+        engine.add_event_handler(Events.ITERATION_COMPLETED, self.poll)
+        engine.add_event_handler(Events.COMPLETED, self._completed)
+
+
+def _stop_worker(process, tasks, results):
+    if process.is_alive():
+        process.terminate()
+    process.join()
+    # Queued snapshots are not flushed to the terminated process
+    tasks.cancel_join_thread()
+    tasks.close()
+    results.close()
+
+
+def _finalizer(obj, func, *args):
+    # Callable calling `func(*args)` once, which is also called when `obj` is garbage collected or at exit
+    if hasattr(weakref, "finalize"):
+        return weakref.finalize(obj, func, *args)
+    return functools.partial(func, *args)
+
+
+def _evaluation_worker(model, data, metrics, evaluator_kwargs, tasks, results):
+    evaluator = create_supervised_evaluator(model, metrics=metrics, **evaluator_kwargs)
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        iteration, epoch, snapshot = task
+        try:
+            model.load_state_dict(snapshot)
+            del snapshot
+            state = evaluator.run(data)
+            results.put((iteration, epoch, state.metrics, None))
+        except Exception:
+            results.put((iteration, epoch, None, traceback.format_exc()))
@@ -0,0 +1,334 @@
+import hashlib
+import json
+import numbers
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+
+import torch
+from torch._six import string_classes
+from torch.utils.data import DataLoader
+
+from ignite.engine import Events
+
+if sys.version_info[0] < 3:
+    import collections
+else:
+    import collections.abc as collections
+
+
+class EvaluationCache(object):
+    """Handler to cache the outputs of an evaluator on disk and to replay them when the model's weights and the
+    evaluation data are unchanged.
+
+    When the evaluator starts, a key is computed from the model's `state_dict`, the identity of the data and the
+    code of the evaluator's process function (including its `prepare_batch` and `output_transform`). If outputs are
+    cached for this key, the evaluator runs over the memory-mapped cached outputs instead of the data: neither the
+    data is loaded nor the forward pass is computed, and the metrics attached to the evaluator, including newly
+    attached ones, are updated from the replayed outputs. Otherwise, the outputs of the first epoch are written to
+    the cache.
+
+    Outputs of the evaluator, i.e. `engine.state.output`, should be a tensor or a tuple/list of tensors, e.g.
+    `(y_pred, y)` as returned by :meth:`~ignite.engine.create_supervised_evaluator`.
+
+    Args:
+        dirname (str): directory where outputs are cached. It is created if it does not exist.
+        model (torch.nn.Module): evaluated model. Its `state_dict` is hashed when the evaluator starts.
+        data_key (str or callable, optional): fingerprint of the evaluation data, as a string or as a function which
+            takes the data and returns a string. The identity of the data is made of the type and the length of the
+            data and, for a `DataLoader`, of the type and the length of its dataset, its batch size, `drop_last` and
+            the type of its sampler, plus `data_key` if provided. It should be provided if this does not distinguish
+            evaluation datasets, and is required for data without length.
+        hash_data (bool, optional): if True, the contents of the data are also part of its identity: all the samples
+            of the dataset of a `DataLoader` over a map-style dataset are read, otherwise the data is iterated once.
+            The data is then read on each run, including on cache hits. Default, False.
+
+    Examples:
+
+    .. code-block:: python
+
+        from ignite.contrib.handlers import EvaluationCache
+
+        evaluator = create_supervised_evaluator(model, metrics={"accuracy": Accuracy()})
+        EvaluationCache("/tmp/eval_cache", model, data_key="val_fold_0").attach(evaluator)
+
+        evaluator.run(val_loader)
+        # Same weights: outputs are replayed, a new metric is computed without forward pass
+        Precision().attach(evaluator, "precision")
+        evaluator.run(val_loader)
+
+    Note:
+        Outputs are not replayed if the evaluator is run with `epoch_length` or `persistent_iterator`. Data which can
+        be iterated only once, e.g. a generator, can not be hashed with `hash_data`.
+    """
+
+    def __init__(self, dirname, model, data_key=None, hash_data=False):
+        if not isinstance(model, torch.nn.Module):
+            raise TypeError("Argument model should be a torch.nn.Module, but given {}".format(type(model)))
+        if not (data_key is None or isinstance(data_key, string_classes) or callable(data_key)):
+            raise TypeError("Argument data_key should be a string or a callable, but given {}"
+                            .format(type(data_key)))
+
+        self.dirname = os.path.expanduser(dirname)
+        if not os.path.exists(self.dirname):
+            os.makedirs(self.dirname)
+        self.model = model
+        self.data_key = data_key
+        self.hash_data = hash_data
+        self._replaying = False
+        self._writer = None
+        self._process_function = None
+
+    def _get_key(self, engine):
+        data = engine.state.dataloader
+        h = hashlib.sha1(repr(_data_identity(data, self.data_key is not None)).encode("utf-8"))
+        if self.data_key is not None:
+            data_key = self.data_key if isinstance(self.data_key, string_classes) else self.data_key(data)
+            h.update(("data_key:" + data_key).encode("utf-8"))
+        if self.hash_data:
+            _hash_data(h, data)
+
+        # Metrics are not part of the key: they are computed from the replayed outputs
+        _hash_function(h, self._process_function)
+        for name, value in self.model.state_dict().items():
+            h.update(name.encode("utf-8"))
+            _hash_object(h, value)
+        return h.hexdigest()
+
+    def _started(self, engine):
+        self._replaying = False
+        self._discard_writer()
+        if engine._dataloader_iter is not None:
+            return
+
+        path = os.path.join(self.dirname, self._get_key(engine))
+        if os.path.exists(path):
+            engine.state.dataloader = _CachedOutputs(path)
+            self._replaying = True
+        else:
+            self._writer = _CacheWriter(self.dirname, path)
+
+    def _iteration_completed(self, engine):
+        if self._writer is not None and engine.state.epoch == 1:
+            self._writer.append(engine.state.output)
+
+    def _epoch_completed(self, engine):
+        if self._writer is not None:
+            self._writer.commit()
+            self._writer = None
+
+    def _completed(self, engine):
+        # Run was terminated before the end of the first epoch
+        self._discard_writer()
+
+    def _discard_writer(self):
+        if self._writer is not None:
+            self._writer.discard()
+            self._writer = None
+
+    def _wrap(self, process_function):
+
+        def _process_function(engine, batch):
+            if self._replaying:
+                return batch
+            return process_function(engine, batch)
+
+        return _process_function
+
+    def attach(self, engine):
+        """Attaches the cache to the evaluator.
+
+        Args:
+            engine (Engine): the evaluator.
+        """
+        self._process_function = engine._process_function
+        engine._process_function = self._wrap(engine._process_function)
+        engine.add_event_handler(Events.STARTED, self._started)
+        engine.add_event_handler(Events.ITERATION_COMPLETED, self._iteration_completed)
+        engine.add_event_handler(Events.EPOCH_COMPLETED, self._epoch_completed)
+        engine.add_event_handler(Events.COMPLETED, self._completed)
+
+
+def _data_identity(data, has_data_key):
+    if not hasattr(data, "__len__"):
+        if not has_data_key:
+            raise ValueError("Argument data_key of EvaluationCache should be provided for data without length, "
+                             "but given {}".format(type(data)))
+        return [type(data).__name__]
+    identity = [type(data).__name__, len(data)]
+    if isinstance(data, DataLoader):
+        dataset = data.dataset
+        identity += [type(dataset).__name__, len(dataset) if hasattr(dataset, "__len__") else None,
+                     data.batch_size, data.drop_last, type(data.sampler).__name__]
+    return identity
+
+
+def _hash_object(h, obj):
+    # Hashes the contents of tensors, arrays, numbers, strings and their containers
+    if isinstance(obj, torch.Tensor):
+        obj = obj.detach().to("cpu").contiguous()
+        h.update("tensor{}{}".format(obj.dtype, tuple(obj.shape)).encode("utf-8"))
+        if obj.numel() > 0:
+            h.update(obj.view(-1).view(torch.uint8).numpy().tobytes())
+    elif isinstance(obj, (numbers.Number, string_classes, bytes, type(None))):
+        h.update("{}{!r}".format(type(obj).__name__, obj).encode("utf-8"))
+    elif isinstance(obj, collections.Mapping):
+        h.update("mapping{}".format(len(obj)).encode("utf-8"))
+        for k in sorted(obj.keys(), key=repr):
+            _hash_object(h, k)
+            _hash_object(h, obj[k])
+    elif isinstance(obj, collections.Sequence):
+        h.update("sequence{}".format(len(obj)).encode("utf-8"))
+        for o in obj:
+            _hash_object(h, o)
+    elif hasattr(obj, "__array__"):
+        import numpy as np
+        _hash_object(h, torch.from_numpy(np.ascontiguousarray(obj)))
+    else:
+        h.update(pickle.dumps(obj, protocol=2))
+
+
+def _hash_data(h, data):
+    if isinstance(data, DataLoader) and hasattr(data.sampler, "__len__"):
+        # Map-style dataset: samples are hashed in index order, independently of the sampler's randomness
+        dataset = data.dataset
+        for i in range(len(dataset)):
+            _hash_object(h, dataset[i])
+        return
+
+    if iter(data) is data:
+        raise ValueError("Data which can be iterated only once can not be hashed by EvaluationCache with hash_data, "
+                         "but given {}".format(type(data)))
+    for batch in data:
+        _hash_object(h, batch)
+
+
+def _hash_function(h, fn, depth=0):
+    # Hashes the code of a function, of the functions it creates and of the functions and values of its closure,
+    # such that e.g. `prepare_batch` and `output_transform` of `create_supervised_evaluator` are part of the key
+    code = getattr(fn, "__code__", None)
+    if code is None:
+        h.update(type(fn).__name__.encode("utf-8"))
+        return
+
+    _hash_code(h, code)
+    if depth >= 4:
+        return
+    for cell in fn.__closure__ or ():
+        try:
+            value = cell.cell_contents
+        except ValueError:
+            continue
+        if isinstance(value, torch.nn.Module):
+            # Weights are hashed from the model's state_dict
+            h.update(type(value).__name__.encode("utf-8"))
+        elif hasattr(value, "__code__"):
+            _hash_function(h, value, depth + 1)
+        elif isinstance(value, (numbers.Number, string_classes, bytes, type(None), torch.device, torch.dtype)):
+            h.update(repr(value).encode("utf-8"))
+        else:
+            h.update(type(value).__name__.encode("utf-8"))
+
+
+def _hash_code(h, code):
+    h.update(code.co_code)
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            _hash_code(h, const)
+        else:
+            h.update(repr(const).encode("utf-8"))
+
+
+_INDEX_FNAME = "index.json"
+
+
+def _as_tuple(output):
+    if isinstance(output, torch.Tensor):
+        return False, (output, )
+    if isinstance(output, (tuple, list)) and all(isinstance(o, torch.Tensor) for o in output):
+        return True, tuple(output)
+    raise TypeError("Output of the evaluator should be a tensor or a tuple/list of tensors to be cached, "
+                    "but given {}".format(type(output)))
+
+
+class _CacheWriter(object):
+    # Appends outputs to one binary file per output field and commits them atomically to `path`
+
+    def __init__(self, dirname, path):
+        self.path = path
+        self._tmp_path = tempfile.mkdtemp(dir=dirname)
+        self._files = None
+        self._index = None
+
+    def append(self, output):
+        is_sequence, tensors = _as_tuple(output)
+        tensors = [t.detach().to("cpu").contiguous() for t in tensors]
+        if self._files is None:
+            self._files = [open(os.path.join(self._tmp_path, "field_{}.bin".format(i)), "wb")
+                           for i in range(len(tensors))]
+            self._index = {"is_sequence": is_sequence, "dtypes": [str(t.numpy().dtype) for t in tensors],
+                           "shapes": []}
+        elif len(tensors) != len(self._files):
+            raise ValueError("Number of output tensors changed from {} to {}"
+                             .format(len(self._files), len(tensors)))
+
+        for f, t in zip(self._files, tensors):
+            f.write(t.numpy().tobytes())
+        self._index["shapes"].append([list(t.shape) for t in tensors])
+
+    def _close_files(self):
+        for f in self._files or []:
+            f.close()
+        self._files = None
+
+    def commit(self):
+        self._close_files()
+        if self._index is None:
+            self.discard()
+            return
+        with open(os.path.join(self._tmp_path, _INDEX_FNAME), "w") as f:
+            json.dump(self._index, f)
+        if os.path.exists(self.path):
+            self.discard()
+        else:
+            os.rename(self._tmp_path, self.path)
+
+    def discard(self):
+        self._close_files()
+        shutil.rmtree(self._tmp_path, ignore_errors=True)
+
+
+class _CachedOutputs(object):
+    # Iterable over the cached outputs of the batches, read from memory-mapped files
+
+    def __init__(self, path):
+        import numpy as np
+
+        with open(os.path.join(path, _INDEX_FNAME), "r") as f:
+            self._index = json.load(f)
+
+        self._fields = []
+        for i, dtype in enumerate(self._index["dtypes"]):
+            fname = os.path.join(path, "field_{}.bin".format(i))
+            if os.path.getsize(fname) == 0:
+                self._fields.append(np.empty(0, dtype=dtype))
+            else:
+                # copy-on-write mapping, such that replayed tensors are writable
+                self._fields.append(np.memmap(fname, dtype=dtype, mode="c"))
+
+    def __len__(self):
+        return len(self._index["shapes"])
+
+    def __iter__(self):
+        offsets = [0] * len(self._fields)
+        for shapes in self._index["shapes"]:
+            tensors = []
+            for i, shape in enumerate(shapes):
+                numel = 1
+                for s in shape:
+                    numel *= s
+                tensors.append(torch.from_numpy(self._fields[i][offsets[i]:offsets[i] + numel]).view(shape))
+                offsets[i] += numel
+            yield tuple(tensors) if self._index["is_sequence"] else tensors[0]
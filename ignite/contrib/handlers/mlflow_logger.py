@@ -1,10 +1,11 @@
 import numbers
+import time
 
 import warnings
 import torch
 
 from ignite.contrib.handlers.base_logger import BaseLogger, BaseOutputHandler, BaseOptimizerParamsHandler, \
-    global_step_from_engine
+    global_step_from_engine, _BackgroundFlusher
 
 
 __all__ = ['MLflowLogger', 'OutputHandler', 'OptimizerParamsHandler', 'global_step_from_engine']
@@ -92,6 +93,18 @@ class OutputHandler(BaseOutputHandler):
     """
     def __init__(self, tag, metric_names=None, output_transform=None, another_engine=None, global_step_transform=None):
         super(OutputHandler, self).__init__(tag, metric_names, output_transform, another_engine, global_step_transform)
+        self._valid_names = {}
+
+    def _is_valid_name(self, key):
+        # Recheck metric names as MLflow rejects non-valid names with MLflowException. The result is cached per name.
+        if key not in self._valid_names:
+            from mlflow.utils.validation import _VALID_PARAM_AND_METRIC_NAMES
+
+            self._valid_names[key] = _VALID_PARAM_AND_METRIC_NAMES.match(key) is not None
+            if not self._valid_names[key]:
+                warnings.warn("MLflowLogger output_handler encountered an invalid metric name '{}' that "
+                              "will be ignored and not logged to MLflow".format(key))
+        return self._valid_names[key]
 
     def __call__(self, engine, logger, event_name):
 
@@ -119,13 +132,8 @@ class OutputHandler(BaseOutputHandler):
                 warnings.warn("MLflowLogger output_handler can not log "
                               "metrics value type {}".format(type(value)))
 
-        # Additionally recheck metric names as MLflow rejects non-valid names with MLflowException
-        from mlflow.utils.validation import _VALID_PARAM_AND_METRIC_NAMES
-
         for key in list(rendered_metrics.keys()):
-            if not _VALID_PARAM_AND_METRIC_NAMES.match(key):
-                warnings.warn("MLflowLogger output_handler encountered an invalid metric name '{}' that "
-                              "will be ignored and not logged to MLflow".format(key))
+            if not self._is_valid_name(key):
                 del rendered_metrics[key]
 
         logger.log_metrics(rendered_metrics, step=global_step)
@@ -184,6 +192,13 @@ class MLflowLogger(BaseLogger):
 
     Args:
         tracking_uri (str): MLflow tracking uri. See MLflow docs for more details
+        buffer_size (int, optional): if provided,
+            :meth:`~ignite.contrib.handlers.mlflow_logger.MLflowLogger.log_metrics` only stores metrics in memory and
+            a background thread sends them to the tracking server with `MlflowClient.log_batch` when `buffer_size`
+            metrics are pending or every `flush_secs` seconds. Pending metrics are sent on
+            :meth:`~ignite.contrib.handlers.mlflow_logger.MLflowLogger.close`.
+        flush_secs (float, optional): maximum time in seconds a metric is kept in memory with buffering.
+            Default, 1.0.
 
     Examples:
 
@@ -223,9 +238,23 @@ class MLflowLogger(BaseLogger):
                                                            metric_names=["nll", "accuracy"],
                                                            global_step_transform=global_step_from_engine(trainer)),
                                  event_name=Events.EPOCH_COMPLETED)
+
+        Buffered logging, so that latency of the tracking server does not slow down the training:
+
+        .. code-block:: python
+
+            with MLflowLogger(buffer_size=1000) as mlflow_logger:
+
+                mlflow_logger.attach(trainer,
+                                     log_handler=OutputHandler(tag="training",
+                                                               output_transform=lambda loss: {"loss": loss}),
+                                     event_name=Events.ITERATION_COMPLETED)
     """
 
-    def __init__(self, tracking_uri=None):
+    # Maximum number of metrics accepted by MlflowClient.log_batch
+    _max_batch_size = 1000
+
+    def __init__(self, tracking_uri=None, buffer_size=None, flush_secs=1.0):
         try:
             import mlflow
         except ImportError:
@@ -239,6 +268,37 @@ class MLflowLogger(BaseLogger):
         if self.active_run is None:
             self.active_run = mlflow.start_run()
 
+        self._flusher = None
+        if buffer_size is not None:
+            self._flusher = _BackgroundFlusher(self._log_batch, buffer_size=buffer_size, flush_secs=flush_secs)
+
+    def log_metrics(self, metrics, step=None):
+        """Log multiple metrics for the current run, see `mlflow.log_metrics`. With buffering, metrics are only
+        stored in memory and sent later from a background thread.
+
+        Args:
+            metrics (dict): dictionary of metric name to value.
+            step (int, optional): step at which to log the metrics.
+        """
+        if self._flusher is None:
+            import mlflow
+            mlflow.log_metrics(metrics, step=step)
+            return
+
+        timestamp = int(time.time() * 1000)
+        for key, value in metrics.items():
+            self._flusher.put((key, value, timestamp, step))
+
+    def _log_batch(self, records):
+        from mlflow.entities import Metric
+        from mlflow.tracking import MlflowClient
+
+        client = MlflowClient()
+        run_id = self.active_run.info.run_id
+        metrics = [Metric(key, float(value), timestamp, step or 0) for key, value, timestamp, step in records]
+        for i in range(0, len(metrics), self._max_batch_size):
+            client.log_batch(run_id, metrics=metrics[i:i + self._max_batch_size])
+
     def __getattr__(self, attr):
 
         import mlflow
@@ -250,4 +310,8 @@ class MLflowLogger(BaseLogger):
 
     def close(self):
         import mlflow
-        mlflow.end_run()
+        try:
+            if self._flusher is not None:
+                self._flusher.close()
+        finally:
+            mlflow.end_run()
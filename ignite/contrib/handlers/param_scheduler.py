@@ -1,5 +1,6 @@
 from __future__ import division
 
+import array
 from copy import deepcopy
 
 import math
@@ -26,7 +27,8 @@ class ParamScheduler(with_metaclass(ABCMeta, object)):
         optimizer (`torch.optim.Optimizer` or dict): the optimizer or parameters group to use.
         param_name (str): name of optimizer's parameter to update.
         save_history (bool, optional): whether to log the parameter values to
-            `engine.state.param_history`, (default=False).
+            `engine.state.param_history`, (default=False). Values of each scheduler name are stored in a
+            :class:`~ignite.contrib.handlers.param_scheduler.ParamHistory`.
 
 
     Note:
@@ -34,6 +36,11 @@ class ParamScheduler(with_metaclass(ABCMeta, object)):
         More precisely, whatever the state of the optimizer (newly created or used by another scheduler) the scheduler
         sets defined absolute values.
 
+    Note:
+        If the number of events is known in advance, the values of the scheduler can be precomputed with
+        :meth:`~ignite.contrib.handlers.param_scheduler.ParamScheduler.precompute`. Then each call of the scheduler
+        reads the next value from the precomputed table instead of computing it.
+
     """
 
     def __init__(self, optimizer, param_name, save_history=False):
@@ -45,10 +52,16 @@ class ParamScheduler(with_metaclass(ABCMeta, object)):
         self.param_name = param_name
         self.save_history = save_history
         self.event_index = 0
+        self._table = []
+        self._table_index = 0
 
     def __call__(self, engine, name=None):
 
-        value = self.get_param()
+        if self._table_index < len(self._table):
+            value = self._table[self._table_index]
+            self._table_index += 1
+        else:
+            value = self.get_param()
 
         for param_group in self.optimizer_param_groups:
             param_group[self.param_name] = value
@@ -57,11 +70,7 @@ class ParamScheduler(with_metaclass(ABCMeta, object)):
             name = self.param_name
 
         if self.save_history:
-            if not hasattr(engine.state, 'param_history'):
-                setattr(engine.state, 'param_history', {})
-            engine.state.param_history.setdefault(name, [])
-            values = [pg[self.param_name] for pg in self.optimizer_param_groups]
-            engine.state.param_history[name].append(values)
+            _save_param_history(engine, name, [pg[self.param_name] for pg in self.optimizer_param_groups])
 
         self.event_index += 1
 
@@ -71,6 +80,45 @@ class ParamScheduler(with_metaclass(ABCMeta, object)):
         """
         pass
 
+    def get_values(self, num_events):
+        """Method to compute the values of the next `num_events` events. The scheduler is not modified.
+
+        Args:
+            num_events (int): number of events.
+
+        Returns:
+            torch.Tensor of dtype float64 and size `num_events`.
+        """
+        # Simulate a copy of the scheduler which writes to copies of the optimizer's param groups
+        scheduler = deepcopy(self, _simulation_memo(self, {}))
+        scheduler.save_history = False
+        values = []
+        for _ in range(num_events):
+            scheduler(engine=None)
+            values.append(scheduler.optimizer_param_groups[0][scheduler.param_name])
+        return torch.tensor(values, dtype=torch.float64)
+
+    def precompute(self, num_events):
+        """Method to precompute the values of the next `num_events` events. Next `num_events` calls of the
+        scheduler set precomputed values. Once they are consumed, values are computed again on each call.
+
+        Args:
+            num_events (int): number of events, e.g. `max_epochs * len(train_loader)` if the scheduler is attached
+                to `Events.ITERATION_STARTED`.
+
+        .. code-block:: python
+
+            scheduler = CosineAnnealingScheduler(optimizer, 'lr', 1e-1, 1e-3, len(train_loader))
+            scheduler.precompute(num_events=max_epochs * len(train_loader))
+            trainer.add_event_handler(Events.ITERATION_STARTED, scheduler)
+
+        """
+        self._set_table(self.get_values(num_events).tolist())
+
+    def _set_table(self, values):
+        self._table = values
+        self._table_index = 0
+
     @classmethod
     def simulate_values(cls, num_events, **scheduler_kwargs):
         """Method to simulate scheduled values during num_events events.
@@ -100,12 +148,113 @@ class ParamScheduler(with_metaclass(ABCMeta, object)):
         for key in keys_to_remove:
             if key in scheduler_kwargs:
                 del scheduler_kwargs[key]
-        values = []
         scheduler = cls(optimizer={}, save_history=False, **scheduler_kwargs)
-        for i in range(num_events):
-            scheduler(engine=None)
-            values.append([i, scheduler.optimizer_param_groups[0][scheduler.param_name]])
-        return values
+        values = scheduler.get_values(num_events).tolist()
+        return [[i, v] for i, v in enumerate(values)]
+
+
+class ParamHistory(Sequence):
+    """History of a scheduled parameter, stored in `engine.state.param_history`.
+
+    Item `i` is the list of the parameter values of all optimizer's param groups at event `i`. Values are stored
+    in a flat typed array (`array.array` of doubles) instead of a list of lists of Python floats. If the number of
+    param groups changes or values are not real numbers, the history falls back to a list of lists.
+
+    .. code-block:: python
+
+        history = trainer.state.param_history["lr"]
+        first_group_lrs = [values[0] for values in history]
+        # or as numpy array of shape (num_events, num_param_groups)
+        lrs = history.to_numpy()
+
+    """
+
+    def __init__(self):
+        self._values = array.array('d')
+        self._num_groups = None
+        self._rows = None
+
+    def append(self, values):
+        """Append the parameter values of all param groups at an event.
+
+        Args:
+            values (list of float): parameter values.
+        """
+        if self._rows is None:
+            if self._num_groups is None:
+                self._num_groups = len(values)
+            if len(values) == self._num_groups:
+                try:
+                    self._values.extend(array.array('d', values))
+                    return
+                except TypeError:
+                    pass
+            self._rows = self.tolist()
+            self._values = array.array('d')
+        self._rows.append(list(values))
+
+    def __len__(self):
+        if self._rows is not None:
+            return len(self._rows)
+        if not self._num_groups:
+            return 0
+        return len(self._values) // self._num_groups
+
+    def __getitem__(self, index):
+        if self._rows is not None:
+            return self._rows[index]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("ParamHistory index out of range")
+        start = index * self._num_groups
+        return self._values[start:start + self._num_groups].tolist()
+
+    def tolist(self):
+        """Returns the history as a list of lists of parameter values."""
+        if self._rows is not None:
+            return [list(row) for row in self._rows]
+        return [self[i] for i in range(len(self))]
+
+    def to_numpy(self):
+        """Returns the history as numpy array of shape `(num_events, num_param_groups)`. If the history is stored
+        in a typed array, it is copied in one block, without creating Python floats.
+
+        This method requires `numpy` to be installed.
+        """
+        import numpy as np
+
+        if self._rows is not None:
+            return np.array(self._rows)
+        if len(self._values) == 0:
+            return np.empty((0, self._num_groups or 0))
+        # Copy, as the array can not be resized while its buffer is exported
+        return np.frombuffer(self._values, dtype=np.float64).reshape(-1, self._num_groups).copy()
+
+    def __eq__(self, other):
+        # Compares element-wise with any sequence of rows, e.g. a list of lists
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        for row, other_row in zip(self.tolist(), other):
+            if isinstance(other_row, Sequence) and not isinstance(other_row, (str, bytes)):
+                other_row = list(other_row)
+            if row != other_row:
+                return False
+        return True
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "ParamHistory({})".format(self.tolist())
 
 
 class CyclicalScheduler(ParamScheduler):
@@ -169,6 +318,24 @@ class CyclicalScheduler(ParamScheduler):
 
         return super(CyclicalScheduler, self).__call__(engine, name)
 
+    def _get_cycles(self, num_events):
+        # Splits next `num_events` events into parts of cycles: (cycle_progress, start_value, end_value)
+        event_index, cycle_size = self.event_index, self.cycle_size
+        start_value, end_value = self.start_value, self.end_value
+        cycles = []
+        while num_events > 0:
+            if event_index != 0 and event_index % cycle_size == 0:
+                event_index = 0
+                cycle_size *= self.cycle_mult
+                start_value *= self.start_value_mult
+                end_value *= self.end_value_mult
+            length = _next_cycle_start(event_index, cycle_size, event_index + num_events) - event_index
+            cycle_progress = torch.arange(event_index, event_index + length, dtype=torch.float64) / cycle_size
+            cycles.append((cycle_progress, start_value, end_value))
+            event_index += length
+            num_events -= length
+        return cycles
+
 
 class LinearCyclicalScheduler(CyclicalScheduler):
     """Linearly adjusts param value to 'end_value' for a half-cycle, then linearly
@@ -211,6 +378,10 @@ class LinearCyclicalScheduler(CyclicalScheduler):
         cycle_progress = self.event_index / self.cycle_size
         return self.end_value + (self.start_value - self.end_value) * abs(cycle_progress - 0.5) * 2
 
+    def get_values(self, num_events):
+        return _cat_values([end_value + (start_value - end_value) * (cycle_progress - 0.5).abs() * 2
+                            for cycle_progress, start_value, end_value in self._get_cycles(num_events)])
+
 
 class CosineAnnealingScheduler(CyclicalScheduler):
     """Anneals 'start_value' to 'end_value' over each cycle.
@@ -277,6 +448,10 @@ class CosineAnnealingScheduler(CyclicalScheduler):
         cycle_progress = self.event_index / self.cycle_size
         return self.start_value + ((self.end_value - self.start_value) / 2) * (1 - math.cos(math.pi * cycle_progress))
 
+    def get_values(self, num_events):
+        return _cat_values([start_value + ((end_value - start_value) / 2) * (1 - torch.cos(math.pi * cycle_progress))
+                            for cycle_progress, start_value, end_value in self._get_cycles(num_events)])
+
 
 class ConcatScheduler(ParamScheduler):
     """Concat a list of parameter schedulers.
@@ -375,6 +550,30 @@ class ConcatScheduler(ParamScheduler):
     def get_param(self):
         return self._current_scheduler.get_param()
 
+    def _split_events(self, num_events):
+        # Splits next `num_events` events between the schedulers: [(scheduler, number of events), ...]
+        schedulers = [self._current_scheduler, ] + self._schedulers
+        durations = [self._current_duration, ] + self._durations
+        splits = []
+        for scheduler, duration in zip(schedulers, durations):
+            n = num_events if duration < 0 else min(duration, num_events)
+            if n > 0:
+                splits.append((scheduler, n))
+            num_events -= n
+        return splits
+
+    def get_values(self, num_events):
+        if _depends_on_optimizer(self):
+            # Values of torch lr schedulers depend on the values set by the previous schedulers
+            return super(ConcatScheduler, self).get_values(num_events)
+        return _cat_values([scheduler.get_values(n) for scheduler, n in self._split_events(num_events)])
+
+    def _set_table(self, values):
+        start = 0
+        for scheduler, n in self._split_events(len(values)):
+            scheduler._set_table(values[start:start + n])
+            start += n
+
     @classmethod
     def simulate_values(cls, num_events, schedulers, durations, param_names=None, **kwargs):
         """Method to simulate scheduled values during num_events events.
@@ -401,6 +600,9 @@ class ConcatScheduler(ParamScheduler):
         scheduler = cls(copy_schedulers, durations, save_history=False)
         if param_names is None:
             param_names = [scheduler.param_name]
+        if all(name == param_names[0] for name in param_names + _get_param_names(scheduler)):
+            values = scheduler.get_values(num_events).tolist()
+            return [[i, ] + [v, ] * len(param_names) for i, v in enumerate(values)]
         for i in range(num_events):
             scheduler(engine=None)
             values = [scheduler.optimizer_param_groups[0][param_name] for param_name in param_names]
@@ -472,13 +674,9 @@ class LRScheduler(ParamScheduler):
         # should be replicated in order to simulate LR values and
         # not perturb original scheduler.
         copy_lr_scheduler = LRScheduler._replicate_lr_scheduler(lr_scheduler)
-        values = []
         scheduler = cls(save_history=False, lr_scheduler=copy_lr_scheduler)
-        for i in range(num_events):
-            scheduler(engine=None)
-            values.append([i, scheduler.optimizer_param_groups[0][scheduler.param_name]])
-
-        return values
+        values = scheduler.get_values(num_events).tolist()
+        return [[i, v] for i, v in enumerate(values)]
 
     @staticmethod
     def _replicate_lr_scheduler(lr_scheduler, new_optimizer_param_groups=None):
@@ -616,6 +814,83 @@ class ParamGroupScheduler(object):
             scheduler(engine, name=name)
 
 
+class ParamGroupMultiplierScheduler(object):
+    """
+    Scheduler setting the parameter of each optimizer's param group to the value of a base scheduler times a
+    multiplier of the param group, e.g. for layer-wise learning rate decay.
+
+    The values of all param groups are computed in a single vectorized operation (`multipliers * value`) and written
+    back to the optimizer in one pass, instead of running a scheduler per param group.
+
+    Args:
+        optimizer (`torch.optim.Optimizer`): the optimizer to use.
+        scheduler (ParamScheduler): base scheduler. It should be created with a dictionary instead of the optimizer,
+            e.g. `LinearCyclicalScheduler({}, "lr", ...)`. Schedulers wrapping torch lr schedulers are not supported.
+        multipliers (list of float): multiplier of each optimizer's param group.
+        save_history (bool, optional): whether to log the parameter values to
+            `engine.state.param_history`, (default=False).
+
+    .. code-block:: python
+
+        # Learning rate decay of 0.9 per layer from the head of the model
+        optimizer = SGD([{"params": layer.parameters()} for layer in model.layers], lr=0.1)
+        multipliers = [0.9 ** (len(model.layers) - 1 - i) for i in range(len(model.layers))]
+
+        base_scheduler = CosineAnnealingScheduler({}, 'lr', 1e-1, 1e-3, len(train_loader))
+        scheduler = ParamGroupMultiplierScheduler(optimizer, base_scheduler, multipliers)
+        trainer.add_event_handler(Events.ITERATION_STARTED, scheduler)
+
+    """
+
+    def __init__(self, optimizer, scheduler, multipliers, save_history=False):
+        if not isinstance(scheduler, ParamScheduler):
+            raise TypeError("Argument scheduler should be a parameter scheduler, "
+                            "but given {}".format(type(scheduler)))
+
+        if _depends_on_optimizer(scheduler):
+            raise TypeError("Argument scheduler should not wrap a torch lr scheduler")
+
+        if len(multipliers) != len(optimizer.param_groups):
+            raise ValueError("Argument multipliers should have a value per optimizer's param group, but given "
+                             "{} values for {} param groups".format(len(multipliers), len(optimizer.param_groups)))
+
+        self.optimizer_param_groups = optimizer.param_groups
+        self.scheduler = scheduler
+        self.param_name = scheduler.param_name
+        self.multipliers = torch.tensor(multipliers, dtype=torch.float64)
+        self.save_history = save_history
+
+    def __call__(self, engine, name=None):
+        self.scheduler(engine=None)
+        value = self.scheduler.optimizer_param_groups[0][self.param_name]
+        values = (self.multipliers * value).tolist()
+
+        for param_group, v in zip(self.optimizer_param_groups, values):
+            param_group[self.param_name] = v
+
+        if self.save_history:
+            _save_param_history(engine, self.param_name if name is None else name, values)
+
+    def get_values(self, num_events):
+        """Method to compute the values of the next `num_events` events. The scheduler is not modified.
+
+        Args:
+            num_events (int): number of events.
+
+        Returns:
+            torch.Tensor of dtype float64 and size `(num_events, num_param_groups)`.
+        """
+        return torch.ger(self.scheduler.get_values(num_events), self.multipliers)
+
+    def precompute(self, num_events):
+        """Method to precompute the values of the base scheduler for the next `num_events` events.
+
+        Args:
+            num_events (int): number of events.
+        """
+        self.scheduler.precompute(num_events)
+
+
 class PiecewiseLinear(ParamScheduler):
     """
     Piecewise linear parameter scheduler
@@ -674,17 +949,27 @@ class PiecewiseLinear(ParamScheduler):
             return self.event_index - 1, self.event_index, self.values[0], self.values[0]
         elif self.milestones[-1] <= self.event_index:
             return self.event_index, self.event_index + 1, self.values[-1], self.values[-1],
-        elif self.milestones[self._index] <= self.event_index < self.milestones[self._index + 1]:
-            return self.milestones[self._index], self.milestones[self._index + 1], \
-                self.values[self._index], self.values[self._index + 1]
-        else:
+        while not (self.milestones[self._index] <= self.event_index < self.milestones[self._index + 1]):
             self._index += 1
-            return self._get_start_end()
+        return self.milestones[self._index], self.milestones[self._index + 1], \
+            self.values[self._index], self.values[self._index + 1]
 
     def get_param(self):
         start_index, end_index, start_value, end_value = self._get_start_end()
         return start_value + (end_value - start_value) * (self.event_index - start_index) / (end_index - start_index)
 
+    def get_values(self, num_events):
+        event_index = torch.arange(self.event_index, self.event_index + num_events, dtype=torch.float64)
+        milestones = torch.tensor(self.milestones, dtype=torch.float64)
+        values = torch.tensor(self.values, dtype=torch.float64)
+        # Segment [milestones[start], milestones[end]] of each event. Before the first and after the last milestones,
+        # start == end and the value is constant.
+        count = (milestones.unsqueeze(0) <= event_index.unsqueeze(1)).sum(dim=1)
+        start = (count - 1).clamp(min=0)
+        end = count.clamp(max=len(self.milestones) - 1)
+        weight = (event_index - milestones[start]) / (milestones[end] - milestones[start]).clamp(min=1)
+        return values[start] + (values[end] - values[start]) * weight
+
 
 def _replicate_scheduler(scheduler, opt_copy_map, save_history=False):
     if isinstance(scheduler, LRScheduler):
@@ -700,3 +985,56 @@ def _replicate_scheduler(scheduler, opt_copy_map, save_history=False):
         new_scheduler.optimizer_param_groups = opt_copy_map[id(scheduler.optimizer_param_groups)]
         new_scheduler.save_history = save_history
         return new_scheduler
+
+
+def _save_param_history(engine, name, values):
+    if not hasattr(engine.state, 'param_history'):
+        setattr(engine.state, 'param_history', {})
+    if name not in engine.state.param_history:
+        engine.state.param_history[name] = ParamHistory()
+    engine.state.param_history[name].append(values)
+
+
+def _next_cycle_start(event_index, cycle_size, max_index):
+    # Smallest index k > event_index such that k % cycle_size == 0, or max_index if k > max_index.
+    # cycle_size can be a float if cycle_mult is not an integer
+    m = int(event_index // cycle_size) + 1
+    while m * cycle_size < max_index + 1:
+        k = int(round(m * cycle_size))
+        if event_index < k <= max_index and k % cycle_size == 0:
+            return k
+        m += 1
+    return max_index
+
+
+def _cat_values(values):
+    if len(values) == 0:
+        return torch.zeros(0, dtype=torch.float64)
+    return torch.cat(values)
+
+
+def _get_param_names(scheduler):
+    if isinstance(scheduler, ConcatScheduler):
+        return [name for s in scheduler.schedulers for name in _get_param_names(s)]
+    return [scheduler.param_name, ]
+
+
+def _depends_on_optimizer(scheduler):
+    if isinstance(scheduler, ConcatScheduler):
+        return any(_depends_on_optimizer(s) for s in scheduler.schedulers)
+    return isinstance(scheduler, LRScheduler)
+
+
+def _simulation_memo(scheduler, memo):
+    # Memo for deepcopy replacing optimizer's param groups by their copies and torch lr schedulers by their replicas
+    if isinstance(scheduler, ConcatScheduler):
+        for s in scheduler.schedulers:
+            _simulation_memo(s, memo)
+        return memo
+    param_groups = scheduler.optimizer_param_groups
+    if id(param_groups) not in memo:
+        memo[id(param_groups)] = [dict(pg) for pg in param_groups]
+    if isinstance(scheduler, LRScheduler):
+        lr_scheduler = scheduler.lr_scheduler
+        memo[id(lr_scheduler)] = LRScheduler._replicate_lr_scheduler(lr_scheduler, memo[id(param_groups)])
+    return memo
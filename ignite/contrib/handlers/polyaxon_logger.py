@@ -4,7 +4,7 @@ import warnings
 import torch
 
 from ignite.contrib.handlers.base_logger import BaseLogger, BaseOutputHandler, BaseOptimizerParamsHandler, \
-    global_step_from_engine
+    global_step_from_engine, _BackgroundFlusher
 
 
 __all__ = ['PolyaxonLogger', 'OutputHandler', 'OptimizerParamsHandler', 'global_step_from_engine']
@@ -172,6 +172,14 @@ class PolyaxonLogger(BaseLogger):
 
         pip install polyaxon-client
 
+    Args:
+        buffer_size (int, optional): if provided,
+            :meth:`~ignite.contrib.handlers.polyaxon_logger.PolyaxonLogger.log_metrics` only stores metrics in memory
+            and a background thread sends them to Polyaxon when `buffer_size` records are pending or every
+            `flush_secs` seconds. Records of the same step are sent with a single call. Pending records are sent on
+            :meth:`~ignite.contrib.handlers.polyaxon_logger.PolyaxonLogger.close`.
+        flush_secs (float, optional): maximum time in seconds a record is kept in memory with buffering.
+            Default, 1.0.
 
     Examples:
 
@@ -211,9 +219,20 @@ class PolyaxonLogger(BaseLogger):
                                                         metric_names=["nll", "accuracy"],
                                                         global_step_transform=global_step_from_engine(trainer)),
                               event_name=Events.EPOCH_COMPLETED)
+
+        Buffered logging, so that latency of the tracking server does not slow down the training:
+
+        .. code-block:: python
+
+            with PolyaxonLogger(buffer_size=1000) as plx_logger:
+
+                plx_logger.attach(trainer,
+                                  log_handler=OutputHandler(tag="training",
+                                                            output_transform=lambda loss: {"loss": loss}),
+                                  event_name=Events.ITERATION_COMPLETED)
     """
 
-    def __init__(self):
+    def __init__(self, buffer_size=None, flush_secs=1.0):
         try:
             from polyaxon_client.tracking import Experiment
         except ImportError:
@@ -222,6 +241,40 @@ class PolyaxonLogger(BaseLogger):
 
         self.experiment = Experiment()
 
+        self._flusher = None
+        if buffer_size is not None:
+            self._flusher = _BackgroundFlusher(self._log_batch, buffer_size=buffer_size, flush_secs=flush_secs)
+
+    def log_metrics(self, **metrics):
+        """Log metrics to the experiment, see `Experiment.log_metrics`. With buffering, metrics are only
+        stored in memory and sent later from a background thread.
+
+        Args:
+            **metrics: metric names and values, optionally with the `step` key.
+        """
+        if self._flusher is None:
+            self.experiment.log_metrics(**metrics)
+            return
+
+        self._flusher.put(metrics)
+
+    def _log_batch(self, records):
+        merged = []
+        for metrics in records:
+            last = merged[-1] if len(merged) > 0 else None
+            if last is not None and metrics.get("step") is not None and last.get("step") == metrics["step"] and \
+                    not any(k in last for k in metrics if k != "step"):
+                last.update(metrics)
+            else:
+                merged.append(dict(metrics))
+
+        for metrics in merged:
+            self.experiment.log_metrics(**metrics)
+
+    def close(self):
+        if self._flusher is not None:
+            self._flusher.close()
+
     def __getattr__(self, attr):
         def wrapper(*args, **kwargs):
             return getattr(self.experiment, attr)(*args, **kwargs)
@@ -1,10 +1,11 @@
 import numbers
+import time
 
 import warnings
 import torch
 
 from ignite.contrib.handlers.base_logger import BaseLogger, BaseOptimizerParamsHandler, BaseOutputHandler, \
-    BaseWeightsScalarHandler, BaseWeightsHistHandler, global_step_from_engine
+    BaseWeightsScalarHandler, BaseWeightsHistHandler, global_step_from_engine, _BackgroundFlusher
 
 
 __all__ = ['TensorboardLogger', 'OptimizerParamsHandler', 'OutputHandler',
@@ -194,16 +195,56 @@ class WeightsScalarHandler(BaseWeightsScalarHandler):
 
         global_step = engine.state.get_event_attrib_value(event_name)
         tag_prefix = "{}/".format(self.tag) if self.tag else ""
-        for name, p in self.model.named_parameters():
-            if p.grad is None:
-                continue
-
+        params = [(name, p) for name, p in self.model.named_parameters() if p.grad is not None]
+        values = self._reduce([p.data for _, p in params])
+        for (name, _), value in zip(params, values):
             name = name.replace('.', '/')
             logger.writer.add_scalar("{}weights_{}/{}".format(tag_prefix, self.reduction.__name__, name),
-                                     self.reduction(p.data),
+                                     value,
                                      global_step)
 
 
+def _check_histogram_args(bins, sample_size):
+    if bins is not None and (not isinstance(bins, int) or bins < 1):
+        raise ValueError("Argument bins should be a positive integer, but given {}".format(bins))
+
+    if sample_size is not None and (not isinstance(sample_size, int) or sample_size < 1):
+        raise ValueError("Argument sample_size should be a positive integer, but given {}".format(sample_size))
+
+
+def _add_histogram(writer, tag, values, global_step, bins=None, sample_size=None):
+    """Helper method to log a histogram of `values`, optionally on a uniform random sample of at most `sample_size`
+    elements. If `bins` is provided, the histogram is computed on the device of `values` with `torch.histc` and only
+    summary statistics and bin counts are moved to CPU and passed to `writer.add_histogram_raw`.
+    """
+    values = values.detach()
+    if sample_size is not None and values.numel() > sample_size:
+        values = values.reshape(-1)
+        indices = torch.randint(values.numel(), (sample_size,), device=values.device)
+        values = values[indices]
+
+    if bins is None:
+        writer.add_histogram(tag=tag, values=values.cpu().numpy(), global_step=global_step)
+        return
+
+    values = values.reshape(-1)
+    if not values.is_floating_point():
+        values = values.float()
+
+    stats = torch.stack([values.min(), values.max(), values.sum(), (values * values).sum()]).tolist()
+    vmin, vmax, vsum, vsum_squares = stats
+    if vmin == vmax:
+        # Constant values, e.g. zero-initialized biases: torch.histc would bin over [vmin - 1, vmax + 1]
+        limits = [vmax]
+        counts = [values.numel()]
+    else:
+        # Tensorboard expects right edges of the buckets, first bucket collects values <= vmin
+        limits = torch.linspace(vmin, vmax, bins + 1).tolist()
+        counts = [0] + torch.histc(values, bins=bins, min=vmin, max=vmax).tolist()
+    writer.add_histogram_raw(tag=tag, min=vmin, max=vmax, num=values.numel(), sum=vsum, sum_squares=vsum_squares,
+                             bucket_limits=limits, bucket_counts=counts, global_step=global_step)
+
+
 class WeightsHistHandler(BaseWeightsHistHandler):
     """Helper handler to log model's weights as histograms.
 
@@ -224,11 +265,29 @@ class WeightsHistHandler(BaseWeightsHistHandler):
     Args:
         model (torch.nn.Module): model to log weights
         tag (str, optional): common title for all produced plots. For example, 'generator'
+        bins (int, optional): if provided, histograms with `bins` equal-width bins are computed on the device
+            of the parameters and only the bin counts are passed to the writer. Otherwise, values are copied to
+            numpy and binned by the writer.
+        sample_size (int, optional): if provided, the histogram of a parameter with more than `sample_size` elements
+            is computed on a uniform random sample of `sample_size` elements.
+
+    Note:
+        For large models, e.g. with huge embeddings, logging histograms with `bins` and `sample_size` makes the cost
+        of the handler depend on the number of bins and the sample size instead of the number of parameters:
+
+        .. code-block:: python
+
+            tb_logger.attach(trainer,
+                             log_handler=WeightsHistHandler(model, bins=64, sample_size=100000),
+                             event_name=Events.EPOCH_COMPLETED)
 
     """
 
-    def __init__(self, model, tag=None):
+    def __init__(self, model, tag=None, bins=None, sample_size=None):
         super(WeightsHistHandler, self).__init__(model, tag=tag)
+        _check_histogram_args(bins, sample_size)
+        self.bins = bins
+        self.sample_size = sample_size
 
     def __call__(self, engine, logger, event_name):
         if not isinstance(logger, TensorboardLogger):
@@ -241,9 +300,12 @@ class WeightsHistHandler(BaseWeightsHistHandler):
                 continue
 
             name = name.replace('.', '/')
-            logger.writer.add_histogram(tag="{}weights/{}".format(tag_prefix, name),
-                                        values=p.data.detach().cpu().numpy(),
-                                        global_step=global_step)
+            _add_histogram(logger.writer,
+                           tag="{}weights/{}".format(tag_prefix, name),
+                           values=p.data,
+                           global_step=global_step,
+                           bins=self.bins,
+                           sample_size=self.sample_size)
 
 
 class GradsScalarHandler(BaseWeightsScalarHandler):
@@ -280,13 +342,12 @@ class GradsScalarHandler(BaseWeightsScalarHandler):
 
         global_step = engine.state.get_event_attrib_value(event_name)
         tag_prefix = "{}/".format(self.tag) if self.tag else ""
-        for name, p in self.model.named_parameters():
-            if p.grad is None:
-                continue
-
+        params = [(name, p) for name, p in self.model.named_parameters() if p.grad is not None]
+        values = self._reduce([p.grad for _, p in params])
+        for (name, _), value in zip(params, values):
             name = name.replace('.', '/')
             logger.writer.add_scalar("{}grads_{}/{}".format(tag_prefix, self.reduction.__name__, name),
-                                     self.reduction(p.grad),
+                                     value,
                                      global_step)
 
 
@@ -310,10 +371,28 @@ class GradsHistHandler(BaseWeightsHistHandler):
     Args:
         model (torch.nn.Module): model to log weights
         tag (str, optional): common title for all produced plots. For example, 'generator'
+        bins (int, optional): if provided, histograms with `bins` equal-width bins are computed on the device
+            of the parameters and only the bin counts are passed to the writer. Otherwise, values are copied to
+            numpy and binned by the writer.
+        sample_size (int, optional): if provided, the histogram of a parameter with more than `sample_size` elements
+            is computed on a uniform random sample of `sample_size` elements.
+
+    Note:
+        For large models, e.g. with huge embeddings, logging histograms with `bins` and `sample_size` makes the cost
+        of the handler depend on the number of bins and the sample size instead of the number of parameters:
+
+        .. code-block:: python
+
+            tb_logger.attach(trainer,
+                             log_handler=GradsHistHandler(model, bins=64, sample_size=100000),
+                             event_name=Events.EPOCH_COMPLETED)
 
     """
-    def __init__(self, model, tag=None):
+    def __init__(self, model, tag=None, bins=None, sample_size=None):
         super(GradsHistHandler, self).__init__(model, tag=tag)
+        _check_histogram_args(bins, sample_size)
+        self.bins = bins
+        self.sample_size = sample_size
 
     def __call__(self, engine, logger, event_name):
         if not isinstance(logger, TensorboardLogger):
@@ -326,9 +405,44 @@ class GradsHistHandler(BaseWeightsHistHandler):
                 continue
 
             name = name.replace('.', '/')
-            logger.writer.add_histogram(tag="{}grads/{}".format(tag_prefix, name),
-                                        values=p.grad.detach().cpu().numpy(),
-                                        global_step=global_step)
+            _add_histogram(logger.writer,
+                           tag="{}grads/{}".format(tag_prefix, name),
+                           values=p.grad,
+                           global_step=global_step,
+                           bins=self.bins,
+                           sample_size=self.sample_size)
+
+
+class _BufferedSummaryWriter(object):
+    """Wrapper of SummaryWriter which buffers scalars and writes them in batches from a background thread.
+    Other methods are delegated to the wrapped writer.
+    """
+
+    def __init__(self, writer, buffer_size, flush_secs):
+        self.writer = writer
+        self._flusher = _BackgroundFlusher(self._write_scalars, buffer_size=buffer_size, flush_secs=flush_secs)
+
+    def add_scalar(self, tag, scalar_value, global_step=None, walltime=None):
+        if walltime is None:
+            walltime = time.time()
+        self._flusher.put((tag, scalar_value, global_step, walltime))
+
+    def _write_scalars(self, records):
+        for tag, scalar_value, global_step, walltime in records:
+            self.writer.add_scalar(tag, scalar_value, global_step, walltime)
+
+    def flush(self):
+        self._flusher.flush()
+        self.writer.flush()
+
+    def close(self):
+        try:
+            self._flusher.close()
+        finally:
+            self.writer.close()
+
+    def __getattr__(self, attr):
+        return getattr(self.writer, attr)
 
 
 class TensorboardLogger(BaseLogger):
@@ -345,9 +459,18 @@ class TensorboardLogger(BaseLogger):
 
     Args:
         *args: Positional arguments accepted from :class:`~tensorboardx.SummaryWriter`.
+        buffer_size (int, optional): if provided, `writer.add_scalar` only enqueues the scalar and a background thread
+            writes pending scalars to the event file in batches of `buffer_size` or every `buffer_flush_secs` seconds.
+            Pending scalars are written on :meth:`~ignite.contrib.handlers.tensorboard_logger.TensorboardLogger.close`.
+        buffer_flush_secs (float, optional): maximum time in seconds a scalar is kept in the buffer. Default, 1.0.
         **kwargs: Keyword arguments accepted from :class:`~tensorboardx.SummaryWriter`, for example,
             `log_dir` to setup path to the directory where to log.
 
+    Note:
+        With a buffered writer, logging scalars has almost no cost on the training thread: tensors are converted to
+        numbers and written to the event file in the background. Tensors logged this way should not be modified
+        in-place afterwards.
+
     Examples:
 
         .. code-block:: python
@@ -423,9 +546,24 @@ class TensorboardLogger(BaseLogger):
                                                            output_transform=lambda loss: {'loss': loss}),
                                  event_name=Events.ITERATION_COMPLETED)
 
+        Buffered writer for frequent logging of many scalars, e.g. weights norms of a large model at each iteration:
+
+        .. code-block:: python
+
+            from ignite.contrib.handlers.tensorboard_logger import *
+
+            with TensorboardLogger(log_dir="experiments/tb_logs", buffer_size=10000) as tb_logger:
+
+                tb_logger.attach(trainer,
+                                 log_handler=WeightsScalarHandler(model),
+                                 event_name=Events.ITERATION_COMPLETED)
+
     """
 
     def __init__(self, *args, **kwargs):
+        buffer_size = kwargs.pop("buffer_size", None)
+        buffer_flush_secs = kwargs.pop("buffer_flush_secs", 1.0)
+
         try:
             from tensorboardX import SummaryWriter
         except ImportError:
@@ -437,6 +575,8 @@ class TensorboardLogger(BaseLogger):
                                    "or upgrade PyTorch using your package manager of choice (pip or conda).")
 
         self.writer = SummaryWriter(*args, **kwargs)
+        if buffer_size is not None:
+            self.writer = _BufferedSummaryWriter(self.writer, buffer_size=buffer_size, flush_secs=buffer_flush_secs)
 
     def close(self):
         self.writer.close()
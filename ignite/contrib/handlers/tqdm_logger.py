@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import time
 import warnings
 
 import torch
@@ -20,6 +21,10 @@ class ProgressBar(BaseLogger):
             l_bar='{desc}: {percentage:3.0f}%|' and
             r_bar='| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}{postfix}]'. For more details on the
             formatting, see `tqdm docs <https://tqdm.github.io/docs/tqdm/>`_.
+        refresh_interval (float, optional): if provided, minimum time in seconds between two renderings of the
+            progress bar. Events occurring in between are only counted, output and metrics are not evaluated and the
+            bar is not redrawn. The bar is always rendered when it reaches its total and when it is closed.
+            Useful for fast iterations, e.g. `refresh_interval=0.1`.
         **tqdm_kwargs: kwargs passed to tqdm progress bar.
             By default, progress bar description displays "Epoch [5/10]" where 5 is the current epoch and 10 is the
             number of epochs. If tqdm_kwargs defines `desc`, e.g. "Predictions", than the description is
@@ -66,6 +71,13 @@ class ProgressBar(BaseLogger):
             # Progress bar will looks like
             # Epoch [2/50]: [64/128]  50%|█████      , loss=0.123 [06:17<12:34]
 
+        Render the progress bar at most 10 times per second
+
+        .. code-block:: python
+
+            pbar = ProgressBar(refresh_interval=0.1)
+            pbar.attach(trainer, output_transform=lambda x: {'loss': x})
+
     Note:
         When adding attaching the progress bar to an engine, it is recommend that you replace
         every print operation in the engine's handlers triggered every iteration with
@@ -90,7 +102,7 @@ class ProgressBar(BaseLogger):
 
     def __init__(self, persist=False,
                  bar_format='{desc}[{n_fmt}/{total_fmt}] {percentage:3.0f}%|{bar}{postfix} [{elapsed}<{remaining}]',
-
+                 refresh_interval=None,
                  **tqdm_kwargs):
 
         try:
@@ -103,7 +115,10 @@ class ProgressBar(BaseLogger):
         self.pbar = None
         self.persist = persist
         self.bar_format = bar_format
+        self.refresh_interval = refresh_interval
         self.tqdm_kwargs = tqdm_kwargs
+        self._n_pending = 0
+        self._last_refresh_time = None
 
     def _reset(self, pbar_total):
         self.pbar = self.pbar_cls(
@@ -112,9 +127,27 @@ class ProgressBar(BaseLogger):
             bar_format=self.bar_format,
             **self.tqdm_kwargs
         )
+        self._n_pending = 0
+        self._last_refresh_time = None
+
+    def _should_refresh(self):
+        """Counts the current event and returns True if the progress bar should be rendered."""
+        self._n_pending += 1
+        if self.refresh_interval is None or self._last_refresh_time is None:
+            return True
+        if self.pbar.total is not None and self.pbar.n + self._n_pending >= self.pbar.total:
+            return True
+        return time.time() - self._last_refresh_time >= self.refresh_interval
+
+    def _update(self):
+        self.pbar.update(self._n_pending)
+        self._n_pending = 0
+        self._last_refresh_time = time.time()
 
     def _close(self, engine):
-        if self.pbar:
+        if self.pbar is not None:
+            if self._n_pending > 0:
+                self._update()
             self.pbar.close()
         self.pbar = None
 
@@ -205,7 +238,7 @@ class _OutputHandler(BaseOutputHandler):
     @staticmethod
     def get_max_number_events(event_name, engine):
         if event_name in (Events.ITERATION_STARTED, Events.ITERATION_COMPLETED):
-            return len(engine.state.dataloader)
+            return engine.state.epoch_length
         if event_name in (Events.EPOCH_STARTED, Events.EPOCH_COMPLETED):
             return engine.state.max_epochs
         return 1
@@ -215,6 +248,9 @@ class _OutputHandler(BaseOutputHandler):
         if logger.pbar is None:
             logger._reset(pbar_total=self.get_max_number_events(self.event_name, engine))
 
+        if not logger._should_refresh():
+            return
+
         desc = self.tag
         max_num_of_closing_events = self.get_max_number_events(self.closing_event_name, engine)
         if max_num_of_closing_events > 1:
@@ -242,4 +278,4 @@ class _OutputHandler(BaseOutputHandler):
         if rendered_metrics:
             logger.pbar.set_postfix(**rendered_metrics)
 
-        logger.pbar.update()
+        logger._update()
@@ -1,11 +1,12 @@
 import os
 import numbers
+from collections import OrderedDict
 
 import warnings
 import torch
 
 from ignite.contrib.handlers.base_logger import BaseLogger, BaseOptimizerParamsHandler, BaseOutputHandler, \
-    BaseWeightsScalarHandler, global_step_from_engine
+    BaseWeightsScalarHandler, global_step_from_engine, _BackgroundFlusher
 
 
 __all__ = ['VisdomLogger', 'OptimizerParamsHandler', 'OutputHandler',
@@ -43,6 +44,11 @@ class _BaseVisDrawer(object):
                 }
             }
 
+        flusher = getattr(logger, "_flusher", None)
+        if flusher is not None:
+            flusher.put((self.windows[k], k, v, global_step))
+            return
+
         update = None if self.windows[k]['win'] is None else 'append'
 
         kwargs = {
@@ -262,10 +268,12 @@ class WeightsScalarHandler(BaseWeightsScalarHandler, _BaseVisDrawer):
 
         global_step = engine.state.get_event_attrib_value(event_name)
         tag_prefix = "{}/".format(self.tag) if self.tag else ""
-        for name, p in self.model.named_parameters():
+        params = list(self.model.named_parameters())
+        values = self._reduce([p.data for _, p in params])
+        for (name, _), value in zip(params, values):
             name = name.replace('.', '/')
             k = "{}weights_{}/{}".format(tag_prefix, self.reduction.__name__, name)
-            v = float(self.reduction(p.data))
+            v = float(value)
             self.add_scalar(logger, k, v, event_name, global_step)
 
         logger._save()
@@ -308,10 +316,12 @@ class GradsScalarHandler(BaseWeightsScalarHandler, _BaseVisDrawer):
 
         global_step = engine.state.get_event_attrib_value(event_name)
         tag_prefix = "{}/".format(self.tag) if self.tag else ""
-        for name, p in self.model.named_parameters():
+        params = list(self.model.named_parameters())
+        values = self._reduce([p.grad for _, p in params])
+        for (name, _), value in zip(params, values):
             name = name.replace('.', '/')
             k = "{}grads_{}/{}".format(tag_prefix, self.reduction.__name__, name)
-            v = float(self.reduction(p.grad))
+            v = float(value)
             self.add_scalar(logger, k, v, event_name, global_step)
 
         logger._save()
@@ -333,6 +343,13 @@ class VisdomLogger(BaseLogger):
         num_workers (int, optional): number of workers to use in `concurrent.futures.ThreadPoolExecutor` to post data to
             visdom server. Default, `num_workers=1`. If `num_workers=0` and logger uses the main thread. If using
             Python 2.7 and `num_workers>0` the package `futures` should be installed: `pip install futures`
+        buffer_size (int, optional): if provided, scalars are not sent at each event. A background thread coalesces
+            pending points of each window into a single request when `buffer_size` points are pending or every
+            `flush_secs` seconds, creates new windows on the fly and saves the environment once per flush. In this
+            case `num_workers` is ignored. Pending points are sent on
+            :meth:`~ignite.contrib.handlers.visdom_logger.VisdomLogger.close`.
+        flush_secs (float, optional): maximum time in seconds a point is kept in memory with buffering.
+            Default, 1.0.
         **kwargs: kwargs to pass into
             `visdom.Visdom <https://github.com/facebookresearch/visdom#visdom-arguments-python-only>`_.
 
@@ -344,7 +361,7 @@ class VisdomLogger(BaseLogger):
 
         Frequent logging, e.g. when logger is attached to `Events.ITERATION_COMPLETED`, can slow down the run if the
         main thread is used to send the data to visdom server (`num_workers=0`). To avoid this situation we can either
-        log less frequently or set `num_workers=1`.
+        log less frequently, set `num_workers=1` or set `buffer_size` to send many points in a single request.
 
 
     Examples:
@@ -416,7 +433,7 @@ class VisdomLogger(BaseLogger):
 
     """
 
-    def __init__(self, server=None, port=None, num_workers=1, **kwargs):
+    def __init__(self, server=None, port=None, num_workers=1, buffer_size=None, flush_secs=1.0, **kwargs):
         try:
             import visdom
         except ImportError:
@@ -424,6 +441,9 @@ class VisdomLogger(BaseLogger):
                                "Please install it with command:\n"
                                "pip install git+https://github.com/facebookresearch/visdom.git")
 
+        if buffer_size is not None:
+            num_workers = 0
+
         if num_workers > 0:
             # If visdom is installed, one of its dependencies `tornado`
             # requires also `futures` to be installed.
@@ -464,12 +484,41 @@ class VisdomLogger(BaseLogger):
             from concurrent.futures import ThreadPoolExecutor
             self.executor = ThreadPoolExecutor(max_workers=num_workers)
 
+        self._flusher = None
+        if buffer_size is not None:
+            self._flusher = _BackgroundFlusher(self._send_lines, buffer_size=buffer_size, flush_secs=flush_secs)
+
+    def _send_lines(self, records):
+        # Coalesce points of each window into a single request
+        lines = OrderedDict()
+        for window, k, v, global_step in records:
+            if id(window) not in lines:
+                lines[id(window)] = (window, k, [], [])
+            lines[id(window)][2].append(global_step)
+            lines[id(window)][3].append(v)
+
+        for window, k, xs, ys in lines.values():
+            update = None if window['win'] is None else 'append'
+            win = self.vis.line(X=xs, Y=ys, env=self.vis.env, win=window['win'], update=update,
+                                opts=window['opts'], name=k)
+            if window['win'] is None:
+                window['win'] = win
+
+        self.vis.save([self.vis.env])
+
     def _save(self):
+        if self._flusher is not None:
+            # Environment is saved by the background thread after each flush
+            return
         self.vis.save([self.vis.env])
 
     def close(self):
-        self.vis = None
-        self.executor.shutdown()
+        try:
+            if self._flusher is not None:
+                self._flusher.close()
+        finally:
+            self.vis = None
+            self.executor.shutdown()
 
 
 class _DummyExecutor:
@@ -1,7 +1,13 @@
+from __future__ import division
+
+import logging
+import time
+import warnings
+
 import torch
 
 from ignite.engine.engine import Engine, State, Events
-from ignite.utils import convert_tensor
+from ignite.utils import convert_tensor, BatchConverter
 
 
 def _prepare_batch(batch, device=None, non_blocking=False):
@@ -13,10 +19,180 @@ def _prepare_batch(batch, device=None, non_blocking=False):
             convert_tensor(y, device=device, non_blocking=non_blocking))
 
 
+def _get_prepare_batch_fn(prepare_batch, device, non_blocking):
+    if prepare_batch is not _prepare_batch:
+        def _prepare(batch):
+            return prepare_batch(batch, device=device, non_blocking=non_blocking)
+        return _prepare
+
+    # Default preparation: batches are converted by a converter specialized for their structure
+    converter = BatchConverter(device=device, non_blocking=non_blocking)
+
+    def _prepare(batch):
+        x, y = converter(batch)
+        return x, y
+    return _prepare
+
+
+def _split_batch(input_, size):
+    # Splits tensors of a tensor, list/tuple or dict of tensors along the first dimension into chunks of `size`
+    if isinstance(input_, torch.Tensor):
+        return list(torch.split(input_, size))
+    elif isinstance(input_, dict):
+        chunks = {k: _split_batch(v, size) for k, v in input_.items()}
+        num_chunks = len(next(iter(chunks.values())))
+        return [{k: c[i] for k, c in chunks.items()} for i in range(num_chunks)]
+    elif isinstance(input_, (list, tuple)):
+        chunks = [_split_batch(v, size) for v in input_]
+        return [type(input_)(c[i] for c in chunks) for i in range(len(chunks[0]))]
+    raise TypeError("Batch to split into micro-batches should contain tensors, dicts or lists; "
+                    "found {}".format(type(input_)))
+
+
+def _concat_outputs(outputs):
+    # Concatenates chunks of model's outputs, inverse of `_split_batch`
+    if isinstance(outputs[0], torch.Tensor):
+        return torch.cat([o.detach() for o in outputs])
+    elif isinstance(outputs[0], dict):
+        return {k: _concat_outputs([o[k] for o in outputs]) for k in outputs[0]}
+    elif isinstance(outputs[0], (list, tuple)):
+        return type(outputs[0])(_concat_outputs(list(o)) for o in zip(*outputs))
+    return outputs
+
+
+def _num_samples(input_):
+    if isinstance(input_, torch.Tensor):
+        return len(input_)
+    elif isinstance(input_, dict):
+        return _num_samples(next(iter(input_.values())))
+    return _num_samples(input_[0])
+
+
+class _CompiledModel(object):
+    # Callable running a compiled version of the model: TorchScript traced per input signature (shapes, dtypes and
+    # devices of the input tensors), TorchScript scripted or `torch.compile`. Falls back to the eager model if the
+    # compilation fails. A trace is checked against the eager model and any tracer warning, e.g. about data-dependent
+    # control flow, is considered as a failure. Errors raised when running the compiled model are not caught.
+
+    modes = ("trace", "script", "compile")
+
+    def __init__(self, model, mode):
+        if mode not in self.modes:
+            raise ValueError("Argument compile should be one of {}, but given {}".format(self.modes, mode))
+        if mode == "compile" and not hasattr(torch, "compile"):
+            warnings.warn("torch.compile is not available in this version of PyTorch, model is run in eager mode")
+        self.model = model
+        self.mode = mode
+        self.compile_time = 0.0
+        self._compiled = {}
+        self._logger = logging.getLogger(__name__ + "." + self.__class__.__name__)
+
+    def __call__(self, x):
+        # Scripted and torch.compile models handle any input signature
+        key = _input_signature(x) if self.mode == "trace" else None
+        fn = self._compiled.get(key)
+        if fn is not None:
+            return fn(x)
+
+        start_time = time.time()
+        try:
+            fn = self._compile(x)
+            if self.mode == "compile":
+                # torch.compile compiles the model on its first call
+                output = fn(x)
+        except _compilation_errors(self.mode) as e:
+            warnings.warn("Failed to compile the model with mode '{}', it is run in eager mode: "
+                          "{}".format(self.mode, e))
+            self._compiled[key] = self.model
+            return self.model(x)
+
+        self._compiled[key] = fn
+        if self.mode != "compile":
+            output = fn(x)
+
+        # Compilation time includes the first run of the compiled model
+        time_taken = time.time() - start_time
+        self.compile_time += time_taken
+        self._logger.info("Model compiled with mode '{}' in {:.3f} sec".format(self.mode, time_taken))
+        return output
+
+    def _compile(self, x):
+        if self.mode == "trace":
+            # The model is run several times to check the trace, its buffers (e.g. running statistics) are restored
+            buffers = [b.clone() for b in self.model.buffers()]
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("error", torch.jit.TracerWarning)
+                    return torch.jit.trace(self.model, (x, ), check_trace=True)
+            finally:
+                with torch.no_grad():
+                    for b, value in zip(self.model.buffers(), buffers):
+                        b.copy_(value)
+        elif self.mode == "script":
+            return torch.jit.script(self.model)
+        elif hasattr(torch, "compile"):
+            return torch.compile(self.model)
+        return self.model
+
+
+def _compilation_errors(mode):
+    # Exceptions raised by a failed compilation: torch.jit.trace and torch.jit.script compile the model eagerly,
+    # whereas torch.compile raises its own exceptions on the first call of the compiled model
+    if mode != "compile":
+        return Exception
+    try:
+        from torch._dynamo.exc import TorchDynamoException
+    except ImportError:
+        return ()
+    return TorchDynamoException
+
+
+def _input_signature(x):
+    if isinstance(x, torch.Tensor):
+        return tuple(x.shape), x.dtype, x.device
+    elif isinstance(x, (list, tuple)):
+        return tuple(_input_signature(v) for v in x)
+    elif isinstance(x, dict):
+        return tuple((k, _input_signature(v)) for k, v in sorted(x.items()))
+    return type(x)
+
+
+def _cast_floating(output, dtype):
+    # Casts floating point tensors of model's output to `dtype`
+    if isinstance(output, torch.Tensor):
+        return output.to(dtype) if output.is_floating_point() and output.dtype != dtype else output
+    elif isinstance(output, dict):
+        return {k: _cast_floating(v, dtype) for k, v in output.items()}
+    elif isinstance(output, (list, tuple)):
+        return type(output)(_cast_floating(v, dtype) for v in output)
+    return output
+
+
+def _get_forward_fn(model, device, compile, autocast_dtype):
+    compiled_model = _CompiledModel(model, compile) if compile is not None else None
+    forward = compiled_model if compiled_model is not None else model
+    if autocast_dtype is None:
+        return forward, compiled_model
+
+    if not hasattr(torch, "autocast"):
+        raise RuntimeError("Argument autocast_dtype requires torch.autocast, available in PyTorch >= 1.10")
+    device_type = torch.device(device).type if device else "cpu"
+    output_dtype = torch.get_default_dtype()
+
+    def _forward(x):
+        with torch.autocast(device_type=device_type, dtype=autocast_dtype):
+            y_pred = forward(x)
+        # Losses and metrics are computed from full precision predictions
+        return _cast_floating(y_pred, output_dtype)
+
+    return _forward, compiled_model
+
+
 def create_supervised_trainer(model, optimizer, loss_fn,
                               device=None, non_blocking=False,
                               prepare_batch=_prepare_batch,
-                              output_transform=lambda x, y, y_pred, loss: loss.item()):
+                              output_transform=lambda x, y, y_pred, loss: loss.item(),
+                              accumulation_steps=1, micro_batch_size=None, compile=None, autocast_dtype=None):
     """
     Factory function for creating a trainer for supervised models.
 
@@ -29,36 +205,131 @@ def create_supervised_trainer(model, optimizer, loss_fn,
         non_blocking (bool, optional): if True and this copy is between CPU and GPU, the copy may occur asynchronously
             with respect to the host. For other cases, this argument has no effect.
         prepare_batch (callable, optional): function that receives `batch`, `device`, `non_blocking` and outputs
-            tuple of tensors `(batch_x, batch_y)`.
+            tuple of tensors `(batch_x, batch_y)`. By default, batches are moved to `device` by a
+            :class:`~ignite.utils.BatchConverter`.
         output_transform (callable, optional): function that receives 'x', 'y', 'y_pred', 'loss' and returns value
             to be assigned to engine's state.output after each iteration. Default is returning `loss.item()`.
+        accumulation_steps (int, optional): number of iterations over which gradients are accumulated before
+            each optimizer's step (default: 1). Losses are divided by `accumulation_steps`, such that the gradient
+            is the average of the gradients of the batches.
+        micro_batch_size (int, optional): if provided, each batch is split into micro-batches of this size along
+            the first dimension. Forward and backward passes are run on each micro-batch, with the loss scaled by
+            the micro-batch's share of the batch. `loss_fn` should be a mean over the samples.
+        compile (str, optional): if provided, the model is compiled on the first batch: "script" scripts it with
+            TorchScript and "compile" uses `torch.compile` (PyTorch >= 2.0). If the compilation fails, the model is
+            run in eager mode. The time spent compiling is stored in `engine.state.compile_time`. Tracing ("trace")
+            is only supported by :meth:`~ignite.engine.create_supervised_evaluator`: checking a trace runs the model
+            several times and fails for models with random or batch-dependent layers in training mode, e.g.
+            `Dropout` and `BatchNorm`.
+        autocast_dtype (torch.dtype, optional): if provided, the forward pass of the model runs under
+            `torch.autocast` with this dtype, e.g. `torch.bfloat16` on CPU or `torch.float16` on CUDA. Predictions
+            are cast back to the default floating point dtype before the loss is computed. With `torch.float16`,
+            the loss is scaled with `torch.cuda.amp.GradScaler`; `torch.bfloat16` does not need scaling.
 
     Note: `engine.state.output` for this engine is defind by `output_transform` parameter and is the loss
         of the processed batch by default.
 
+    Note: with micro-batches, `y_pred` passed to `output_transform` is the concatenation of the (detached)
+        predictions of the micro-batches and `loss` is the loss of the whole batch, as without micro-batches.
+        With `accumulation_steps`, the optimizer makes a step every `accumulation_steps` iterations, counted
+        from the start of each epoch. If the epoch ends, or the run is terminated, with fewer accumulated
+        iterations, the gradients are averaged over these iterations and the optimizer makes a last step.
+
     Returns:
         Engine: a trainer engine with supervised update function.
     """
+    if not (isinstance(accumulation_steps, int) and accumulation_steps > 0):
+        raise ValueError("Argument accumulation_steps should be a positive integer, "
+                         "but given {}".format(accumulation_steps))
+
+    if micro_batch_size is not None and not (isinstance(micro_batch_size, int) and micro_batch_size > 0):
+        raise ValueError("Argument micro_batch_size should be a positive integer, "
+                         "but given {}".format(micro_batch_size))
+
+    if compile == "trace":
+        raise ValueError("Argument compile of create_supervised_trainer can not be 'trace', which is only "
+                         "supported by create_supervised_evaluator")
+
     if device:
         model.to(device)
 
+    prepare_batch_fn = _get_prepare_batch_fn(prepare_batch, device, non_blocking)
+    forward, compiled_model = _get_forward_fn(model, device, compile, autocast_dtype)
+    scaler = torch.cuda.amp.GradScaler() if autocast_dtype == torch.float16 else None
+
+    def _backward(loss):
+        (scaler.scale(loss) if scaler is not None else loss).backward()
+
+    def _step():
+        if scaler is not None:
+            scaler.step(optimizer)
+            scaler.update()
+        else:
+            optimizer.step()
+
+    def _forward_backward(x, y):
+        if micro_batch_size is None:
+            y_pred = forward(x)
+            loss = loss_fn(y_pred, y)
+            _backward(loss / accumulation_steps if accumulation_steps > 1 else loss)
+            return y_pred, loss
+
+        num_samples = _num_samples(y)
+        y_preds = []
+        loss = 0.0
+        for x_chunk, y_chunk in zip(_split_batch(x, micro_batch_size), _split_batch(y, micro_batch_size)):
+            y_pred = forward(x_chunk)
+            chunk_loss = loss_fn(y_pred, y_chunk) * (_num_samples(y_chunk) / num_samples)
+            _backward(chunk_loss / accumulation_steps)
+            y_preds.append(y_pred)
+            loss = loss + chunk_loss.detach()
+        return _concat_outputs(y_preds), loss
+
+    # Number of iterations whose gradients are accumulated and not yet applied
+    accumulated = [0]
+
     def _update(engine, batch):
         model.train()
-        optimizer.zero_grad()
-        x, y = prepare_batch(batch, device=device, non_blocking=non_blocking)
-        y_pred = model(x)
-        loss = loss_fn(y_pred, y)
-        loss.backward()
-        optimizer.step()
+        if accumulated[0] == 0:
+            optimizer.zero_grad()
+        x, y = prepare_batch_fn(batch)
+        y_pred, loss = _forward_backward(x, y)
+        accumulated[0] += 1
+        if accumulated[0] == accumulation_steps:
+            _step()
+            accumulated[0] = 0
+        if compiled_model is not None:
+            engine.state.compile_time = compiled_model.compile_time
         return output_transform(x, y, y_pred, loss)
 
-    return Engine(_update)
+    engine = Engine(_update)
+
+    @engine.on(Events.STARTED)
+    def _reset_accumulation(engine):
+        accumulated[0] = 0
+
+    @engine.on(Events.EPOCH_COMPLETED)
+    @engine.on(Events.COMPLETED)
+    def _step_accumulated(engine):
+        if accumulated[0] == 0:
+            return
+        # Losses were divided by accumulation_steps, gradients are rescaled to the average of the accumulated ones
+        scale = accumulation_steps / accumulated[0]
+        for group in optimizer.param_groups:
+            for p in group["params"]:
+                if p.grad is not None:
+                    p.grad.mul_(scale)
+        _step()
+        accumulated[0] = 0
+
+    return engine
 
 
 def create_supervised_evaluator(model, metrics=None,
                                 device=None, non_blocking=False,
                                 prepare_batch=_prepare_batch,
-                                output_transform=lambda x, y, y_pred: (y_pred, y,)):
+                                output_transform=lambda x, y, y_pred: (y_pred, y,), compile=None,
+                                autocast_dtype=None):
     """
     Factory function for creating an evaluator for supervised models.
 
@@ -70,10 +341,18 @@ def create_supervised_evaluator(model, metrics=None,
         non_blocking (bool, optional): if True and this copy is between CPU and GPU, the copy may occur asynchronously
             with respect to the host. For other cases, this argument has no effect.
         prepare_batch (callable, optional): function that receives `batch`, `device`, `non_blocking` and outputs
-            tuple of tensors `(batch_x, batch_y)`.
+            tuple of tensors `(batch_x, batch_y)`. By default, batches are moved to `device` by a
+            :class:`~ignite.utils.BatchConverter`.
         output_transform (callable, optional): function that receives 'x', 'y', 'y_pred' and returns value
             to be assigned to engine's state.output after each iteration. Default is returning `(y_pred, y,)` which fits
             output expected by metrics. If you change it you should use `output_transform` in metrics.
+        compile (str, optional): if provided, the model is compiled on the first batch: "trace" traces it with
+            TorchScript for each input signature (shapes, dtypes and devices of the input tensors), "script" scripts
+            it with TorchScript and "compile" uses `torch.compile` (PyTorch >= 2.0). If the compilation fails, the
+            model is run in eager mode. The time spent compiling is stored in `engine.state.compile_time`.
+        autocast_dtype (torch.dtype, optional): if provided, the forward pass of the model runs under
+            `torch.autocast` with this dtype, e.g. `torch.bfloat16` on CPU. Predictions are cast back to the
+            default floating point dtype, such that metrics accumulate in full precision.
 
     Note: `engine.state.output` for this engine is defind by `output_transform` parameter and is
         a tuple of `(batch_pred, batch_y)` by default.
@@ -86,11 +365,16 @@ def create_supervised_evaluator(model, metrics=None,
     if device:
         model.to(device)
 
+    prepare_batch_fn = _get_prepare_batch_fn(prepare_batch, device, non_blocking)
+    forward, compiled_model = _get_forward_fn(model, device, compile, autocast_dtype)
+
     def _inference(engine, batch):
         model.eval()
         with torch.no_grad():
-            x, y = prepare_batch(batch, device=device, non_blocking=non_blocking)
-            y_pred = model(x)
+            x, y = prepare_batch_fn(batch)
+            y_pred = forward(x)
+            if compiled_model is not None:
+                engine.state.compile_time = compiled_model.compile_time
             return output_transform(x, y, y_pred)
 
     engine = Engine(_inference)
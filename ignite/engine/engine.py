@@ -135,6 +135,7 @@ class Engine(object):
         self.should_terminate = False
         self.should_terminate_single_epoch = False
         self.state = None
+        self._dataloader_iter = None
         self._allowed_events = []
 
         self.register_events(*Events)
@@ -380,11 +381,35 @@ class Engine(object):
                           "Current epoch iteration will stop after current iteration is finished.")
         self.should_terminate_single_epoch = True
 
+    def _epoch_batches(self):
+        if self._dataloader_iter is None:
+            # Epoch is a full pass over the data
+            for batch in self.state.dataloader:
+                yield batch
+            return
+
+        # Epoch is `epoch_length` iterations over a persistent iterator which is only re-created when exhausted
+        for _ in range(self.state.epoch_length):
+            try:
+                batch = next(self._dataloader_iter)
+            except StopIteration:
+                self._dataloader_iter = iter(self.state.dataloader)
+                try:
+                    batch = next(self._dataloader_iter)
+                except StopIteration:
+                    self._logger.warning("Data iterator can not provide data anymore but required total number of "
+                                         "iterations to run is not reached. Current iteration: {} vs Total "
+                                         "iterations to run: {}"
+                                         .format(self.state.iteration, self.state.epoch_length * self.state.max_epochs))
+                    self.should_terminate = True
+                    return
+            yield batch
+
     def _run_once_on_dataset(self):
         start_time = time.time()
 
         try:
-            for batch in self.state.dataloader:
+            for batch in self._epoch_batches():
                 self.state.batch = batch
                 self.state.iteration += 1
                 self._fire_event(Events.ITERATION_STARTED)
@@ -409,19 +434,49 @@ class Engine(object):
         else:
             raise e
 
-    def run(self, data, max_epochs=1):
+    def _setup_run(self, data, max_epochs, epoch_length, persistent_iterator):
+        if epoch_length is not None:
+            if not (isinstance(epoch_length, int) and epoch_length > 0):
+                raise ValueError("Argument epoch_length should be a positive integer, but given {}"
+                                 .format(epoch_length))
+            persistent_iterator = True
+        elif hasattr(data, "__len__"):
+            epoch_length = len(data)
+        elif persistent_iterator:
+            raise ValueError("Argument epoch_length should be provided if persistent_iterator is True "
+                             "and data has no length")
+
+        self.state = State(dataloader=data, max_epochs=max_epochs, epoch_length=epoch_length, metrics={})
+        self.should_terminate = self.should_terminate_single_epoch = False
+        self._dataloader_iter = iter(_repeat_dataloader(data)) if persistent_iterator else None
+
+    def run(self, data, max_epochs=1, epoch_length=None, persistent_iterator=False):
         """Runs the process_function over the passed data.
 
         Args:
             data (Iterable): Collection of batches allowing repeated iteration (e.g., list or `DataLoader`).
             max_epochs (int, optional): max epochs to run for (default: 1).
+            epoch_length (int, optional): number of iterations to count as one epoch. If provided, a single
+                iterator over `data` is kept across epochs and is only re-created when it is exhausted, such that
+                `data` can be an infinite iterator or a stream. By default, an epoch is a full pass over `data`.
+            persistent_iterator (bool, optional): if True, a single iterator over `data` is kept for the whole run
+                instead of iterating over `data` once per epoch. If `data` is a `torch.utils.data.DataLoader` over a
+                map-style dataset, its batch sampler is repeated such that worker processes are started only once
+                per run. Epochs are `epoch_length` iterations, `len(data)` by default.
 
         Returns:
             State: output state.
-        """
 
-        self.state = State(dataloader=data, max_epochs=max_epochs, metrics={})
-        self.should_terminate = self.should_terminate_single_epoch = False
+        Note:
+            `engine.state.epoch_length` holds the number of iterations of an epoch: `epoch_length` if provided,
+            otherwise `len(data)` if `data` has a length and None otherwise.
+
+        Note:
+            With `persistent_iterator=True`, worker processes of a `DataLoader` prefetch batches of the next epoch
+            before `Events.EPOCH_STARTED` is fired. A sampler that is configured on this event, e.g. with
+            `DistributedSampler.set_epoch`, can therefore not be updated between epochs.
+        """
+        self._setup_run(data, max_epochs, epoch_length, persistent_iterator)
 
         try:
             self._logger.info("Engine run starting with max_epochs={}.".format(max_epochs))
@@ -444,5 +499,53 @@ class Engine(object):
         except BaseException as e:
             self._logger.error("Engine run is terminating due to exception: %s.", str(e))
             self._handle_exception(e)
+        finally:
+            self._dataloader_iter = None
 
         return self.state
+
+
+class _RepeatedBatchSampler(object):
+    # Iterates over the batch sampler again and again, such that a single DataLoader iterator spans all epochs
+    def __init__(self, batch_sampler):
+        self.batch_sampler = batch_sampler
+
+    def __iter__(self):
+        while True:
+            empty = True
+            for batch in self.batch_sampler:
+                empty = False
+                yield batch
+            if empty:
+                return
+
+    def __len__(self):
+        return len(self.batch_sampler)
+
+
+def _repeat_dataloader(data):
+    from torch.utils.data import DataLoader
+
+    if not isinstance(data, DataLoader) or data.batch_sampler is None or data.num_workers == 0:
+        return data
+    if not hasattr(data.sampler, "__len__"):
+        # iterable-style dataset
+        return data
+    return _with_batch_sampler(data, _RepeatedBatchSampler(data.batch_sampler))
+
+
+def _with_batch_sampler(data, batch_sampler):
+    # Copy of the DataLoader `data` with another batch sampler
+    from torch.utils.data import DataLoader
+
+    kwargs = {}
+    # Arguments of recent versions of DataLoader
+    for name in ("multiprocessing_context", "generator", "prefetch_factor", "persistent_workers", "pin_memory_device"):
+        if hasattr(data, name):
+            kwargs[name] = getattr(data, name)
+    if data.num_workers == 0:
+        kwargs.pop("prefetch_factor", None)
+        kwargs.pop("persistent_workers", None)
+    return DataLoader(data.dataset, batch_sampler=batch_sampler,
+                      num_workers=data.num_workers, collate_fn=data.collate_fn, pin_memory=data.pin_memory,
+                      timeout=data.timeout, worker_init_fn=data.worker_init_fn, **kwargs)
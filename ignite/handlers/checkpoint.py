@@ -1,7 +1,13 @@
+import heapq
+import json
 import os
 import tempfile
+import warnings
 
 import torch
+from torch._six import string_classes
+
+from ignite._utils import _replace
 
 
 class ModelCheckpoint(object):
@@ -44,6 +50,12 @@ class ModelCheckpoint(object):
             If True, will create directory 'dirname' if it doesnt exist.
         save_as_state_dict (bool, optional):
             If True, will save only the `state_dict` of the objects specified, otherwise the whole object will be saved.
+        save_manifest (bool, optional):
+            If True, the set of retained checkpoints is written to `{filename_prefix}_manifest.json` in 'dirname'
+            after every save and loaded back on construction, so that retention and step numbering (as of the last
+            save) survive process restarts without rescanning the directory. Use it with `require_empty=False` to
+            resume. An invalid manifest raises a `ValueError`, checkpoints listed in it whose files are missing are
+            not retained.
 
     Note:
           This handler expects two arguments: an :class:`~ignite.engine.Engine` object and a `dict`
@@ -62,6 +74,10 @@ class ModelCheckpoint(object):
           For example, `score_name="val_loss"` and `score_function` that returns `-loss` (as objects with highest scores
           will be retained), then saved models filenames will be `model_resnet_10_val_loss=0.1234.pth`.
 
+          Retained checkpoints are kept in a min-heap ordered by score (ties are broken by age), so the decision to
+          keep or discard a new checkpoint is logarithmic in `n_saved`. Objects are serialized only if the new score
+          is strictly greater than the lowest retained one: a tie never triggers a save.
+
     Examples:
         >>> import os
         >>> from ignite.engine import Engine, Events
@@ -81,7 +97,8 @@ class ModelCheckpoint(object):
                  n_saved=1,
                  atomic=True, require_empty=True,
                  create_dir=True,
-                 save_as_state_dict=True):
+                 save_as_state_dict=True,
+                 save_manifest=False):
 
         self._dirname = os.path.expanduser(dirname)
         self._fname_prefix = filename_prefix
@@ -90,9 +107,10 @@ class ModelCheckpoint(object):
         self._score_function = score_function
         self._score_name = score_name
         self._atomic = atomic
-        self._saved = []  # list of tuples (priority, saved_objects)
+        self._saved = []  # min-heap of tuples (priority, iteration, saved_objects)
         self._iteration = 0
         self._save_as_state_dict = save_as_state_dict
+        self._manifest_path = None
 
         if not (save_interval is None) ^ (score_function is None):
             raise ValueError("Exactly one of `save_interval`, or `score_function` "
@@ -121,6 +139,81 @@ class ModelCheckpoint(object):
                                  "directory anyway, pass `require_empty=False`."
                                  "".format(filename_prefix, dirname))
 
+        if save_manifest:
+            self._manifest_path = os.path.join(self._dirname, "{}_manifest.json".format(self._fname_prefix))
+            if os.path.exists(self._manifest_path):
+                self._load_manifest()
+
+    def _load_manifest(self):
+        with open(self._manifest_path, "r") as f:
+            try:
+                manifest = json.load(f)
+            except ValueError as e:
+                raise ValueError("Manifest {} is not valid JSON: {}".format(self._manifest_path, e))
+
+        def _check(condition, msg):
+            if not condition:
+                raise ValueError("Manifest {} is invalid: {}".format(self._manifest_path, msg))
+
+        _check(isinstance(manifest, dict) and "iteration" in manifest and "saved" in manifest,
+               "expected a mapping with keys 'iteration' and 'saved'")
+        iteration = manifest["iteration"]
+        _check(isinstance(iteration, int) and iteration >= 0,
+               "'iteration' should be a non-negative integer, but given {}".format(iteration))
+        _check(isinstance(manifest["saved"], list), "'saved' should be a list")
+
+        saved = []
+        for entry in manifest["saved"]:
+            _check(isinstance(entry, list) and len(entry) == 3, "invalid entry {}".format(entry))
+            priority, entry_iteration, fnames = entry
+            _check(isinstance(priority, (int, float)) and not isinstance(priority, bool),
+                   "invalid priority in entry {}".format(entry))
+            _check(isinstance(entry_iteration, int) and 0 < entry_iteration <= iteration,
+                   "invalid iteration in entry {}".format(entry))
+            _check(isinstance(fnames, list) and len(fnames) > 0, "invalid file names in entry {}".format(entry))
+            for fname in fnames:
+                # Only checkpoints of this handler in 'dirname' can be retained, and removed
+                valid = isinstance(fname, string_classes) and os.path.basename(fname) == fname
+                _check(valid and fname.startswith(self._fname_prefix + "_") and fname.endswith(".pth"),
+                       "invalid file name {}".format(fname))
+
+            paths = [os.path.join(self._dirname, fname) for fname in fnames]
+            missing = [p for p in paths if not os.path.exists(p)]
+            if len(missing) > 0:
+                warnings.warn("Checkpoint files {} listed in manifest {} are not found, they are not "
+                              "retained".format(missing, self._manifest_path))
+                continue
+            saved.append((priority, entry_iteration, paths))
+
+        self._iteration = iteration
+        self._saved = saved
+        heapq.heapify(self._saved)
+
+        # The manifest may have been written with a larger `n_saved`: the lowest checkpoints are removed
+        if len(self._saved) > self._n_saved:
+            while len(self._saved) > self._n_saved:
+                _, _, paths = heapq.heappop(self._saved)
+                for p in paths:
+                    os.remove(p)
+            self._write_manifest()
+
+    def _write_manifest(self):
+        manifest = {
+            "iteration": self._iteration,
+            "saved": [(float(priority), iteration, [os.path.basename(p) for p in paths])
+                      for priority, iteration, paths in sorted(self._saved)]
+        }
+        tmp = tempfile.NamedTemporaryFile(mode="w", delete=False, dir=self._dirname)
+        try:
+            json.dump(manifest, tmp)
+        except BaseException:
+            tmp.close()
+            os.remove(tmp.name)
+            raise
+        else:
+            tmp.close()
+            _replace(tmp.name, self._manifest_path)
+
     def _save(self, obj, path):
         if not self._atomic:
             self._internal_save(obj, path)
@@ -158,24 +251,29 @@ class ModelCheckpoint(object):
             if (self._iteration % self._save_interval) != 0:
                 return
 
-        if (len(self._saved) < self._n_saved) or (self._saved[0][0] < priority):
-            saved_objs = []
+        if len(self._saved) >= self._n_saved and priority <= self._saved[0][0]:
+            return
 
-            suffix = ""
-            if self._score_name is not None:
-                suffix = "_{}={:.7}".format(self._score_name, abs(priority))
+        saved_objs = []
 
-            for name, obj in to_save.items():
-                fname = '{}_{}_{}{}.pth'.format(self._fname_prefix, name, self._iteration, suffix)
-                path = os.path.join(self._dirname, fname)
+        suffix = ""
+        if self._score_name is not None:
+            suffix = "_{}={:.7}".format(self._score_name, abs(priority))
 
-                self._save(obj=obj, path=path)
-                saved_objs.append(path)
+        for name, obj in to_save.items():
+            fname = '{}_{}_{}{}.pth'.format(self._fname_prefix, name, self._iteration, suffix)
+            path = os.path.join(self._dirname, fname)
 
-            self._saved.append((priority, saved_objs))
-            self._saved.sort(key=lambda item: item[0])
+            self._save(obj=obj, path=path)
+            saved_objs.append(path)
 
-        if len(self._saved) > self._n_saved:
-            _, paths = self._saved.pop(0)
+        item = (priority, self._iteration, saved_objs)
+        if len(self._saved) < self._n_saved:
+            heapq.heappush(self._saved, item)
+        else:
+            _, _, paths = heapq.heapreplace(self._saved, item)
             for p in paths:
                 os.remove(p)
+
+        if self._manifest_path is not None:
+            self._write_manifest()
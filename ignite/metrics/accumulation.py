@@ -93,6 +93,9 @@ class Average(VariableAccumulation):
             you want to compute the metric with respect to one of the outputs.
 
     """
+
+    _additive_state = ("accumulator", "num_examples")
+
     def __init__(self, output_transform=lambda x: x):
 
         def _mean_op(a, x):
@@ -129,6 +132,9 @@ class GeometricAverage(VariableAccumulation):
             you want to compute the metric with respect to one of the outputs.
 
     """
+
+    _additive_state = ("accumulator", "num_examples")
+
     def __init__(self, output_transform=lambda x: x):
 
         def _geom_op(a, x):
@@ -110,6 +110,8 @@ class Accuracy(_BaseClassification):
         is_multilabel (bool, optional): flag to use in multilabel case. By default, False.
     """
 
+    _additive_state = ("_num_correct", "_num_examples")
+
     def __init__(self, output_transform=lambda x: x, is_multilabel=False):
         self._num_correct = None
         self._num_examples = None
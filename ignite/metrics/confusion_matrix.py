@@ -34,6 +34,8 @@ class ConfusionMatrix(Metric):
 
     """
 
+    _additive_state = ("confusion_matrix", "_num_examples")
+
     def __init__(self, num_classes, average=None, output_transform=lambda x: x):
         if average is not None and average not in ("samples", "recall", "precision"):
             raise ValueError("Argument average can None or one of ['samples', 'recall', 'precision']")
@@ -25,6 +25,8 @@ class Loss(Metric):
 
     """
 
+    _additive_state = ("_sum", "_num_examples")
+
     def __init__(self, loss_fn, output_transform=lambda x: x,
                  batch_size=lambda x: len(x)):
         super(Loss, self).__init__(output_transform)
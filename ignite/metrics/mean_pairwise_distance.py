@@ -13,6 +13,9 @@ class MeanPairwiseDistance(Metric):
 
     - `update` must receive output of the form `(y_pred, y)`.
     """
+
+    _additive_state = ("_sum_of_distances", "_num_examples")
+
     def __init__(self, p=2, eps=1e-6, output_transform=lambda x: x):
         super(MeanPairwiseDistance, self).__init__(output_transform)
         self._p = p
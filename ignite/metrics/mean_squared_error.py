@@ -12,6 +12,9 @@ class MeanSquaredError(Metric):
 
     - `update` must receive output of the form `(y_pred, y)`.
     """
+
+    _additive_state = ("_sum_of_squared_errors", "_num_examples")
+
     def reset(self):
         self._sum_of_squared_errors = 0.0
         self._num_examples = 0
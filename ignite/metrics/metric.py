@@ -16,6 +16,10 @@ class Metric(with_metaclass(ABCMeta, object)):
 
     """
 
+    # Names of the attributes holding the metric's state, if the state of several batches is the sum of the states
+    # of each batch. Used by :class:`~ignite.metrics.SlidingWindow`.
+    _additive_state = None
+
     def __init__(self, output_transform=lambda x: x):
         self._output_transform = output_transform
         self.reset()
@@ -64,8 +68,14 @@ class Metric(with_metaclass(ABCMeta, object)):
         output = self._output_transform(engine.state.output)
         self.update(output)
 
+    def _cached_compute(self, cache):
+        if id(self) not in cache:
+            cache[id(self)] = self.compute()
+        return cache[id(self)]
+
     def completed(self, engine, name):
-        result = self.compute()
+        # Metrics shared by several attached metrics (e.g. dependencies of MetricsLambda) are computed once per event
+        result = self._cached_compute(_get_metrics_cache(engine))
         if torch.is_tensor(result) and len(result.shape) == 0:
             result = result.item()
         engine.state.metrics[name] = result
@@ -146,3 +156,13 @@ class Metric(with_metaclass(ABCMeta, object)):
     def __getitem__(self, index):
         from ignite.metrics import MetricsLambda
         return MetricsLambda(lambda x: x[index], self)
+
+
+def _get_metrics_cache(engine):
+    # Computed metric values stored in `engine.state`, valid while the engine's epoch and iteration do not change
+    key = (engine.state.epoch, engine.state.iteration)
+    cache = getattr(engine.state, "_metrics_cache", None)
+    if cache is None or cache[0] != key:
+        cache = (key, {})
+        engine.state._metrics_cache = cache
+    return cache[1]
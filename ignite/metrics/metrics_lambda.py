@@ -14,6 +14,9 @@ class MetricsLambda(Metric):
     resetted. When attach, all its dependencies would be automatically
     attached.
 
+    Metrics are evaluated as a graph: each dependency metric is computed once, even if it is used several times
+    in the graph or, when computed on an engine's event, shared by several attached metrics.
+
     Args:
         f (callable): the function that defines the computation
         args (sequence): Sequence of other metrics or something
@@ -52,19 +55,38 @@ class MetricsLambda(Metric):
         pass
 
     def compute(self):
-        materialized = [i.compute() if isinstance(i, Metric) else i for i in self.args]
-        materialized_kwargs = {k: (v.compute() if isinstance(v, Metric) else v) for k, v in self.kwargs.items()}
-        return self.function(*materialized, **materialized_kwargs)
+        return self._cached_compute({})
 
-    def _internal_attach(self, engine):
-        for index, metric in enumerate(itertools.chain(self.args, self.kwargs.values())):
+    def _cached_compute(self, cache):
+        # Dependencies are computed depth-first and memoized by identity: a metric shared by several nodes of the
+        # graph, e.g. `precision` in `precision * recall * 2 / (precision + recall)`, is computed once
+        if id(self) not in cache:
+            materialized = [i._cached_compute(cache) if isinstance(i, Metric) else i for i in self.args]
+            materialized_kwargs = {k: (v._cached_compute(cache) if isinstance(v, Metric) else v)
+                                   for k, v in self.kwargs.items()}
+            cache[id(self)] = self.function(*materialized, **materialized_kwargs)
+        return cache[id(self)]
+
+    def _get_source_metrics(self, visited=None, sources=None):
+        # Metrics (not MetricsLambda) of the graph, each one listed once
+        if visited is None:
+            visited, sources = set(), []
+        for metric in itertools.chain(self.args, self.kwargs.values()):
+            if not isinstance(metric, Metric) or id(metric) in visited:
+                continue
+            visited.add(id(metric))
             if isinstance(metric, MetricsLambda):
-                metric._internal_attach(engine)
-            elif isinstance(metric, Metric):
-                if not engine.has_event_handler(metric.started, Events.EPOCH_STARTED):
-                    engine.add_event_handler(Events.EPOCH_STARTED, metric.started)
-                if not engine.has_event_handler(metric.iteration_completed, Events.ITERATION_COMPLETED):
-                    engine.add_event_handler(Events.ITERATION_COMPLETED, metric.iteration_completed)
+                metric._get_source_metrics(visited, sources)
+            else:
+                sources.append(metric)
+        return sources
+
+    def _internal_attach(self, engine):
+        for metric in self._get_source_metrics():
+            if not engine.has_event_handler(metric.started, Events.EPOCH_STARTED):
+                engine.add_event_handler(Events.EPOCH_STARTED, metric.started)
+            if not engine.has_event_handler(metric.iteration_completed, Events.ITERATION_COMPLETED):
+                engine.add_event_handler(Events.ITERATION_COMPLETED, metric.iteration_completed)
 
     def attach(self, engine, name):
         # recursively attach all its dependencies
@@ -9,11 +9,16 @@ from ignite.utils import to_onehot
 
 class _BasePrecisionRecall(_BaseClassification):
 
+    _additive_state = ("_true_positives", "_positives")
+
     def __init__(self, output_transform=lambda x: x, average=False, is_multilabel=False):
         self._average = average
         self._true_positives = None
         self._positives = None
         self.eps = 1e-20
+        if is_multilabel and not average:
+            # per sample values are concatenated
+            self._additive_state = None
         super(_BasePrecisionRecall, self).__init__(output_transform=output_transform, is_multilabel=is_multilabel)
 
     def reset(self):
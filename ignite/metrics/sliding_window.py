@@ -0,0 +1,122 @@
+from __future__ import division
+
+import torch
+
+from ignite.metrics.metric import Metric
+from ignite.engine import Events
+from ignite.exceptions import NotComputableError
+
+
+class SlidingWindow(Metric):
+    """Compute a metric or the average of the output of process function over the last `window_size` iterations.
+
+    The state of each of the last `window_size` batches is kept in a ring buffer and their sum is updated
+    incrementally: each iteration adds the state of the new batch and subtracts the state of the oldest one, whatever
+    the window size. The sum is recomputed from the buffer once per window to avoid the accumulation of rounding
+    errors.
+
+    Args:
+        src (Metric or None): input source: an instance of :class:`~ignite.metrics.Metric` or None. The latter
+            corresponds to `engine.state.output` which holds the output of process function. The state of the metric
+            should be additive, e.g. :class:`~ignite.metrics.Accuracy`, :class:`~ignite.metrics.Loss`,
+            :class:`~ignite.metrics.Precision`, :class:`~ignite.metrics.Recall` or
+            :class:`~ignite.metrics.ConfusionMatrix`.
+        window_size (int, optional): number of iterations of the window, default 100.
+        output_transform (callable, optional): a function to use to transform the output if `src` is None and
+            corresponds the output of process function. Otherwise it should be None.
+        epoch_bound (boolean, optional): whether the window should be emptied after each epoch (defaults
+            to True).
+
+    Examples:
+
+    .. code-block:: python
+
+        acc_metric = SlidingWindow(Accuracy(output_transform=lambda x: [x[1], x[2]]), window_size=100)
+        acc_metric.attach(trainer, 'windowed_accuracy')
+
+        avg_output = SlidingWindow(output_transform=lambda x: x[0], window_size=100)
+        avg_output.attach(trainer, 'windowed_loss')
+
+        @trainer.on(Events.ITERATION_COMPLETED)
+        def log_windowed_metrics(engine):
+            print("accuracy over the last 100 iterations:", engine.state.metrics['windowed_accuracy'])
+            print("loss over the last 100 iterations:", engine.state.metrics['windowed_loss'])
+
+    """
+
+    def __init__(self, src=None, window_size=100, output_transform=None, epoch_bound=True):
+        if not (isinstance(src, Metric) or src is None):
+            raise TypeError("Argument src should be a Metric or None.")
+        if not (isinstance(window_size, int) and window_size > 0):
+            raise ValueError("Argument window_size should be a positive integer.")
+
+        if isinstance(src, Metric):
+            if output_transform is not None:
+                raise ValueError("Argument output_transform should be None if src is a Metric.")
+            if src._additive_state is None:
+                raise ValueError("Argument src should be a metric with additive state, "
+                                 "but given {}".format(type(src)))
+        elif output_transform is None:
+            raise ValueError("Argument output_transform should not be None if src corresponds "
+                             "to the output of process function.")
+
+        self.src = src
+        self.window_size = window_size
+        self.epoch_bound = epoch_bound
+        super(SlidingWindow, self).__init__(output_transform=output_transform)
+
+    def reset(self):
+        self._buffer = [None] * self.window_size
+        self._index = 0
+        self._count = 0
+        self._sums = None
+
+    def update(self, output):
+        self._push([output, ])
+
+    @torch.no_grad()
+    def iteration_completed(self, engine):
+        if self.src is None:
+            return super(SlidingWindow, self).iteration_completed(engine)
+        # The state of the source metric after a single update is the state of the batch
+        self.src.reset()
+        self.src.update(self.src._output_transform(engine.state.output))
+        self._push([getattr(self.src, name) for name in self.src._additive_state])
+
+    def _push(self, state):
+        oldest = self._buffer[self._index]
+        self._buffer[self._index] = state
+        self._index = (self._index + 1) % self.window_size
+        self._count = min(self._count + 1, self.window_size)
+
+        if self._sums is None or self._index == 0:
+            self._sums = _sum_states([s for s in self._buffer if s is not None])
+        elif oldest is None:
+            self._sums = [s + x for s, x in zip(self._sums, state)]
+        else:
+            self._sums = [s + x - o for s, x, o in zip(self._sums, state, oldest)]
+
+    def compute(self):
+        if self._count == 0:
+            raise NotComputableError("SlidingWindow must have at least one example before it can be computed.")
+
+        if self.src is None:
+            return self._sums[0] / self._count
+
+        for name, value in zip(self.src._additive_state, self._sums):
+            setattr(self.src, name, value.clone() if isinstance(value, torch.Tensor) else value)
+        return self.src.compute()
+
+    def attach(self, engine, name):
+        if self.epoch_bound:
+            # empty the window every epoch
+            engine.add_event_handler(Events.EPOCH_STARTED, self.started)
+        engine.add_event_handler(Events.ITERATION_COMPLETED, self.iteration_completed)
+        engine.add_event_handler(Events.ITERATION_COMPLETED, self.completed, name)
+
+
+def _sum_states(states):
+    sums = list(states[0])
+    for state in states[1:]:
+        sums = [s + x for s, x in zip(sums, state)]
+    return sums
@@ -12,6 +12,9 @@ class TopKCategoricalAccuracy(Metric):
 
     - `update` must receive output of the form `(y_pred, y)`.
     """
+
+    _additive_state = ("_num_correct", "_num_examples")
+
     def __init__(self, k=5, output_transform=lambda x: x):
         super(TopKCategoricalAccuracy, self).__init__(output_transform)
         self._k = k
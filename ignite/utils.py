@@ -1,4 +1,5 @@
 import sys
+from collections import OrderedDict
 
 import torch
 from torch._six import string_classes
@@ -41,6 +42,174 @@ def apply_to_type(input_, input_type, func):
                          .format(input_type, type(input_))))
 
 
+class BatchConverter(object):
+    """Callable moving the tensors of batches to a device, specialized for the structure of the batches.
+
+    On the first batch, the structure of the batch (tensors, mappings, sequences and other values) is inspected once
+    and compiled into functions which collect and replace its tensors. Next batches of the same structure are
+    converted without testing the type of each element. If the structure changes, it is compiled again.
+
+    Unlike :meth:`~ignite.utils.convert_tensor`, tuples and namedtuples are preserved. Other values than tensors,
+    mappings and sequences are returned as they are.
+
+    With `pin_memory`, CPU tensors moved to a CUDA device are copied in a single transfer per dtype: they are packed
+    into a pinned buffer, which is copied to the device and split into views of the original shapes. Pinned buffers
+    are allocated once and reused for the next batches, once their previous transfer is completed. Otherwise, each
+    tensor is copied separately.
+
+    Args:
+        device (str or torch.device, optional): device to move the tensors to. If None, batches are returned as they
+            are.
+        non_blocking (bool, optional): if True and this copy is between CPU and GPU, the copy may occur asynchronously
+            with respect to the host. For other cases, this argument has no effect.
+        pin_memory (bool, optional): if True, CPU tensors are packed in pinned memory before being copied to a CUDA
+            device. Tensors which are already pinned, e.g. by a `DataLoader` with `pin_memory=True`, are copied
+            directly.
+
+    .. code-block:: python
+
+        converter = BatchConverter(device="cuda", non_blocking=True, pin_memory=True)
+
+        for batch in loader:
+            x, y = converter(batch)
+
+    """
+
+    def __init__(self, device=None, non_blocking=False, pin_memory=False):
+        self.device = torch.device(device) if device is not None else None
+        self.non_blocking = non_blocking
+        self.pin_memory = pin_memory
+        self._structure = None
+        # Pinned buffers per dtype and CUDA events recorded after their last transfer
+        self._pinned_buffers = {}
+
+    def __call__(self, batch):
+        if self.device is None:
+            return batch
+
+        tensors = []
+        if self._structure is not None:
+            try:
+                self._structure[0](batch, tensors)
+            except _StructureChanged:
+                self._structure = None
+                tensors = []
+        if self._structure is None:
+            self._structure = _compile_structure(batch)
+            self._structure[0](batch, tensors)
+
+        return self._structure[1](batch, iter(self._transfer(tensors)))
+
+    def _transfer(self, tensors):
+        moved = list(tensors)
+        groups = {}
+        for i, tensor in enumerate(tensors):
+            if self.pin_memory and self.device.type == "cuda" and tensor.device.type == "cpu" and \
+                    not tensor.is_pinned():
+                groups.setdefault(tensor.dtype, []).append(i)
+            else:
+                moved[i] = tensor.to(device=self.device, non_blocking=self.non_blocking)
+
+        for dtype, indices in groups.items():
+            numel = sum(tensors[i].numel() for i in indices)
+            buffer = self._pinned_buffer(dtype, numel)
+            offset = 0
+            for i in indices:
+                n = tensors[i].numel()
+                buffer[offset:offset + n].copy_(tensors[i].reshape(-1))
+                offset += n
+            buffer = buffer.to(device=self.device, non_blocking=self.non_blocking)
+            self._record_transfer(dtype)
+
+            offset = 0
+            for i in indices:
+                n = tensors[i].numel()
+                moved[i] = buffer[offset:offset + n].view(tensors[i].shape)
+                offset += n
+        return moved
+
+    def _pinned_buffer(self, dtype, numel):
+        buffer, event = self._pinned_buffers.get(dtype, (None, None))
+        if buffer is None or buffer.numel() < numel:
+            buffer = torch.empty(numel, dtype=dtype, pin_memory=True)
+        elif event is not None:
+            # The previous transfer from the buffer may be pending
+            event.synchronize()
+        self._pinned_buffers[dtype] = (buffer, None)
+        return buffer[:numel]
+
+    def _record_transfer(self, dtype):
+        event = torch.cuda.Event()
+        event.record(torch.cuda.current_stream(self.device))
+        self._pinned_buffers[dtype] = (self._pinned_buffers[dtype][0], event)
+
+
+class _StructureChanged(Exception):
+    pass
+
+
+def _compile_structure(sample):
+    # Returns functions `collect(batch, tensors)`, appending the tensors of the batch to the list `tensors`, and
+    # `replace(batch, tensors)`, rebuilding the batch with tensors from the iterator `tensors`. Both check that
+    # the batch has the same structure as `sample`.
+    sample_type = type(sample)
+
+    if isinstance(sample, torch.Tensor):
+        def collect(batch, tensors):
+            if type(batch) is not sample_type:
+                raise _StructureChanged()
+            tensors.append(batch)
+
+        def replace(batch, tensors):
+            return next(tensors)
+
+    elif isinstance(sample, collections.Mapping):
+        keys = list(sample.keys())
+        structures = [_compile_structure(sample[k]) for k in keys]
+        mapping_type = sample_type if sample_type in (dict, OrderedDict) else dict
+
+        def collect(batch, tensors):
+            if type(batch) is not sample_type or len(batch) != len(keys):
+                raise _StructureChanged()
+            try:
+                for k, (c, _) in zip(keys, structures):
+                    c(batch[k], tensors)
+            except KeyError:
+                raise _StructureChanged()
+
+        def replace(batch, tensors):
+            return mapping_type([(k, r(batch[k], tensors)) for k, (_, r) in zip(keys, structures)])
+
+    elif isinstance(sample, collections.Sequence) and not isinstance(sample, string_classes):
+        structures = [_compile_structure(s) for s in sample]
+        if isinstance(sample, tuple) and hasattr(sample, "_fields"):
+            def rebuild(values):
+                return sample_type(*values)
+        elif isinstance(sample, tuple):
+            rebuild = tuple
+        else:
+            rebuild = list
+
+        def collect(batch, tensors):
+            if type(batch) is not sample_type or len(batch) != len(structures):
+                raise _StructureChanged()
+            for (c, _), b in zip(structures, batch):
+                c(b, tensors)
+
+        def replace(batch, tensors):
+            return rebuild([r(b, tensors) for (_, r), b in zip(structures, batch)])
+
+    else:
+        def collect(batch, tensors):
+            if type(batch) is not sample_type:
+                raise _StructureChanged()
+
+        def replace(batch, tensors):
+            return batch
+
+    return collect, replace
+
+
 def to_onehot(indices, num_classes):
     """Convert a tensor of indices of any shape `(N, ...)` to a
     tensor of one-hot indicators of shape `(N, num_classes, ...) and of type uint8. Output's device is equal to the
@@ -0,0 +1,15 @@
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+# AsyncEngine uses async/await syntax
+collect_ignore = ["test_async_engine.py"] if sys.version_info < (3, 5) else []
+
+
+@pytest.fixture
+def dirname():
+    path = tempfile.mkdtemp()
+    yield path
+    shutil.rmtree(path)
@@ -0,0 +1,133 @@
+import asyncio
+
+import torch
+import pytest
+
+from ignite.contrib.engines import AsyncEngine
+from ignite.engine import Events
+from ignite.metrics import Accuracy
+
+
+def test_wrong_input_args():
+    with pytest.raises(ValueError):
+        AsyncEngine(lambda e, b: b, max_in_flight=0)
+
+
+def _make_process_function(delays, in_flight):
+
+    async def process_function(engine, batch):
+        in_flight.append(1)
+        in_flight[0] = max(in_flight[0], len(in_flight) - 1)
+        await asyncio.sleep(delays[batch])
+        in_flight.pop()
+        return batch * 10
+
+    return process_function
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_run(ordered):
+    delays = [0.04, 0.01, 0.03, 0.0, 0.02, 0.01]
+    in_flight = [0]
+    engine = AsyncEngine(_make_process_function(delays, in_flight), max_in_flight=3, ordered=ordered)
+
+    started = []
+    completed = []
+
+    @engine.on(Events.ITERATION_STARTED)
+    def store_started(engine):
+        started.append((engine.state.iteration, engine.state.batch))
+
+    @engine.on(Events.ITERATION_COMPLETED)
+    def store_completed(engine):
+        assert engine.state.output == engine.state.batch * 10
+        assert engine.state.iteration == engine.state.batch + 1 + (engine.state.epoch - 1) * len(delays)
+        completed.append(engine.state.batch)
+
+    @engine.on(Events.EPOCH_COMPLETED)
+    def check_epoch(engine):
+        assert len(completed) == engine.state.epoch * len(delays)
+        assert engine.state.iteration == engine.state.epoch * len(delays)
+
+    state = engine.run(list(range(len(delays))), max_epochs=2)
+
+    assert state.iteration == 2 * len(delays)
+    assert in_flight[0] == 3
+    assert [b for _, b in started] == list(range(len(delays))) * 2
+    if ordered:
+        assert completed == list(range(len(delays))) * 2
+    else:
+        assert completed != list(range(len(delays))) * 2
+        assert sorted(completed) == sorted(list(range(len(delays))) * 2)
+
+
+def test_async_handlers_and_metrics():
+    torch.manual_seed(0)
+    data = [(torch.rand(4, 3), torch.randint(0, 3, size=(4,))) for _ in range(5)]
+
+    async def process_function(engine, batch):
+        await asyncio.sleep(0.001)
+        return batch
+
+    engine = AsyncEngine(process_function, max_in_flight=2)
+    Accuracy().attach(engine, "accuracy")
+
+    calls = []
+
+    @engine.on(Events.EPOCH_COMPLETED)
+    async def async_handler(engine):
+        await asyncio.sleep(0.001)
+        calls.append(engine.state.epoch)
+
+    state = engine.run(data, max_epochs=2)
+
+    y_pred = torch.cat([x for x, _ in data]).argmax(dim=1)
+    y = torch.cat([y for _, y in data])
+    assert state.metrics["accuracy"] == pytest.approx((y_pred == y).float().mean().item())
+    assert calls == [1, 2]
+
+
+def test_arun_and_sync_process_function():
+    engine = AsyncEngine(lambda e, b: b + 1)
+
+    async def main():
+        return await engine.arun([1, 2, 3], max_epochs=2)
+
+    loop = asyncio.new_event_loop()
+    try:
+        state = loop.run_until_complete(main())
+    finally:
+        loop.close()
+    assert state.iteration == 6
+    assert state.output == 4
+
+
+def test_terminate():
+    engine = AsyncEngine(_make_process_function([0.0] * 10, [0]), max_in_flight=2)
+
+    @engine.on(Events.ITERATION_COMPLETED)
+    def terminate(engine):
+        if engine.state.iteration == 3:
+            engine.terminate()
+
+    state = engine.run(list(range(10)), max_epochs=2)
+    assert state.epoch == 1
+    # batches in flight are completed
+    assert state.iteration == 4
+
+
+def test_exception():
+
+    async def process_function(engine, batch):
+        if batch == 2:
+            raise RuntimeError("failed batch")
+        return batch
+
+    engine = AsyncEngine(process_function)
+    with pytest.raises(RuntimeError, match=r"failed batch"):
+        engine.run(list(range(5)))
+
+    errors = []
+    engine.add_event_handler(Events.EXCEPTION_RAISED, lambda engine, e: errors.append(e))
+    engine.run(list(range(5)))
+    assert len(errors) == 1
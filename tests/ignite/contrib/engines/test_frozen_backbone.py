@@ -0,0 +1,176 @@
+import os
+
+import pytest
+import torch
+import torch.nn as nn
+from torch.nn.functional import cross_entropy
+from torch.optim import SGD
+from torch.utils.data import DataLoader, Dataset, SubsetRandomSampler
+
+from ignite.contrib.engines import create_frozen_backbone_trainer
+from ignite.contrib.handlers import ConcurrentEvaluation
+from ignite.engine import Events, create_supervised_trainer
+from ignite.metrics import Accuracy
+
+
+class CountingDataset(Dataset):
+
+    def __init__(self, n_samples):
+        torch.manual_seed(0)
+        self.x = torch.rand(n_samples, 6)
+        self.y = torch.randint(0, 3, size=(n_samples, ))
+        self.n_reads = 0
+
+    def __getitem__(self, index):
+        self.n_reads += 1
+        return self.x[index], self.y[index]
+
+    def __len__(self):
+        return len(self.x)
+
+
+def _make_modules():
+    torch.manual_seed(1)
+    backbone = nn.Sequential(nn.Linear(6, 8), nn.ReLU())
+    head = nn.Linear(8, 3)
+    return backbone, head
+
+
+def test_wrong_data():
+    backbone, head = _make_modules()
+    trainer = create_frozen_backbone_trainer(backbone, head, SGD(head.parameters(), lr=0.1), cross_entropy)
+
+    with pytest.raises(TypeError):
+        trainer.run([(torch.rand(4, 6), torch.randint(0, 3, size=(4, )))])
+
+    dataset = CountingDataset(10)
+    with pytest.raises(ValueError):
+        trainer.run(DataLoader(dataset, batch_size=4), epoch_length=2)
+
+
+@pytest.mark.parametrize("drop_last", [False, True])
+def test_integration(dirname, drop_last):
+    n_epochs = 4
+    dataset = CountingDataset(22)
+
+    backbone, head = _make_modules()
+    backbone_calls = []
+    backbone.register_forward_hook(lambda *args: backbone_calls.append(1) and None)
+    trainer = create_frozen_backbone_trainer(backbone, head, SGD(head.parameters(), lr=0.1), cross_entropy,
+                                             dirname=dirname)
+
+    store_complete = []
+    trainer.add_event_handler(Events.EPOCH_COMPLETED,
+                              lambda engine: store_complete.append(engine.state.feature_store_complete))
+
+    torch.manual_seed(2)
+    state = trainer.run(DataLoader(dataset, batch_size=4, shuffle=True, drop_last=drop_last), max_epochs=n_epochs)
+
+    n_batches = 5 if drop_last else 6
+    assert state.iteration == n_epochs * n_batches
+    # With drop_last, the features of the 2 dropped samples are computed after the first epoch
+    assert store_complete == [True, True, True, True]
+    assert dataset.n_reads == 22
+    assert len(backbone_calls) == 6
+    assert sorted(os.listdir(dirname)) == ["features.npy", "targets.npy"]
+
+    # Same training with a frozen backbone in the model
+    ref_dataset = CountingDataset(22)
+    ref_backbone, ref_head = _make_modules()
+    for p in ref_backbone.parameters():
+        p.requires_grad_(False)
+    model = nn.Sequential(ref_backbone, ref_head)
+    ref_trainer = create_supervised_trainer(model, SGD(ref_head.parameters(), lr=0.1), cross_entropy)
+    ref_backbone.eval()
+
+    torch.manual_seed(2)
+    ref_state = ref_trainer.run(DataLoader(ref_dataset, batch_size=4, shuffle=True, drop_last=drop_last),
+                                max_epochs=n_epochs)
+
+    assert ref_dataset.n_reads == n_epochs * (n_batches * 4 if drop_last else 22)
+    assert state.output == pytest.approx(ref_state.output, rel=1e-5)
+    assert torch.allclose(head.weight, ref_head.weight, atol=1e-6)
+
+
+def test_temporary_directory():
+    backbone, head = _make_modules()
+    trainer = create_frozen_backbone_trainer(backbone, head, SGD(head.parameters(), lr=0.1), cross_entropy)
+
+    paths = []
+    trainer.add_event_handler(Events.EPOCH_COMPLETED,
+                              lambda engine: paths.append(engine.state.feature_store.dirname))
+    trainer.run(DataLoader(CountingDataset(8), batch_size=4), max_epochs=2)
+    assert len(set(paths)) == 1
+    assert not os.path.exists(paths[0])
+
+
+def test_temporary_directory_removed_on_exception():
+    backbone, head = _make_modules()
+    trainer = create_frozen_backbone_trainer(backbone, head, SGD(head.parameters(), lr=0.1), cross_entropy)
+
+    paths = []
+
+    @trainer.on(Events.ITERATION_COMPLETED)
+    def fail(engine):
+        paths.append(engine.state.feature_store.dirname)
+        if engine.state.iteration == 3:
+            raise RuntimeError("failed iteration")
+
+    with pytest.raises(RuntimeError, match=r"failed iteration"):
+        trainer.run(DataLoader(CountingDataset(8), batch_size=4), max_epochs=2)
+    assert os.path.isdir(os.path.dirname(paths[0]))
+    assert not os.path.exists(paths[0])
+
+
+@pytest.mark.parametrize("drop_last", [False, True])
+def test_subset_sampler(drop_last):
+    dataset = CountingDataset(22)
+    subset = list(range(3, 17))
+    backbone, head = _make_modules()
+    backbone_calls = []
+    backbone.register_forward_hook(lambda *args: backbone_calls.append(1) and None)
+    trainer = create_frozen_backbone_trainer(backbone, head, SGD(head.parameters(), lr=0.1), cross_entropy)
+
+    store_complete = []
+    trainer.add_event_handler(Events.EPOCH_COMPLETED,
+                              lambda engine: store_complete.append(engine.state.feature_store_complete))
+
+    torch.manual_seed(2)
+    loader = DataLoader(dataset, batch_size=4, sampler=SubsetRandomSampler(subset), drop_last=drop_last)
+    state = trainer.run(loader, max_epochs=4)
+
+    n_batches = 3 if drop_last else 4
+    assert state.iteration == 4 * n_batches
+    assert store_complete == [True, True, True, True]
+    # Only the samples of the subset are read, once
+    assert dataset.n_reads == len(subset)
+    assert len(backbone_calls) == 4
+
+
+def test_exception_propagates_with_other_handlers():
+    backbone, head = _make_modules()
+    trainer = create_frozen_backbone_trainer(backbone, head, SGD(head.parameters(), lr=0.1), cross_entropy)
+    evaluation = ConcurrentEvaluation(head, [(torch.rand(4, 8), torch.randint(0, 3, size=(4, )))],
+                                      metrics={"accuracy": Accuracy()})
+    evaluation.attach(trainer)
+
+    paths = []
+
+    @trainer.on(Events.ITERATION_COMPLETED)
+    def fail(engine):
+        paths.append(engine.state.feature_store.dirname)
+        if engine.state.iteration == 3:
+            raise RuntimeError("failed iteration")
+
+    with pytest.raises(RuntimeError, match=r"failed iteration"):
+        trainer.run(DataLoader(CountingDataset(8), batch_size=4), max_epochs=2)
+    assert not os.path.exists(paths[0])
+
+    # Exceptions handled by the user's handler
+    errors = []
+    trainer.add_event_handler(Events.EXCEPTION_RAISED, lambda engine, e: errors.append(e))
+    paths[:] = []
+    state = trainer.run(DataLoader(CountingDataset(8), batch_size=4), max_epochs=2)
+    assert len(errors) == 1 and state.iteration == 3
+    assert not os.path.exists(paths[0])
+    evaluation.close()
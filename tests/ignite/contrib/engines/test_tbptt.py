@@ -141,3 +141,29 @@ def test_create_supervised_tbptt_trainer_with_cpu():
 @pytest.mark.skipif(not torch.cuda.is_available(), reason="Skip if no GPU")
 def test_create_supervised_tbptt_trainer_with_gpu():
     _test_create_supervised_tbptt_trainer("cuda")
+
+
+def test_create_supervised_tbptt_trainer_output():
+    torch.manual_seed(0)
+    model = nn.LSTM(2, 1)
+    optimizer = optim.SGD(model.parameters(), 0.1)
+
+    prepare_batch = mock.MagicMock(side_effect=lambda batch, device, non_blocking: batch)
+    trainer = create_supervised_tbptt_trainer(model, optimizer, F.mse_loss, tbtt_step=2, prepare_batch=prepare_batch)
+
+    chunk_losses = []
+
+    @trainer.on(Tbptt_Events.TIME_ITERATION_COMPLETED)
+    def store_chunk_loss(engine):
+        assert isinstance(engine.state.output, torch.Tensor)
+        assert engine.state.output.grad_fn is None
+        chunk_losses.append(engine.state.output.item())
+
+    X = torch.rand(5, 3, 2)
+    y = torch.rand(5, 3, 1)
+    state = trainer.run([(X, y)])
+
+    assert prepare_batch.call_count == 1
+    assert len(chunk_losses) == 3
+    assert isinstance(state.output, float)
+    assert state.output == pytest.approx(sum(chunk_losses) / 3)
@@ -2,7 +2,8 @@ import math
 import torch
 
 from ignite.engine import Engine, State, Events
-from ignite.contrib.handlers.base_logger import BaseLogger, BaseOutputHandler, global_step_from_engine
+from ignite.contrib.handlers.base_logger import BaseLogger, BaseOutputHandler, BaseWeightsScalarHandler, \
+    global_step_from_engine
 from ignite.contrib.handlers import CustomPeriodicEvent
 
 import pytest
@@ -20,6 +21,12 @@ class DummyOutputHandler(BaseOutputHandler):
         pass
 
 
+class DummyWeightsScalarHandler(BaseWeightsScalarHandler):
+
+    def __call__(self, *args, **kwargs):
+        pass
+
+
 def test_base_output_handler_wrong_setup():
 
     with pytest.raises(TypeError, match="metric_names should be either a list or equal 'all'"):
@@ -241,3 +248,29 @@ def test_global_step_from_engine():
     res = global_step_transform(engine, Events.EPOCH_COMPLETED)
 
     assert res == another_engine.state.epoch
+
+
+def test_base_weights_scalar_handler_reduce():
+    embedding = torch.nn.Embedding(10, 3, sparse=True)
+    embedding(torch.tensor([1, 2, 2])).sum().backward()
+    tensors = [torch.rand(10, 10), torch.rand(3), torch.rand(4, 4, dtype=torch.float64), torch.zeros(2)]
+
+    handler = DummyWeightsScalarHandler(torch.nn.Linear(2, 2))
+    # Sparse gradients are reduced separately
+    all_tensors = tensors[:2] + [embedding.weight.grad] + tensors[2:]
+    values = handler._reduce(all_tensors)
+    assert len(values) == len(all_tensors)
+    for v, t in zip(values, all_tensors):
+        assert v.ndimension() == 0
+        assert v.item() == pytest.approx(torch.norm(t.to_dense()).item())
+
+    def reduction(t):
+        return t.sum()
+
+    reduction = MagicMock(side_effect=reduction)
+    handler = DummyWeightsScalarHandler(torch.nn.Linear(2, 2), reduction=reduction)
+    reduction.reset_mock()
+    values = handler._reduce(tensors)
+    assert reduction.call_count == len(tensors)
+    for v, t in zip(values, tensors):
+        assert v.item() == pytest.approx(t.sum().item())
@@ -0,0 +1,174 @@
+import os
+
+import numpy as np
+import pytest
+
+from mock import MagicMock
+
+import torch
+
+from ignite.engine import Engine, Events, State
+from ignite.contrib.handlers.columnar_logger import *
+
+
+def test_output_handler_with_wrong_logger_type():
+
+    wrapper = OutputHandler("tag", output_transform=lambda x: x)
+
+    mock_logger = MagicMock()
+    mock_engine = MagicMock()
+    with pytest.raises(RuntimeError, match="Handler 'OutputHandler' works only with ColumnarLogger"):
+        wrapper(mock_engine, mock_logger, Events.ITERATION_STARTED)
+
+
+def test_output_handler_output_transform():
+
+    wrapper = OutputHandler("tag", output_transform=lambda x: {"loss": x, "vec": torch.tensor([1.0, 2.0])})
+    mock_logger = MagicMock(spec=ColumnarLogger)
+    mock_logger.add_scalar = MagicMock()
+
+    mock_engine = MagicMock()
+    mock_engine.state = State()
+    mock_engine.state.output = 12345
+    mock_engine.state.iteration = 123
+
+    wrapper(mock_engine, mock_logger, Events.ITERATION_STARTED)
+
+    assert sorted(c[0] for c in mock_logger.add_scalar.call_args_list) == [
+        ("tag/loss", 12345, 123),
+        ("tag/vec/0", 1.0, 123),
+        ("tag/vec/1", 2.0, 123),
+    ]
+
+
+def test_optimizer_params():
+
+    optimizer = torch.optim.SGD([torch.Tensor(0)], lr=0.01)
+    wrapper = OptimizerParamsHandler(optimizer=optimizer, param_name="lr", tag="generator")
+    mock_logger = MagicMock(spec=ColumnarLogger)
+    mock_logger.add_scalar = MagicMock()
+    mock_engine = MagicMock()
+    mock_engine.state = State()
+    mock_engine.state.iteration = 123
+
+    wrapper(mock_engine, mock_logger, Events.ITERATION_STARTED)
+    mock_logger.add_scalar.assert_called_once_with("generator/lr/group_0", 0.01, 123)
+
+    with pytest.raises(RuntimeError, match="Handler 'OptimizerParamsHandler' works only with ColumnarLogger"):
+        wrapper(mock_engine, MagicMock(), Events.ITERATION_STARTED)
+
+
+def test_logger_wrong_setup(dirname):
+
+    with pytest.raises(ValueError, match="Argument buffer_size should be positive"):
+        ColumnarLogger(dirname, buffer_size=0)
+
+    with pytest.raises(ValueError, match="does not contain a run log"):
+        load_run(dirname)
+
+
+def test_add_scalar_buffering(dirname):
+
+    col_logger = ColumnarLogger(os.path.join(dirname, "run"), buffer_size=5)
+    for i in range(4):
+        col_logger.add_scalar("a", i * 0.5, i, walltime=100.0 + i)
+    assert not os.path.exists(os.path.join(dirname, "run", "tags.json"))
+
+    col_logger.add_scalar("b", -1.0, 0)
+    run = load_run(os.path.join(dirname, "run"))
+    assert sorted(run.keys()) == ["a", "b"]
+    np.testing.assert_array_equal(run["a"]["step"], [0, 1, 2, 3])
+    np.testing.assert_array_equal(run["a"]["value"], [0.0, 0.5, 1.0, 1.5])
+    np.testing.assert_array_equal(run["a"]["walltime"], [100.0, 101.0, 102.0, 103.0])
+    np.testing.assert_array_equal(run["b"]["value"], [-1.0])
+    assert run["a"]["step"].dtype == np.int64
+
+    col_logger.add_scalar("a", torch.tensor(2.0), 4)
+    col_logger.close()
+
+    # Appending to an existing run
+    with ColumnarLogger(os.path.join(dirname, "run")) as col_logger:
+        col_logger.add_scalar("a", 2.5, 5)
+        col_logger.add_scalar("c", 3.0, 0)
+
+    run = load_run(os.path.join(dirname, "run"), mmap=False)
+    assert sorted(run.keys()) == ["a", "b", "c"]
+    np.testing.assert_array_equal(run["a"]["step"], [0, 1, 2, 3, 4, 5])
+    np.testing.assert_array_equal(run["a"]["value"], [0.0, 0.5, 1.0, 1.5, 2.0, 2.5])
+    np.testing.assert_array_equal(run["c"]["value"], [3.0])
+
+
+def test_load_run_truncated(dirname):
+
+    with ColumnarLogger(dirname) as col_logger:
+        for i in range(3):
+            col_logger.add_scalar("a", float(i), i)
+
+    # Simulate an interrupted append
+    with open(os.path.join(dirname, "col_0.step"), "ab") as f:
+        np.array([3], dtype=np.int64).tofile(f)
+
+    run = load_run(dirname)
+    assert len(run["a"]["step"]) == len(run["a"]["value"]) == len(run["a"]["walltime"]) == 3
+
+
+def test_append_after_interrupted_run(dirname):
+
+    with ColumnarLogger(dirname) as col_logger:
+        for i in range(3):
+            col_logger.add_scalar("a", float(i), i)
+
+    # Simulate an interrupted append: step and value were written, not walltime
+    with open(os.path.join(dirname, "col_0.step"), "ab") as f:
+        np.array([3], dtype=np.int64).tofile(f)
+    with open(os.path.join(dirname, "col_0.value"), "ab") as f:
+        np.array([3.0], dtype=np.float64).tofile(f)
+
+    with ColumnarLogger(dirname) as col_logger:
+        for i in range(4, 6):
+            col_logger.add_scalar("a", float(i), i, walltime=float(i))
+
+    run = load_run(dirname)
+    np.testing.assert_array_equal(run["a"]["step"], [0, 1, 2, 4, 5])
+    np.testing.assert_array_equal(run["a"]["value"], [0.0, 1.0, 2.0, 4.0, 5.0])
+    np.testing.assert_array_equal(run["a"]["walltime"][-2:], [4.0, 5.0])
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_load_run_with_partial_row(dirname, mmap):
+
+    with ColumnarLogger(dirname) as col_logger:
+        for i in range(3):
+            col_logger.add_scalar("a", float(i), i)
+
+    # Simulate a torn append: a partial step was written
+    with open(os.path.join(dirname, "col_0.step"), "ab") as f:
+        f.write(b"\x01\x02\x03")
+
+    run = load_run(dirname, mmap=mmap)
+    np.testing.assert_array_equal(run["a"]["step"], [0, 1, 2])
+    np.testing.assert_array_equal(run["a"]["value"], [0.0, 1.0, 2.0])
+
+
+def test_integration(dirname):
+
+    n_epochs = 5
+    data = list(range(50))
+
+    losses = torch.rand(n_epochs * len(data))
+    losses_iter = iter(losses)
+
+    def update_fn(engine, batch):
+        return next(losses_iter)
+
+    trainer = Engine(update_fn)
+
+    with ColumnarLogger(dirname, buffer_size=64) as col_logger:
+        col_logger.attach(trainer,
+                          log_handler=OutputHandler(tag="training", output_transform=lambda x: {"loss": x}),
+                          event_name=Events.ITERATION_COMPLETED)
+        trainer.run(data, max_epochs=n_epochs)
+
+    run = load_run(dirname)
+    np.testing.assert_array_equal(run["training/loss"]["step"], np.arange(1, n_epochs * len(data) + 1))
+    np.testing.assert_allclose(run["training/loss"]["value"], losses.numpy(), rtol=1e-6)
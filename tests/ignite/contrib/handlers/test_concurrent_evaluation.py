@@ -0,0 +1,162 @@
+import gc
+import time
+
+import pytest
+import torch
+from torch.nn import Linear
+from torch.nn.functional import mse_loss
+from torch.optim import SGD
+
+from ignite.contrib.handlers import ConcurrentEvaluation
+from ignite.engine import Events, create_supervised_trainer, create_supervised_evaluator
+from ignite.metrics import MeanSquaredError
+
+
+def test_wrong_input_args():
+    with pytest.raises(TypeError):
+        ConcurrentEvaluation(None, [], {"mse": MeanSquaredError()})
+
+    with pytest.raises(ValueError):
+        ConcurrentEvaluation(Linear(1, 1), [], {})
+
+
+def _make_data(n_batches):
+    torch.manual_seed(0)
+    data = []
+    for _ in range(n_batches):
+        x = torch.rand(8, 2)
+        data.append((x, x.sum(dim=1, keepdim=True)))
+    return data
+
+
+def test_integration():
+    model = Linear(2, 1)
+    optimizer = SGD(model.parameters(), lr=0.1)
+    trainer = create_supervised_trainer(model, optimizer, mse_loss)
+    train_data = _make_data(4)
+    val_data = _make_data(3)
+
+    evaluation = ConcurrentEvaluation(model, val_data, metrics={"mse": MeanSquaredError()})
+    evaluation.attach(trainer, event_name=Events.EPOCH_COMPLETED)
+
+    snapshots = {}
+
+    @trainer.on(Events.EPOCH_COMPLETED)
+    def store_snapshot(engine):
+        snapshots[engine.state.iteration] = {k: v.clone() for k, v in model.state_dict().items()}
+
+    received = []
+
+    @evaluation.engine.on(Events.COMPLETED)
+    def store_received(engine):
+        received.append((engine.state.epoch, engine.state.iteration, engine.state.metrics["mse"]))
+
+    state = trainer.run(train_data, max_epochs=3)
+
+    assert sorted(state.eval_metrics.keys()) == [4, 8, 12]
+    assert sorted(received) == [(1, 4, state.eval_metrics[4]["mse"]),
+                                (2, 8, state.eval_metrics[8]["mse"]),
+                                (3, 12, state.eval_metrics[12]["mse"])]
+
+    for iteration, snapshot in snapshots.items():
+        model.load_state_dict(snapshot)
+        evaluator = create_supervised_evaluator(model, metrics={"mse": MeanSquaredError()})
+        expected = evaluator.run(val_data).metrics["mse"]
+        assert state.eval_metrics[iteration]["mse"] == pytest.approx(expected)
+
+    assert evaluation._process is None
+
+
+def test_worker_error():
+    model = Linear(2, 1)
+    optimizer = SGD(model.parameters(), lr=0.1)
+    trainer = create_supervised_trainer(model, optimizer, mse_loss)
+    # Wrong number of features
+    val_data = [(torch.rand(4, 3), torch.rand(4, 1))]
+
+    evaluation = ConcurrentEvaluation(model, val_data, metrics={"mse": MeanSquaredError()})
+    evaluation.attach(trainer)
+
+    with pytest.raises(RuntimeError, match=r"Evaluation of the snapshot at iteration 2 failed"):
+        trainer.run(_make_data(2))
+    evaluation.close()
+
+
+def test_poll_does_not_block():
+    model = Linear(2, 1)
+
+    def slow_transform(x, y, y_pred):
+        time.sleep(0.5)
+        return y_pred, y
+
+    trainer = create_supervised_trainer(model, SGD(model.parameters(), lr=0.1), mse_loss)
+    evaluation = ConcurrentEvaluation(model, _make_data(2), metrics={"mse": MeanSquaredError()},
+                                      output_transform=slow_transform)
+
+    trainer.add_event_handler(Events.STARTED, evaluation)
+    trainer.add_event_handler(Events.ITERATION_COMPLETED, evaluation.poll)
+
+    start = time.time()
+    state = trainer.run(_make_data(2))
+    assert time.time() - start < 0.5
+    assert not hasattr(state, "eval_metrics")
+
+    evaluation.wait(trainer)
+    evaluation.close()
+    assert list(state.eval_metrics.keys()) == [0]
+
+
+def _slow_transform(x, y, y_pred):
+    time.sleep(1.0)
+    return y_pred, y
+
+
+def test_close_discards_pending_evaluations():
+    model = Linear(2, 1)
+    evaluation = ConcurrentEvaluation(model, _make_data(3), metrics={"mse": MeanSquaredError()},
+                                      output_transform=_slow_transform)
+    trainer = create_supervised_trainer(model, SGD(model.parameters(), lr=0.1), mse_loss)
+    trainer.add_event_handler(Events.ITERATION_COMPLETED, evaluation)
+    trainer.run(_make_data(3))
+    process = evaluation._process
+
+    start = time.time()
+    evaluation.close()
+    assert time.time() - start < 1.0
+    assert not process.is_alive()
+    assert evaluation._n_pending == 0
+
+
+def test_worker_stopped_after_exception():
+    model = Linear(2, 1)
+    trainer = create_supervised_trainer(model, SGD(model.parameters(), lr=0.1), mse_loss)
+    evaluation = ConcurrentEvaluation(model, _make_data(2), metrics={"mse": MeanSquaredError()},
+                                      output_transform=_slow_transform)
+    evaluation.attach(trainer)
+    # Exceptions are raised as without the handler
+    assert Events.EXCEPTION_RAISED not in trainer._event_handlers
+
+    processes = []
+
+    @trainer.on(Events.EPOCH_COMPLETED)
+    def fail(engine):
+        processes.append(evaluation._process)
+        if len(processes) == 1:
+            raise ValueError("training failed")
+
+    with pytest.raises(ValueError, match=r"training failed"):
+        trainer.run(_make_data(2))
+
+    # The worker process of the failed run is stopped when the trainer runs again
+    trainer.run(_make_data(2))
+    assert not processes[0].is_alive()
+    assert processes[1] is not processes[0]
+    assert evaluation._process is None
+
+    # or when the handler is garbage collected
+    with pytest.raises(ValueError, match=r"training failed"):
+        processes[:] = []
+        trainer.run(_make_data(2))
+    del trainer, evaluation, fail
+    gc.collect()
+    assert not processes[0].is_alive()
@@ -0,0 +1,176 @@
+import os
+
+import pytest
+import torch
+from mock import MagicMock
+from torch.nn import Linear
+from torch.utils.data import DataLoader, TensorDataset
+
+from ignite.contrib.handlers import EvaluationCache
+from ignite.engine import Events, create_supervised_evaluator
+from ignite.metrics import Accuracy, MeanSquaredError, Precision
+
+
+def test_wrong_input_args(dirname):
+    with pytest.raises(TypeError):
+        EvaluationCache(dirname, None)
+
+    with pytest.raises(TypeError):
+        EvaluationCache(dirname, Linear(1, 1), data_key=12)
+
+
+def _make_data(n_batches, n_classes=3):
+    torch.manual_seed(0)
+    return [(torch.rand(8, 4), torch.randint(0, n_classes, size=(8, ))) for _ in range(n_batches)]
+
+
+def _count_forward(model):
+    counter = MagicMock()
+
+    def hook(*args):
+        counter()
+
+    model.register_forward_hook(hook)
+    return counter
+
+
+def test_replay(dirname):
+    torch.manual_seed(1)
+    model = Linear(4, 3)
+    n_forward = _count_forward(model)
+    data = _make_data(5)
+
+    evaluator = create_supervised_evaluator(model, metrics={"accuracy": Accuracy()})
+    EvaluationCache(dirname, model, data_key="val").attach(evaluator)
+
+    state = evaluator.run(data)
+    assert n_forward.call_count == 5
+    accuracy = state.metrics["accuracy"]
+    assert len(os.listdir(dirname)) == 1
+
+    # Replayed outputs are used by a newly attached metric
+    Precision(average=True).attach(evaluator, "precision")
+    data_iterated = MagicMock()
+    evaluator.add_event_handler(Events.ITERATION_STARTED, lambda engine: data_iterated())
+    state = evaluator.run(data)
+    assert n_forward.call_count == 5
+    assert data_iterated.call_count == 5
+    assert state.metrics["accuracy"] == accuracy
+
+    expected = create_supervised_evaluator(model, metrics={"precision": Precision(average=True)}).run(data)
+    assert state.metrics["precision"] == pytest.approx(expected.metrics["precision"])
+
+    y_pred, y = state.output
+    assert torch.equal(y, data[-1][1])
+    assert torch.allclose(y_pred, model(data[-1][0]))
+
+    # Changed weights: the model is evaluated again
+    n_forward.reset_mock()
+    model.bias.data.add_(1.0)
+    evaluator.run(data)
+    assert n_forward.call_count == 5
+    assert len(os.listdir(dirname)) == 2
+
+    # Other data
+    evaluator = create_supervised_evaluator(model, metrics={"accuracy": Accuracy()})
+    EvaluationCache(dirname, model, data_key="other").attach(evaluator)
+    evaluator.run(data)
+    assert n_forward.call_count == 10
+
+
+def test_default_data_key(dirname):
+    model = Linear(4, 1)
+    n_forward = _count_forward(model)
+    evaluator = create_supervised_evaluator(model, metrics={"mse": MeanSquaredError()})
+    EvaluationCache(dirname, model).attach(evaluator)
+
+    data = [(x, torch.rand(8, 1)) for x, _ in _make_data(3)]
+    evaluator.run(data)
+    evaluator.run(data)
+    assert n_forward.call_count == 3
+    evaluator.run(data[:2])
+    assert n_forward.call_count == 5
+
+
+def test_terminated_run_is_not_cached(dirname):
+    model = Linear(4, 3)
+    n_forward = _count_forward(model)
+    evaluator = create_supervised_evaluator(model)
+    EvaluationCache(dirname, model, data_key="val").attach(evaluator)
+
+    def terminate(engine):
+        engine.terminate()
+
+    with evaluator.add_event_handler(Events.ITERATION_COMPLETED, terminate):
+        evaluator.run(_make_data(4))
+    assert os.listdir(dirname) == []
+
+    evaluator.run(_make_data(4))
+    evaluator.run(_make_data(4))
+    assert n_forward.call_count == 5
+
+
+class CountingDataset(TensorDataset):
+
+    def __init__(self, *tensors):
+        super(CountingDataset, self).__init__(*tensors)
+        self.n_reads = 0
+
+    def __getitem__(self, index):
+        self.n_reads += 1
+        return super(CountingDataset, self).__getitem__(index)
+
+
+def test_data_not_read_on_cache_hit(dirname):
+    model = Linear(4, 3)
+    evaluator = create_supervised_evaluator(model, metrics={"accuracy": Accuracy()})
+    EvaluationCache(dirname, model).attach(evaluator)
+
+    dataset = CountingDataset(torch.rand(16, 4), torch.randint(0, 3, size=(16, )))
+    evaluator.run(DataLoader(dataset, batch_size=4))
+    assert dataset.n_reads == 16
+    evaluator.run(DataLoader(dataset, batch_size=4))
+    assert dataset.n_reads == 16
+
+
+def test_same_sized_datasets_do_not_collide(dirname):
+    model = Linear(4, 3)
+    n_forward = _count_forward(model)
+    evaluator = create_supervised_evaluator(model, metrics={"accuracy": Accuracy()})
+    EvaluationCache(dirname, model, hash_data=True).attach(evaluator)
+
+    torch.manual_seed(0)
+    datasets = [TensorDataset(torch.rand(16, 4), torch.randint(0, 3, size=(16, ))) for _ in range(2)]
+    all_metrics = [dict(evaluator.run(DataLoader(dataset, batch_size=4)).metrics) for dataset in datasets]
+    assert n_forward.call_count == 8
+    assert len(os.listdir(dirname)) == 2
+
+    for dataset, metrics in zip(datasets, all_metrics):
+        assert evaluator.run(DataLoader(dataset, batch_size=4)).metrics == metrics
+    assert n_forward.call_count == 8
+
+
+def test_output_transform_is_part_of_key(dirname):
+    model = Linear(4, 3)
+    n_forward = _count_forward(model)
+    data = _make_data(2)
+
+    for output_transform in [lambda x, y, y_pred: (y_pred, y), lambda x, y, y_pred: (y_pred * 2.0, y)]:
+        evaluator = create_supervised_evaluator(model, output_transform=output_transform)
+        EvaluationCache(dirname, model).attach(evaluator)
+        evaluator.run(data)
+    assert n_forward.call_count == 4
+
+
+def test_data_iterated_once_requires_data_key(dirname):
+    model = Linear(4, 3)
+    evaluator = create_supervised_evaluator(model)
+    EvaluationCache(dirname, model).attach(evaluator)
+
+    with pytest.raises(ValueError, match=r"data_key"):
+        evaluator.run(iter(_make_data(2)))
+
+    evaluator = create_supervised_evaluator(model)
+    EvaluationCache(dirname, model, data_key="val", hash_data=True).attach(evaluator)
+    with pytest.raises(ValueError, match=r"hash_data"):
+        evaluator.run(iter(_make_data(2)))
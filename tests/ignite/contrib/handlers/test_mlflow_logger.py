@@ -341,6 +341,65 @@ def test_mlflow_bad_metric_name_handling(dirname):
         assert t == s.value
 
 
+def test_integration_buffered(dirname):
+
+    n_epochs = 5
+    data = list(range(50))
+
+    trainer = Engine(lambda engine, batch: torch.tensor(0.5))
+
+    mlflow_logger = MLflowLogger(tracking_uri=os.path.join(dirname, "mlruns"), buffer_size=7)
+
+    true_values = []
+
+    def dummy_handler(engine, logger, event_name):
+        global_step = engine.state.get_event_attrib_value(event_name)
+        v = global_step * 0.1
+        true_values.append(v)
+        logger.log_metrics({"test_value": v, "other_value": -v}, step=global_step)
+
+    mlflow_logger.attach(trainer,
+                         log_handler=dummy_handler,
+                         event_name=Events.ITERATION_COMPLETED)
+
+    import mlflow
+
+    active_run = mlflow.active_run()
+
+    trainer.run(data, max_epochs=n_epochs)
+    mlflow_logger.close()
+
+    from mlflow.tracking import MlflowClient
+
+    client = MlflowClient(tracking_uri=os.path.join(dirname, "mlruns"))
+    stored_values = client.get_metric_history(active_run.info.run_id, "test_value")
+    assert len(stored_values) == len(true_values)
+    stored_values = sorted(stored_values, key=lambda m: m.step)
+    for i, (t, s) in enumerate(zip(true_values, stored_values)):
+        assert s.step == i + 1
+        assert pytest.approx(t) == s.value
+
+
+def test_output_handler_invalid_name_cached():
+
+    wrapper = OutputHandler("tag", output_transform=lambda x: {"bad:name": x, "loss": x})
+    mock_logger = MagicMock(spec=MLflowLogger)
+    mock_logger.log_metrics = MagicMock()
+
+    mock_engine = MagicMock()
+    mock_engine.state = State()
+    mock_engine.state.output = 12345
+    mock_engine.state.iteration = 123
+
+    with pytest.warns(UserWarning, match=r"MLflowLogger output_handler encountered an invalid metric name") as record:
+        wrapper(mock_engine, mock_logger, Events.ITERATION_STARTED)
+        wrapper(mock_engine, mock_logger, Events.ITERATION_STARTED)
+
+    assert len([r for r in record if "invalid metric name" in str(r.message)]) == 1
+    assert wrapper._valid_names == {"tag bad:name": False, "tag loss": True}
+    mock_logger.log_metrics.assert_has_calls([call({"tag loss": 12345}, step=123)] * 2)
+
+
 @pytest.fixture
 def no_site_packages():
     import sys
@@ -7,7 +7,8 @@ import torch
 from ignite.engine import Engine, Events
 from ignite.contrib.handlers.param_scheduler import LinearCyclicalScheduler, CosineAnnealingScheduler
 from ignite.contrib.handlers.param_scheduler import ConcatScheduler, LRScheduler, create_lr_scheduler_with_warmup
-from ignite.contrib.handlers.param_scheduler import ParamGroupScheduler, PiecewiseLinear
+from ignite.contrib.handlers.param_scheduler import ParamGroupScheduler, PiecewiseLinear, ParamHistory
+from ignite.contrib.handlers.param_scheduler import ParamGroupMultiplierScheduler
 
 
 def test_linear_scheduler():
@@ -320,6 +321,58 @@ def test_save_param_history():
     assert len(state_lrs) == len(lrs)
     # Unpack singleton lists
     assert [group[0] for group in state_lrs] == lrs
+    assert state_lrs.to_numpy().shape == (len(lrs), 1)
+
+
+def test_param_history():
+    history = ParamHistory()
+    assert len(history) == 0
+    assert history.to_numpy().shape == (0, 0)
+
+    history.append([0.1, 0.2])
+    history.append([0.3, 0.4])
+    history.append([0.5, 0.6])
+    assert len(history) == 3
+    assert history[0] == [0.1, 0.2]
+    assert history[-1] == [0.5, 0.6]
+    assert history[1:] == [[0.3, 0.4], [0.5, 0.6]]
+    assert list(history) == history.tolist() == [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]]
+    np.testing.assert_array_equal(history.to_numpy(), [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]])
+    with pytest.raises(IndexError):
+        history[3]
+
+    # Number of param groups changes
+    history.append([0.7])
+    assert len(history) == 4
+    assert history[2:] == [[0.5, 0.6], [0.7]]
+
+    history = ParamHistory()
+    history.append([0.1])
+    history.append([(0.9, 0.99)])
+    assert history.tolist() == [[0.1], [(0.9, 0.99)]]
+
+
+def test_param_history_equality():
+    history = ParamHistory()
+    history.append([0.1, 0.2])
+    history.append([0.3, 0.4])
+
+    assert history == [[0.1, 0.2], [0.3, 0.4]]
+    assert [[0.1, 0.2], [0.3, 0.4]] == history
+    assert history == [(0.1, 0.2), (0.3, 0.4)]
+    assert not history != [[0.1, 0.2], [0.3, 0.4]]
+    assert history != [[0.1, 0.2]]
+    assert history != [[0.1, 0.2], [0.3, 0.5]]
+    assert history != "history"
+    assert history != 12
+
+    other = ParamHistory()
+    other.append([0.1, 0.2])
+    other.append([0.3, 0.4])
+    assert history == other
+
+    history.append([0.5])
+    assert history == [[0.1, 0.2], [0.3, 0.4], [0.5]]
 
 
 def test_lr_scheduler_asserts():
@@ -544,6 +597,59 @@ def test_simulate_values():
           milestones_values=[(10, 0.5), (20, 0.45), (21, 0.3), (30, 0.1), (40, 0.1)])
 
 
+def _run_scheduler(scheduler, num_events):
+    values = []
+    for _ in range(num_events):
+        scheduler(engine=None)
+        values.append(scheduler.optimizer_param_groups[0][scheduler.param_name])
+    return values
+
+
+def test_get_values():
+
+    def _test(scheduler_factory):
+        for num_done_events in [0, 3, 17]:
+            scheduler = scheduler_factory()
+            _run_scheduler(scheduler, num_done_events)
+            values = scheduler.get_values(100)
+            assert values.dtype == torch.float64
+            assert values.tolist() == pytest.approx(_run_scheduler(scheduler, 100))
+
+    _test(lambda: LinearCyclicalScheduler({}, "lr", 1.0, 0.0, cycle_size=10, cycle_mult=1.3,
+                                          start_value_mult=0.9, end_value_mult=1.1))
+    _test(lambda: LinearCyclicalScheduler({}, "lr", 1.2, 0.2, cycle_size=10.00000012))
+    _test(lambda: CosineAnnealingScheduler({}, "lr", 0.0, 1.0, cycle_size=7, cycle_mult=2))
+    _test(lambda: PiecewiseLinear({}, "lr", milestones_values=[(5, 0.5), (15, 1.0), (15, 0.2), (25, 0.0), (40, 0.5)]))
+
+    def _concat_scheduler():
+        optimizer = {}
+        scheduler_1 = LinearCyclicalScheduler(optimizer, "lr", start_value=1.0, end_value=0.0, cycle_size=20)
+        scheduler_2 = CosineAnnealingScheduler(optimizer, "lr", start_value=0.0, end_value=1.0, cycle_size=10)
+        scheduler_3 = PiecewiseLinear(optimizer, "lr", milestones_values=[(0, 1.0), (30, 0.0)])
+        return ConcatScheduler([scheduler_1, scheduler_2, scheduler_3], durations=[10, 15])
+
+    _test(_concat_scheduler)
+
+
+def test_precompute():
+    tensor = torch.zeros([1], requires_grad=True)
+    optimizer = torch.optim.SGD([tensor], lr=0)
+
+    scheduler_1 = LinearCyclicalScheduler(optimizer, "lr", start_value=1.0, end_value=0.0, cycle_size=20)
+    scheduler_2 = CosineAnnealingScheduler(optimizer, "lr", start_value=0.0, end_value=1.0, cycle_size=10)
+    scheduler = ConcatScheduler([scheduler_1, scheduler_2], durations=[10, ], save_history=True)
+    expected_values = scheduler.get_values(30).tolist()
+    scheduler.precompute(20)
+    assert len(scheduler_1._table) == 10 and len(scheduler_2._table) == 10
+
+    trainer = Engine(lambda engine, batch: None)
+    trainer.add_event_handler(Events.ITERATION_STARTED, scheduler)
+    trainer.run([0] * 10, max_epochs=3)
+
+    # Last 10 values are computed after the precomputed ones are consumed
+    assert [v[0] for v in trainer.state.param_history['lr']] == pytest.approx(expected_values)
+
+
 def test_create_lr_scheduler_with_warmup():
     with pytest.raises(TypeError):
         create_lr_scheduler_with_warmup(12, warmup_start_value=0.0, warmup_end_value=0.1, warmup_duration=10)
@@ -712,6 +818,42 @@ def test_param_group_scheduler():
     _test([lr_scheduler1, lr_scheduler2], optimizer)
 
 
+def test_param_group_multiplier_scheduler():
+    tensors = [torch.zeros([1], requires_grad=True) for _ in range(3)]
+    optimizer = torch.optim.SGD([{"params": t} for t in tensors], lr=0.1)
+    multipliers = [0.25, 0.5, 1.0]
+
+    with pytest.raises(TypeError):
+        ParamGroupMultiplierScheduler(optimizer, None, multipliers)
+
+    with pytest.raises(ValueError):
+        ParamGroupMultiplierScheduler(optimizer, LinearCyclicalScheduler({}, "lr", 1.0, 0.0, 10), [1.0])
+
+    def _test(precompute):
+        base_scheduler = LinearCyclicalScheduler({}, "lr", start_value=1.0, end_value=0.0, cycle_size=10)
+        expected = [[lr * m for m in multipliers] for lr in base_scheduler.get_values(20).tolist()]
+        scheduler = ParamGroupMultiplierScheduler(optimizer, base_scheduler, multipliers, save_history=True)
+        np.testing.assert_allclose(scheduler.get_values(20).numpy(), expected)
+        if precompute:
+            scheduler.precompute(15)
+
+        lrs = []
+        trainer = Engine(lambda engine, batch: None)
+        trainer.add_event_handler(Events.ITERATION_STARTED, scheduler)
+
+        @trainer.on(Events.ITERATION_COMPLETED)
+        def save_lr(engine):
+            lrs.append([pg['lr'] for pg in optimizer.param_groups])
+
+        trainer.run([0] * 10, max_epochs=2)
+
+        np.testing.assert_allclose(lrs, expected)
+        np.testing.assert_allclose(trainer.state.param_history["lr"].to_numpy(), expected)
+
+    _test(precompute=False)
+    _test(precompute=True)
+
+
 def test_create_lr_scheduler_with_warmup_with_real_model(dummy_model_factory):
 
     model = dummy_model_factory(with_grads=False, with_frozen_layer=False)
@@ -296,6 +296,31 @@ def test_integration_as_context_manager():
         trainer.run(data, max_epochs=n_epochs)
 
 
+def test_log_metrics_buffered():
+
+    from ignite.contrib.handlers.base_logger import _BackgroundFlusher
+
+    # Create the logger without polyaxon Experiment
+    plx_logger = PolyaxonLogger.__new__(PolyaxonLogger)
+    plx_logger.experiment = MagicMock()
+    plx_logger._flusher = _BackgroundFlusher(plx_logger._log_batch, buffer_size=1000, flush_secs=100.0)
+
+    plx_logger.log_metrics(step=1, a=1)
+    plx_logger.log_metrics(step=1, b=2)
+    plx_logger.log_metrics(step=1, a=3)
+    plx_logger.log_metrics(step=2, a=4)
+    plx_logger.log_metrics(c=5)
+    assert plx_logger.experiment.log_metrics.call_count == 0
+
+    plx_logger.close()
+    assert plx_logger.experiment.log_metrics.call_args_list == [
+        call(step=1, a=1, b=2),
+        call(step=1, a=3),
+        call(step=2, a=4),
+        call(c=5),
+    ]
+
+
 @pytest.fixture
 def no_site_packages():
     import sys
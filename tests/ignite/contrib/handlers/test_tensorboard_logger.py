@@ -1,5 +1,6 @@
 import os
 import math
+import time
 
 import pytest
 
@@ -8,6 +9,7 @@ from mock import MagicMock, call, ANY, patch
 import torch
 
 from ignite.engine import Engine, Events, State
+from ignite.contrib.handlers import tensorboard_logger
 from ignite.contrib.handlers.tensorboard_logger import *
 
 
@@ -388,6 +390,79 @@ def test_weights_hist_handler_frozen_layers(dummy_model_factory):
     assert mock_logger.writer.add_histogram.call_count == 2
 
 
+def test_weights_hist_handler_wrong_args():
+
+    model = MagicMock(spec=torch.nn.Module)
+    with pytest.raises(ValueError, match="Argument bins should be a positive integer"):
+        WeightsHistHandler(model, bins=0)
+
+    with pytest.raises(ValueError, match="Argument sample_size should be a positive integer"):
+        GradsHistHandler(model, sample_size=-1)
+
+
+def test_weights_hist_handler_bins(dummy_model_factory):
+
+    model = dummy_model_factory(with_grads=True, with_frozen_layer=False)
+    model.fc1.weight.data.copy_(torch.arange(100.0).reshape(10, 10))
+
+    wrapper = WeightsHistHandler(model, bins=10)
+    mock_logger = MagicMock(spec=TensorboardLogger)
+    mock_logger.writer = MagicMock()
+
+    mock_engine = MagicMock()
+    mock_engine.state = State()
+    mock_engine.state.epoch = 5
+
+    wrapper(mock_engine, mock_logger, Events.EPOCH_STARTED)
+
+    assert mock_logger.writer.add_histogram.call_count == 0
+    assert mock_logger.writer.add_histogram_raw.call_count == 4
+
+    kwargs = [c[1] for c in mock_logger.writer.add_histogram_raw.call_args_list
+              if c[1]["tag"] == "weights/fc1/weight"][0]
+    assert kwargs["global_step"] == 5
+    assert kwargs["min"] == 0.0
+    assert kwargs["max"] == 99.0
+    assert kwargs["num"] == 100
+    assert kwargs["sum"] == pytest.approx(sum(range(100)))
+    assert kwargs["sum_squares"] == pytest.approx(sum(i * i for i in range(100)))
+    assert len(kwargs["bucket_limits"]) == len(kwargs["bucket_counts"]) == 11
+    assert kwargs["bucket_counts"] == [0] + [10] * 10
+
+    # Constant weights are counted in a single bucket
+    kwargs = [c[1] for c in mock_logger.writer.add_histogram_raw.call_args_list
+              if c[1]["tag"] == "weights/fc2/weight"][0]
+    assert kwargs["min"] == kwargs["max"] == 1.0
+    assert kwargs["num"] == 144
+    assert kwargs["bucket_limits"] == [1.0]
+    assert kwargs["bucket_counts"] == [144]
+
+
+def test_grads_hist_handler_sample_size(dummy_model_factory):
+
+    model = dummy_model_factory(with_grads=True, with_frozen_layer=False)
+
+    def _test(bins):
+        wrapper = GradsHistHandler(model, bins=bins, sample_size=20)
+        mock_logger = MagicMock(spec=TensorboardLogger)
+        mock_logger.writer = MagicMock()
+
+        mock_engine = MagicMock()
+        mock_engine.state = State()
+        mock_engine.state.epoch = 5
+
+        wrapper(mock_engine, mock_logger, Events.EPOCH_STARTED)
+
+        if bins is None:
+            sizes = {c[1]["tag"]: c[1]["values"].size for c in mock_logger.writer.add_histogram.call_args_list}
+        else:
+            sizes = {c[1]["tag"]: c[1]["num"] for c in mock_logger.writer.add_histogram_raw.call_args_list}
+        assert sizes == {"grads/fc1/weight": 20, "grads/fc1/bias": 10, "grads/fc2/weight": 20, "grads/fc2/bias": 12}
+
+    _test(bins=None)
+    _test(bins=8)
+
+
 def test_grads_scalar_handler_wrong_setup():
 
     with pytest.raises(TypeError, match="Argument model should be of type torch.nn.Module"):
@@ -612,3 +687,70 @@ def test_no_tensorboardX_nor_torch_utils_tensorboard():
     with patch.dict('sys.modules', {'tensorboardX': None, 'torch.utils.tensorboard': None}):
         with pytest.raises(RuntimeError, match=r'This contrib module requires either tensorboardX or torch'):
             TensorboardLogger(log_dir=None)
+
+
+def test_buffered_writer():
+
+    mock_writer = MagicMock()
+    writer = tensorboard_logger._BufferedSummaryWriter(mock_writer, buffer_size=1000, flush_secs=100.0)
+
+    for i in range(10):
+        writer.add_scalar("tag", i, i)
+    writer.add_histogram(tag="hist", values=[1, 2], global_step=0)
+    mock_writer.add_histogram.assert_called_once_with(tag="hist", values=[1, 2], global_step=0)
+
+    assert mock_writer.add_scalar.call_count == 0
+    writer.flush()
+    assert mock_writer.add_scalar.call_count == 10
+    assert [c[0][:3] for c in mock_writer.add_scalar.call_args_list] == [("tag", i, i) for i in range(10)]
+
+    writer.add_scalar("tag", 10, 10)
+    writer.close()
+    assert mock_writer.add_scalar.call_count == 11
+    mock_writer.close.assert_called_once_with()
+
+
+def test_buffered_writer_flush_on_size():
+
+    mock_writer = MagicMock()
+    writer = tensorboard_logger._BufferedSummaryWriter(mock_writer, buffer_size=5, flush_secs=100.0)
+
+    for i in range(5):
+        writer.add_scalar("tag", i, i)
+
+    for _ in range(100):
+        if mock_writer.add_scalar.call_count == 5:
+            break
+        time.sleep(0.01)
+    assert mock_writer.add_scalar.call_count == 5
+    writer.close()
+
+
+def test_buffered_writer_error():
+
+    mock_writer = MagicMock()
+    mock_writer.add_scalar.side_effect = ValueError("bad value")
+    writer = tensorboard_logger._BufferedSummaryWriter(mock_writer, buffer_size=1000, flush_secs=100.0)
+    writer.add_scalar("tag", 0, 0)
+    with pytest.raises(ValueError, match="bad value"):
+        writer.close()
+    mock_writer.close.assert_called_once_with()
+
+
+def test_integration_buffered(dirname):
+
+    n_epochs = 5
+    data = list(range(50))
+
+    trainer = Engine(lambda engine, batch: torch.tensor(0.5))
+
+    with TensorboardLogger(log_dir=dirname, buffer_size=10) as tb_logger:
+        assert isinstance(tb_logger.writer, tensorboard_logger._BufferedSummaryWriter)
+        tb_logger.attach(trainer,
+                         log_handler=OutputHandler(tag="training", output_transform=lambda x: {"loss": x}),
+                         event_name=Events.ITERATION_COMPLETED)
+        trainer.run(data, max_epochs=n_epochs)
+
+    written_files = os.listdir(dirname)
+    written_files = [f for f in written_files if "tfevents" in f]
+    assert len(written_files) > 0
@@ -345,3 +345,84 @@ def test_pbar_with_nan_input():
     assert engine.should_terminate
     assert engine.state.iteration == 1001
     assert engine.state.epoch == 1
+
+
+def test_pbar_with_refresh_interval(capsys):
+
+    n_epochs = 2
+    loader = list(range(100))
+    engine = Engine(update_fn)
+
+    n_calls = [0]
+
+    def output_transform(output):
+        n_calls[0] += 1
+        return output
+
+    pbar = ProgressBar(refresh_interval=1000.0)
+    pbar.attach(engine, output_transform=output_transform)
+
+    engine.run(loader, max_epochs=n_epochs)
+
+    # Bar is rendered on the first and the last iteration of each epoch only
+    assert n_calls[0] == 2 * n_epochs
+
+    captured = capsys.readouterr()
+    err = captured.err.split('\r')
+    err = list(map(lambda x: x.strip(), err))
+    err = list(filter(None, err))
+    expected = u'Epoch [2/2]: [1/100]   1%|          , output=1 [00:00<00:00]'
+    assert expected in err
+
+
+def test_pbar_with_refresh_interval_close():
+
+    pbar = ProgressBar(refresh_interval=1000.0)
+    pbar._reset(pbar_total=100)
+    bar = pbar.pbar
+
+    assert pbar._should_refresh()
+    pbar._update()
+    for _ in range(10):
+        assert not pbar._should_refresh()
+    assert bar.n == 1
+
+    # Pending events are rendered on close
+    pbar._close(None)
+    assert pbar.pbar is None
+    assert bar.n == 11
+
+
+def test_pbar_with_epoch_length(capsys):
+
+    def infinite_data():
+        while True:
+            yield 1
+
+    engine = Engine(update_fn)
+    pbar = ProgressBar()
+    pbar.attach(engine, output_transform=lambda x: x)
+    engine.run(infinite_data(), max_epochs=2, epoch_length=4)
+
+    captured = capsys.readouterr()
+    err = captured.err.split('\r')
+    err = list(map(lambda x: x.strip(), err))
+    err = list(filter(None, err))
+    expected = u'Epoch [2/2]: [3/4]  75%|███████▌  , output=1 [00:00<00:00]'
+    assert err[-1] == expected
+
+
+def test_pbar_with_unsized_data():
+
+    def finite_data():
+        for i in range(3):
+            yield i
+
+    engine = Engine(update_fn)
+    pbar = ProgressBar()
+    pbar.attach(engine)
+    state = engine.run(finite_data())
+
+    assert state.epoch_length is None
+    assert state.iteration == 3
+    assert pbar.pbar is None
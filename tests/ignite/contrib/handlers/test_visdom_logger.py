@@ -4,7 +4,7 @@ import shutil
 import torch
 import pytest
 
-from mock import MagicMock, call, ANY
+from mock import MagicMock, call, ANY, patch
 
 from ignite.engine import Engine, Events, State
 from ignite.contrib.handlers.visdom_logger import *
@@ -734,6 +734,77 @@ def test_integration_with_executor_as_context_manager(visdom_server):
         assert all([y == y_true for y, y_true in zip(y_vals, losses)])
 
 
+class _StubVisdom(object):
+    """Visdom client stub recording requests instead of sending them to a server"""
+
+    def __init__(self, *args, **kwargs):
+        self.env = "main"
+        self.lines = []
+        self.n_saves = 0
+
+    def check_connection(self):
+        return True
+
+    def line(self, X, Y, env, win, update, opts, name):
+        self.lines.append((list(X), list(Y), win, update, name))
+        return win if win is not None else "win_{}".format(name)
+
+    def save(self, envs):
+        self.n_saves += 1
+
+
+def test_integration_buffered():
+
+    n_epochs = 3
+    data = list(range(50))
+
+    trainer = Engine(lambda engine, batch: {"a": 1.0, "b": 2.0})
+
+    with patch("visdom.Visdom", _StubVisdom):
+        vd_logger = VisdomLogger(buffer_size=10000, flush_secs=1000.0)
+    vis = vd_logger.vis
+
+    vd_logger.attach(trainer,
+                     log_handler=OutputHandler(tag="training", output_transform=lambda x: x),
+                     event_name=Events.ITERATION_COMPLETED)
+
+    trainer.run(data, max_epochs=n_epochs)
+    assert len(vis.lines) == 0
+
+    vd_logger.close()
+
+    # All points of a window are sent with a single request which creates the window
+    n_iterations = n_epochs * len(data)
+    assert len(vis.lines) == 2
+    assert vis.n_saves == 1
+    for name, value in [("training/a", 1.0), ("training/b", 2.0)]:
+        xs, ys, win, update, _ = [line for line in vis.lines if line[4] == name][0]
+        assert xs == list(range(1, n_iterations + 1))
+        assert ys == [value] * n_iterations
+        assert win is None and update is None
+
+
+def test_send_lines_appends_to_existing_windows():
+
+    with patch("visdom.Visdom", _StubVisdom):
+        vd_logger = VisdomLogger(buffer_size=10000, flush_secs=1000.0)
+    vis = vd_logger.vis
+
+    drawer = _BaseVisDrawer()
+    for i in range(3):
+        drawer.add_scalar(vd_logger, "loss", float(i), Events.ITERATION_COMPLETED, i)
+    vd_logger._flusher.flush()
+    for i in range(3, 5):
+        drawer.add_scalar(vd_logger, "loss", float(i), Events.ITERATION_COMPLETED, i)
+    vd_logger.close()
+
+    assert vis.lines == [
+        ([0, 1, 2], [0.0, 1.0, 2.0], None, None, "loss"),
+        ([3, 4], [3.0, 4.0], "win_loss", "append", "loss"),
+    ]
+    assert drawer.windows["loss"]["win"] == "win_loss"
+
+
 @pytest.fixture
 def no_site_packages():
     import sys
@@ -1,6 +1,9 @@
 from __future__ import division
+from collections import defaultdict
 from enum import Enum
 import gc
+import multiprocessing
+import warnings
 
 import pytest
 from mock import call, MagicMock, Mock
@@ -12,7 +15,7 @@ from torch.nn.functional import mse_loss
 from torch.optim import SGD
 
 from ignite.engine import Engine, Events, State, create_supervised_trainer, create_supervised_evaluator
-from ignite.metrics import MeanSquaredError
+from ignite.metrics import Accuracy, MeanSquaredError, Precision, Recall
 
 
 def process_func(engine, batch):
@@ -594,6 +597,106 @@ def test_iteration_events_are_fired():
     assert mock_manager.mock_calls == expected_calls
 
 
+def test_run_with_epoch_length():
+
+    def infinite_data():
+        i = 0
+        while True:
+            i += 1
+            yield i
+
+    engine = Engine(lambda e, b: b)
+    epoch_batches = []
+
+    @engine.on(Events.EPOCH_COMPLETED)
+    def store_batch(engine):
+        epoch_batches.append(engine.state.batch)
+
+    state = engine.run(infinite_data(), max_epochs=3, epoch_length=4)
+    assert state.epoch == 3
+    assert state.iteration == 12
+    assert state.epoch_length == 4
+    # a single iterator is consumed across epochs
+    assert epoch_batches == [4, 8, 12]
+
+
+def test_run_with_epoch_length_restarts_exhausted_iterator():
+    data = [1, 2, 3]
+    engine = Engine(lambda e, b: b)
+    batches = []
+
+    @engine.on(Events.ITERATION_COMPLETED)
+    def store_batch(engine):
+        batches.append(engine.state.batch)
+
+    state = engine.run(data, max_epochs=2, epoch_length=2)
+    assert state.iteration == 4
+    assert batches == [1, 2, 3, 1]
+
+
+def test_run_with_epoch_length_and_exhausted_data():
+
+    def finite_data():
+        for i in range(5):
+            yield i
+
+    engine = Engine(lambda e, b: b)
+    completed_epochs = []
+    engine.add_event_handler(Events.EPOCH_COMPLETED, lambda e: completed_epochs.append(e.state.epoch))
+
+    state = engine.run(finite_data(), max_epochs=3, epoch_length=2)
+    assert state.iteration == 5
+    assert completed_epochs == [1, 2]
+
+
+def test_run_epoch_length_default():
+    engine = Engine(lambda e, b: b)
+    assert engine.run([1, 2, 3]).epoch_length == 3
+    assert engine.run(iter([1, 2, 3])).epoch_length is None
+
+    with raises(ValueError):
+        engine.run([1, 2, 3], epoch_length=0)
+
+
+def _count_worker_start(worker_id):
+    with _worker_starts.get_lock():
+        _worker_starts.value += 1
+
+
+_worker_starts = multiprocessing.Value("i", 0)
+
+
+def test_run_with_persistent_iterator():
+    from torch.utils.data import DataLoader
+
+    _worker_starts.value = 0
+    dataset = torch.arange(12)
+    data = DataLoader(dataset, batch_size=4, shuffle=True, num_workers=1, worker_init_fn=_count_worker_start)
+
+    epoch_samples = defaultdict(list)
+    engine = Engine(lambda e, b: b)
+
+    @engine.on(Events.ITERATION_COMPLETED)
+    def store_samples(engine):
+        epoch_samples[engine.state.epoch].extend(engine.state.batch.tolist())
+
+    state = engine.run(data, max_epochs=3, persistent_iterator=True)
+    assert state.epoch_length == 3
+    assert state.iteration == 9
+    # worker is started once per run
+    assert _worker_starts.value == 1
+    for epoch in range(1, 4):
+        assert sorted(epoch_samples[epoch]) == list(range(12))
+
+    engine = Engine(lambda e, b: b)
+    state = engine.run([1, 2, 3], max_epochs=2, persistent_iterator=True)
+    assert state.iteration == 6
+    assert state.batch == 3
+
+    with raises(ValueError):
+        engine.run(iter([1, 2, 3]), persistent_iterator=True)
+
+
 def test_create_supervised_trainer():
     model = Linear(1, 1)
     model.weight.data.zero_()
@@ -615,6 +718,275 @@ def test_create_supervised_trainer():
     assert model.bias.item() == approx(0.8)
 
 
+def test_create_supervised_trainer_wrong_args():
+    model = Linear(1, 1)
+    optimizer = SGD(model.parameters(), 0.1)
+
+    with pytest.raises(ValueError):
+        create_supervised_trainer(model, optimizer, mse_loss, accumulation_steps=0)
+
+    with pytest.raises(ValueError):
+        create_supervised_trainer(model, optimizer, mse_loss, micro_batch_size=0.5)
+
+
+def test_create_supervised_trainer_with_micro_batches():
+    model = Linear(1, 1)
+    model.weight.data.zero_()
+    model.bias.data.zero_()
+    optimizer = SGD(model.parameters(), 0.1)
+    trainer = create_supervised_trainer(model, optimizer, mse_loss, micro_batch_size=1,
+                                        output_transform=lambda x, y, y_pred, loss: (y_pred, loss.item()))
+
+    x = torch.FloatTensor([[1.0], [2.0]])
+    y = torch.FloatTensor([[3.0], [5.0]])
+    data = [(x, y)]
+
+    state = trainer.run(data)
+
+    y_pred, loss = state.output
+    assert y_pred.shape == (2, 1)
+    assert loss == approx(17.0)
+    assert model.weight.data[0, 0].item() == approx(1.3)
+    assert model.bias.item() == approx(0.8)
+
+
+def test_create_supervised_trainer_with_accumulation_steps():
+    model = Linear(1, 1)
+    model.weight.data.zero_()
+    model.bias.data.zero_()
+    optimizer = SGD(model.parameters(), 0.1)
+    trainer = create_supervised_trainer(model, optimizer, mse_loss, accumulation_steps=2)
+
+    data = [(torch.FloatTensor([[1.0]]), torch.FloatTensor([[3.0]])),
+            (torch.FloatTensor([[2.0]]), torch.FloatTensor([[5.0]]))]
+
+    @trainer.on(Events.ITERATION_COMPLETED)
+    def check_no_step(engine):
+        if engine.state.iteration == 1:
+            assert model.weight.data[0, 0].item() == approx(0.0)
+
+    state = trainer.run(data)
+
+    # Same step as with a single batch of 2 samples
+    assert state.output == approx(25.0)
+    assert model.weight.data[0, 0].item() == approx(1.3)
+    assert model.bias.item() == approx(0.8)
+
+
+def test_create_supervised_trainer_accumulation_steps_last_group():
+    model = Linear(1, 1)
+    model.weight.data.zero_()
+    model.bias.data.zero_()
+    optimizer = SGD(model.parameters(), 0.1)
+    trainer = create_supervised_trainer(model, optimizer, mse_loss, accumulation_steps=2)
+
+    n_steps = [0]
+    optimizer_step = optimizer.step
+
+    def step(*args, **kwargs):
+        n_steps[0] += 1
+        return optimizer_step(*args, **kwargs)
+
+    optimizer.step = step
+
+    data = [(torch.FloatTensor([[1.0]]), torch.FloatTensor([[3.0]])) for _ in range(5)]
+    trainer.run(data)
+    assert n_steps[0] == 3
+
+    # The last group of a single batch makes a full step
+    model.weight.data.zero_()
+    model.bias.data.zero_()
+    n_steps[0] = 0
+    trainer.run(data[:1])
+    assert n_steps[0] == 1
+    assert model.weight.data[0, 0].item() == approx(0.6)
+    assert model.bias.item() == approx(0.6)
+
+    n_steps[0] = 0
+    trainer.run(data, max_epochs=2)
+    assert n_steps[0] == 6
+
+
+def test_create_supervised_trainer_compiled():
+    model = Linear(1, 1)
+    model.weight.data.zero_()
+    model.bias.data.zero_()
+    optimizer = SGD(model.parameters(), 0.1)
+    trainer = create_supervised_trainer(model, optimizer, mse_loss, compile="script")
+
+    x = torch.FloatTensor([[1.0], [2.0]])
+    y = torch.FloatTensor([[3.0], [5.0]])
+    data = [(x, y)]
+
+    state = trainer.run(data)
+
+    assert state.output == approx(17.0)
+    assert state.compile_time > 0.0
+    assert model.weight.data[0, 0].item() == approx(1.3)
+    assert model.bias.item() == approx(0.8)
+
+    with pytest.raises(ValueError):
+        create_supervised_trainer(model, optimizer, mse_loss, compile="abc")
+
+    # Tracing is evaluator-only
+    with pytest.raises(ValueError, match=r"trace"):
+        create_supervised_trainer(model, optimizer, mse_loss, compile="trace")
+
+
+def test_create_supervised_evaluator_compiled():
+    model = Linear(1, 1)
+    model.weight.data.fill_(2.0)
+    model.bias.data.zero_()
+
+    for mode in ["trace", "script"]:
+        evaluator = create_supervised_evaluator(model, compile=mode)
+        data = [(torch.rand(4, 1), torch.rand(4, 1)), (torch.rand(3, 1), torch.rand(3, 1))]
+        compile_times = []
+
+        @evaluator.on(Events.ITERATION_COMPLETED)
+        def check_output(engine):
+            y_pred, _ = engine.state.output
+            x, _ = data[(engine.state.iteration - 1) % len(data)]
+            assert torch.allclose(y_pred, 2.0 * x)
+            compile_times.append(engine.state.compile_time)
+
+        evaluator.run(data, max_epochs=2)
+        if mode == "trace":
+            # traced per input shape
+            assert compile_times[0] < compile_times[1] == compile_times[2] == compile_times[3]
+        else:
+            assert compile_times[0] == compile_times[1] == compile_times[2] == compile_times[3]
+
+
+def test_create_supervised_evaluator_compile_fallback():
+
+    class NotScriptable(torch.nn.Module):
+        def __init__(self):
+            super(NotScriptable, self).__init__()
+            self.fn = lambda x: x * 2.0
+
+        def forward(self, x):
+            return self.fn(x)
+
+    evaluator = create_supervised_evaluator(NotScriptable(), compile="script")
+    x = torch.rand(4, 1)
+
+    with pytest.warns(UserWarning, match=r"Failed to compile the model"):
+        state = evaluator.run([(x, x)])
+
+    y_pred, _ = state.output
+    assert torch.allclose(y_pred, 2.0 * x)
+    assert state.compile_time == 0.0
+
+
+def test_create_supervised_evaluator_trace_check_fallback():
+
+    class DataDependent(torch.nn.Module):
+        def forward(self, x):
+            if x.sum() > 0:
+                return x * 2.0
+            return -x
+
+    evaluator = create_supervised_evaluator(DataDependent(), compile="trace")
+    x = torch.rand(4, 1)
+    data = [(x, x), (-x, x)]
+
+    with pytest.warns(UserWarning, match=r"Failed to compile the model"):
+        state = evaluator.run(data)
+
+    # Traced with the first batch, the second batch would take the wrong branch
+    y_pred, _ = state.output
+    assert torch.allclose(y_pred, x)
+    assert state.compile_time == 0.0
+
+
+def test_create_supervised_evaluator_trace_restores_buffers():
+
+    class Counting(torch.nn.Module):
+        def __init__(self):
+            super(Counting, self).__init__()
+            self.register_buffer("calls", torch.zeros(1))
+
+        def forward(self, x):
+            self.calls.add_(1.0)
+            return x * 2.0
+
+    model = Counting()
+    evaluator = create_supervised_evaluator(model, compile="trace")
+    x = torch.rand(4, 1)
+    state = evaluator.run([(x, x)])
+
+    # Runs of the model checking the trace are not counted
+    assert model.calls.item() == 1.0
+    assert state.compile_time > 0.0
+
+
+def test_create_supervised_evaluator_compiled_model_error():
+
+    class Failing(torch.nn.Module):
+        def forward(self, x):
+            return x.view(-1, 3)
+
+    evaluator = create_supervised_evaluator(Failing(), compile="script")
+    x = torch.rand(4, 1)
+
+    with warnings.catch_warnings(record=True) as record:
+        warnings.simplefilter("always")
+        with pytest.raises(RuntimeError, match=r"shape"):
+            evaluator.run([(x, x)])
+
+    # The error of the scripted model is raised without falling back to eager mode
+    assert not any("Failed to compile" in str(r.message) for r in record)
+
+
+def test_create_supervised_evaluator_bf16_autocast():
+    torch.manual_seed(12)
+    model = torch.nn.Sequential(Linear(8, 16), torch.nn.ReLU(), Linear(16, 3))
+    x = torch.rand(64, 8)
+    y = model(x).argmax(dim=1).detach()
+    data = [(x[i:i + 16], y[i:i + 16]) for i in range(0, 64, 16)]
+
+    def make_metrics():
+        return {"accuracy": Accuracy(), "precision": Precision(average=True), "recall": Recall(average=True)}
+
+    fp32_state = create_supervised_evaluator(model, metrics=make_metrics()).run(data)
+    bf16_evaluator = create_supervised_evaluator(model, metrics=make_metrics(), autocast_dtype=torch.bfloat16)
+    bf16_state = bf16_evaluator.run(data)
+
+    y_pred, _ = bf16_state.output
+    assert y_pred.dtype == torch.float32
+    for name, value in fp32_state.metrics.items():
+        assert bf16_state.metrics[name] == approx(value, abs=0.05)
+
+    # regression metric accumulates in float64 from float32 predictions
+    model = Linear(8, 1)
+    data = [(x, x.sum(dim=1, keepdim=True))]
+    fp32_mse = create_supervised_evaluator(model, metrics={"mse": MeanSquaredError()}).run(data).metrics["mse"]
+    bf16_mse = create_supervised_evaluator(model, metrics={"mse": MeanSquaredError()},
+                                           autocast_dtype=torch.bfloat16).run(data).metrics["mse"]
+    assert bf16_mse == approx(fp32_mse, rel=0.05)
+
+
+def test_create_supervised_trainer_bf16_autocast():
+    torch.manual_seed(12)
+    x = torch.rand(32, 4)
+    y = x.sum(dim=1, keepdim=True)
+
+    losses = []
+    for autocast_dtype in [None, torch.bfloat16]:
+        model = Linear(4, 1)
+        model.weight.data.fill_(0.5)
+        model.bias.data.zero_()
+        optimizer = SGD(model.parameters(), 0.1)
+        trainer = create_supervised_trainer(model, optimizer, mse_loss, autocast_dtype=autocast_dtype)
+        state = trainer.run([(x, y)] * 5)
+        assert isinstance(state.output, float)
+        assert model.weight.dtype == torch.float32
+        losses.append(state.output)
+
+    assert losses[1] == approx(losses[0], rel=0.05, abs=1e-3)
+
+
 def test_create_supervised_trainer_with_cpu():
     model = Linear(1, 1)
     model.weight.data.zero_()
@@ -352,3 +352,121 @@ def test_save_model_optimizer_lr_scheduler_with_state_dict(dirname):
         lr_scheduler_value = lr_scheduler_state_dict[key]
         loaded_lr_scheduler_value = loaded_lr_scheduler_state_dict[key]
         assert lr_scheduler_value == loaded_lr_scheduler_value
+
+
+def test_best_k_ties_are_not_saved(dirname):
+    scores = iter([1.0, 2.0, 1.0, 2.0, 1.5])
+
+    def score_function(engine):
+        return next(scores)
+
+    h = ModelCheckpoint(dirname, _PREFIX, create_dir=False,
+                        n_saved=2, score_function=score_function,
+                        save_as_state_dict=False)
+
+    saved = []
+
+    def _save(obj, path):
+        saved.append(path)
+        torch.save(obj, path)
+
+    h._save = _save
+
+    to_save = {'name': 42}
+    for _ in range(5):
+        h(None, to_save)
+
+    # 3rd score ties with the lowest retained one and 5th is below it: neither is serialized
+    assert len(saved) == 3
+    expected = ['{}_{}_{}.pth'.format(_PREFIX, 'name', i)
+                for i in [2, 4]]
+
+    assert sorted(os.listdir(dirname)) == expected
+
+
+def test_best_k_with_manifest(dirname):
+    scores = iter([1.0, -2., 3.0, -4.0, 0.5, 4.0])
+
+    def score_function(engine):
+        return next(scores)
+
+    h = ModelCheckpoint(dirname, _PREFIX, create_dir=False,
+                        n_saved=2, score_function=score_function,
+                        save_as_state_dict=False, save_manifest=True)
+
+    to_save = {'name': 42}
+    for _ in range(4):
+        h(None, to_save)
+
+    manifest = '{}_manifest.json'.format(_PREFIX)
+    expected = ['{}_{}_{}.pth'.format(_PREFIX, 'name', i)
+                for i in [1, 3]]
+    assert sorted(os.listdir(dirname)) == [manifest] + expected
+
+    # Restart from the manifest: retention and step numbering (as of the last save) are restored
+    h = ModelCheckpoint(dirname, _PREFIX, create_dir=False, require_empty=False,
+                        n_saved=2, score_function=score_function,
+                        save_as_state_dict=False, save_manifest=True)
+    for _ in range(2):
+        h(None, to_save)
+
+    expected = ['{}_{}_{}.pth'.format(_PREFIX, 'name', i)
+                for i in [3, 5]]
+    assert sorted(os.listdir(dirname)) == [manifest] + expected
+
+
+def test_invalid_manifest(dirname):
+    manifest = os.path.join(dirname, '{}_manifest.json'.format(_PREFIX))
+
+    def make_handler():
+        return ModelCheckpoint(dirname, _PREFIX, create_dir=False, require_empty=False,
+                               n_saved=2, save_interval=1, save_as_state_dict=False, save_manifest=True)
+
+    invalid_manifests = [
+        '{"iteration": 2',
+        '[1, 2]',
+        '{"iteration": -1, "saved": []}',
+        '{"iteration": 2, "saved": [[1.0, 3, ["PREFIX_name_3.pth"]]]}',
+        '{"iteration": 2, "saved": [[1.0, 1, ["../outside.pth"]]]}',
+        '{"iteration": 2, "saved": [[1.0, 1, ["other_name_1.pth"]]]}',
+        '{"iteration": 2, "saved": [["1.0", 1, ["PREFIX_name_1.pth"]]]}',
+    ]
+    for content in invalid_manifests:
+        with open(manifest, "w") as f:
+            f.write(content.replace("PREFIX", _PREFIX))
+        with pytest.raises(ValueError, match=r"Manifest"):
+            make_handler()
+
+    # Entries of missing checkpoint files are not retained
+    fname = '{}_name_2.pth'.format(_PREFIX)
+    open(os.path.join(dirname, fname), "w").close()
+    with open(manifest, "w") as f:
+        f.write('{{"iteration": 2, "saved": [[1.0, 1, ["{}_name_1.pth"]], [2.0, 2, ["{}"]]]}}'
+                .format(_PREFIX, fname))
+    with pytest.warns(UserWarning, match=r"not found"):
+        h = make_handler()
+
+    to_save = {'name': 42}
+    for _ in range(2):
+        h(None, to_save)
+    expected = ['{}_{}_{}.pth'.format(_PREFIX, 'name', i) for i in [3, 4]]
+    assert sorted(os.listdir(dirname)) == sorted([os.path.basename(manifest)] + expected)
+
+
+def test_manifest_with_smaller_n_saved(dirname):
+    to_save = {'name': 42}
+    h = ModelCheckpoint(dirname, _PREFIX, create_dir=False, n_saved=5, save_interval=1,
+                        save_as_state_dict=False, save_manifest=True)
+    for _ in range(5):
+        h(None, to_save)
+
+    h = ModelCheckpoint(dirname, _PREFIX, create_dir=False, require_empty=False, n_saved=2, save_interval=1,
+                        save_as_state_dict=False, save_manifest=True)
+    manifest = '{}_manifest.json'.format(_PREFIX)
+    expected = ['{}_{}_{}.pth'.format(_PREFIX, 'name', i) for i in [4, 5]]
+    assert sorted(os.listdir(dirname)) == [manifest] + expected
+
+    for _ in range(3):
+        h(None, to_save)
+    expected = ['{}_{}_{}.pth'.format(_PREFIX, 'name', i) for i in [7, 8]]
+    assert sorted(os.listdir(dirname)) == [manifest] + expected
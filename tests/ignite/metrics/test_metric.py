@@ -266,7 +266,8 @@ def test_attach():
     assert m1.update_count == 50
 
     assert m2.reset_count == 5
-    assert m2.compute_count == 10
+    # computed once per epoch, results are shared by both names
+    assert m2.compute_count == 5
     assert m2.update_count == 50
 
 
@@ -1,4 +1,4 @@
-from ignite.engine import Engine
+from ignite.engine import Engine, Events
 from ignite.metrics import Metric, MetricsLambda, Precision, Recall
 from pytest import approx
 from sklearn.metrics import precision_score, recall_score, f1_score
@@ -292,3 +292,64 @@ def test_recursive_attachment():
         return 2.0 + 0.2 * (p1 * p2 + p1 - p2) ** 0.5
 
     _test(some_metric, "some metric", compute_true_somemetric)
+
+
+def test_dependencies_computed_once_per_event():
+
+    class CountingMetric(ListGatherMetric):
+
+        def __init__(self, index):
+            super(CountingMetric, self).__init__(index)
+            self.num_computes = 0
+
+        def compute(self):
+            self.num_computes += 1
+            return super(CountingMetric, self).compute()
+
+    m0 = CountingMetric(0)
+    m1 = CountingMetric(1)
+
+    engine = Engine(lambda engine, batch: batch)
+
+    m0.attach(engine, 'm0')
+    m0_plus_m1 = m0 + m1
+    m0_plus_m1.attach(engine, 'm0_plus_m1')
+    (m0_plus_m1 * m0).attach(engine, 'product')
+
+    engine.run([[1, 10], [2, 20]], max_epochs=3)
+    assert engine.state.metrics == {'m0': 2, 'm0_plus_m1': 22, 'product': 44}
+    assert m0.num_computes == 3
+    assert m1.num_computes == 3
+
+    # Not cached outside of engine's events
+    m0.compute()
+    assert m0.num_computes == 4
+
+
+def test_shared_dependencies_computed_once():
+
+    class CountingPrecision(Precision):
+        num_computes = 0
+
+        def compute(self):
+            CountingPrecision.num_computes += 1
+            return super(CountingPrecision, self).compute()
+
+    precision = CountingPrecision(average=False)
+    recall = Recall(average=False)
+    F1 = precision * recall * 2 / (precision + recall + 1e-20)
+    F1 = MetricsLambda(lambda t: torch.mean(t).item(), F1)
+    assert F1._get_source_metrics() == [precision, recall]
+
+    evaluator = Engine(lambda engine, batch: batch)
+    F1.attach(evaluator, "f1")
+    assert len(evaluator._event_handlers[Events.ITERATION_COMPLETED]) == 2
+
+    y_pred = torch.randint(0, 2, size=(15, 10)).float()
+    y = torch.randint(0, 2, size=(15, 10)).long()
+    evaluator.run(list(zip(y_pred, y)))
+    assert CountingPrecision.num_computes == 1
+
+    np_y_pred, np_y = y_pred.numpy().ravel(), y.numpy().ravel()
+    assert F1.compute() == approx(f1_score(np_y, np_y_pred))
+    assert CountingPrecision.num_computes == 2
@@ -0,0 +1,67 @@
+import numpy as np
+import torch
+
+from ignite.engine import Engine, Events
+from ignite.exceptions import NotComputableError
+from ignite.metrics import Accuracy, EpochMetric, Precision, SlidingWindow
+
+import pytest
+
+
+def test_wrong_input_args():
+    with pytest.raises(TypeError):
+        SlidingWindow(src=[12, 34])
+
+    with pytest.raises(ValueError):
+        SlidingWindow(output_transform=lambda x: x, window_size=0)
+
+    with pytest.raises(ValueError):
+        SlidingWindow(Accuracy(), output_transform=lambda x: x[0])
+
+    with pytest.raises(ValueError):
+        SlidingWindow()
+
+    with pytest.raises(ValueError):
+        SlidingWindow(EpochMetric(lambda y_pred, y: 0))
+
+    with pytest.raises(ValueError):
+        SlidingWindow(Precision(average=False, is_multilabel=True))
+
+    with pytest.raises(NotComputableError):
+        SlidingWindow(output_transform=lambda x: x).compute()
+
+
+@pytest.mark.parametrize("window_size", [1, 7, 30])
+def test_integration(window_size):
+    n_iters = 25
+    batch_size = 10
+    n_classes = 4
+    y_true = np.random.randint(0, n_classes, size=(n_iters, batch_size))
+    y_pred = np.random.rand(n_iters, batch_size, n_classes)
+    loss_values = np.random.rand(n_iters)
+
+    def update_fn(engine, i):
+        return loss_values[i], torch.from_numpy(y_pred[i]), torch.from_numpy(y_true[i])
+
+    trainer = Engine(update_fn)
+
+    SlidingWindow(Accuracy(output_transform=lambda x: [x[1], x[2]]), window_size=window_size) \
+        .attach(trainer, 'accuracy')
+    SlidingWindow(Precision(output_transform=lambda x: [x[1], x[2]], average=True), window_size=window_size) \
+        .attach(trainer, 'precision')
+    SlidingWindow(output_transform=lambda x: x[0], window_size=window_size).attach(trainer, 'loss')
+
+    @trainer.on(Events.ITERATION_COMPLETED)
+    def check_values(engine):
+        i = engine.state.iteration - (engine.state.epoch - 1) * n_iters
+        window = slice(max(0, i - window_size), i)
+        indices = y_pred[window].argmax(axis=-1)
+        assert engine.state.metrics['accuracy'] == pytest.approx((indices == y_true[window]).mean())
+        assert engine.state.metrics['loss'] == pytest.approx(loss_values[window].mean())
+
+        true_positives = np.array([((indices == c) & (y_true[window] == c)).sum() for c in range(n_classes)])
+        positives = np.array([(indices == c).sum() for c in range(n_classes)])
+        expected_precision = (true_positives / (positives + 1e-20)).mean()
+        assert engine.state.metrics['precision'] == pytest.approx(expected_precision)
+
+    trainer.run(list(range(n_iters)), max_epochs=2)
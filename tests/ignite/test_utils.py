@@ -1,6 +1,8 @@
+from collections import namedtuple
+
 import pytest
 import torch
-from ignite.utils import convert_tensor, to_onehot
+from ignite.utils import convert_tensor, to_onehot, BatchConverter
 
 
 def test_convert_tensor():
@@ -34,6 +36,69 @@ def test_convert_tensor():
         convert_tensor(12345)
 
 
+def test_batch_converter():
+    Batch = namedtuple("Batch", ["x", "y"])
+
+    converter = BatchConverter(device="cpu")
+    batch = {"a": (torch.tensor([0.0]), [torch.tensor([1]), "s"]), "b": Batch(torch.tensor([2.0]), 3)}
+    for _ in range(2):
+        output = converter(batch)
+        assert isinstance(output, dict)
+        assert isinstance(output["a"], tuple)
+        assert isinstance(output["a"][1], list)
+        assert output["a"][1][1] == "s"
+        assert isinstance(output["b"], Batch)
+        assert output["b"].y == 3
+        assert torch.equal(output["b"].x, batch["b"].x)
+
+    # structure changes
+    output = converter([torch.tensor([0.0]), torch.tensor([1.0])])
+    assert isinstance(output, list) and torch.equal(output[1], torch.tensor([1.0]))
+    output = converter([torch.tensor([0.0]), 12])
+    assert output[1] == 12
+    output = converter({"a": torch.tensor([0.0])})
+    assert torch.equal(output["a"], torch.tensor([0.0]))
+    output = converter({"b": torch.tensor([1.0])})
+    assert torch.equal(output["b"], torch.tensor([1.0]))
+
+    # no device
+    batch = (torch.tensor([0.0]), torch.tensor([1.0]))
+    assert BatchConverter()(batch) is batch
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="Skip if no GPU")
+def test_batch_converter_cuda():
+    converter = BatchConverter(device="cuda", pin_memory=True)
+    batch = (torch.rand(4, 3), {"y": torch.randint(0, 10, size=(4,)), "z": torch.rand(2)})
+    output = converter(batch)
+    assert output[0].is_cuda and output[1]["y"].is_cuda
+    assert torch.equal(output[0].cpu(), batch[0])
+    assert torch.equal(output[1]["y"].cpu(), batch[1]["y"])
+    assert torch.equal(output[1]["z"].cpu(), batch[1]["z"])
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="Skip if no GPU")
+@pytest.mark.parametrize("pin_memory", [False, True])
+def test_batch_converter_cuda_round_trip(pin_memory):
+    converter = BatchConverter(device="cuda", non_blocking=True, pin_memory=pin_memory)
+    batches = [(torch.rand(8, 3, 5), torch.randint(0, 10, size=(8,)), torch.rand(8, 2).double(),
+                torch.rand(7).pin_memory(), torch.randint(0, 10, size=(8, 4))) for _ in range(3)]
+    # Smaller batch reuses the pinned buffers, larger batch grows them
+    batches += [tuple(t[:2] for t in batches[0]), tuple(torch.cat([t, t]) for t in batches[1])]
+
+    outputs = [converter(batch) for batch in batches]
+    if pin_memory:
+        assert set(converter._pinned_buffers) == {torch.float32, torch.float64, torch.int64}
+    else:
+        assert len(converter._pinned_buffers) == 0
+
+    for batch, output in zip(batches, outputs):
+        for t, o in zip(batch, output):
+            assert o.is_cuda
+            assert o.shape == t.shape and o.dtype == t.dtype
+            assert torch.equal(o.cpu(), t)
+
+
 def test_to_onehot():
     indices = torch.tensor([0, 1, 2, 3], dtype=torch.long)
     actual = to_onehot(indices, 4)